@@ -8,6 +8,7 @@ from model_lib import Event
 from zero_3rdparty.enum_utils import StrEnum
 
 from pkg_ext._internal.changelog.actions import AdditionalChangeAction, BreakingChangeAction
+from pkg_ext._internal.errors import ApiDumpEngineMismatchError
 from pkg_ext._internal.models.api_dump import (
     ClassDump,
     ClassFieldInfo,
@@ -460,6 +461,8 @@ def compare_group(baseline: GroupDump, dev: GroupDump) -> list[DiffResult]:
 def compare_api_dumps(baseline: PublicApiDump | None, dev: PublicApiDump) -> list[DiffResult]:
     if baseline is None:
         return []  # First release, no comparison
+    if baseline.engine != dev.engine:  # the static engine differs in documented ways, e.g. non-literal defaults
+        raise ApiDumpEngineMismatchError(baseline.engine, dev.engine)
     results: list[DiffResult] = []
     base_groups = {g.name: g for g in baseline.groups}
     dev_groups = {g.name: g for g in dev.groups}
@@ -187,17 +187,21 @@ def dump_symbol(ref: RefSymbol, pkg_import_name: str) -> SymbolDump | None:
     return None
 
 
+SymbolDumper = Callable[[RefSymbol, str], SymbolDump | None]
+
+
 def dump_group(
     group: PublicGroup,
     refs: dict[str, RefSymbol],
     pkg_import_name: str,
+    symbol_dumper: SymbolDumper = dump_symbol,
 ) -> GroupDump:
     symbols: list[SymbolDump] = []
     for ref_id in sorted(group.owned_refs):
         ref = refs.get(ref_id)
         if ref is None:
             continue
-        if symbol_dump := dump_symbol(ref, pkg_import_name):
+        if symbol_dump := symbol_dumper(ref, pkg_import_name):
             symbols.append(symbol_dump)
     return GroupDump(name=group.name, symbols=symbols)
 
@@ -207,14 +211,20 @@ def dump_public_api(
     refs: dict[str, RefSymbol],
     pkg_import_name: str,
     version: str,
+    symbol_dumper: SymbolDumper = dump_symbol,
+    engine: str | None = None,
 ) -> PublicApiDump:
-    group_dumps = [dump_group(group, refs, pkg_import_name) for group in groups.groups if not group.is_root]
+    """`symbol_dumper` is `dump_symbol` (imports the package) or a `StaticSymbolDumper` (AST only)."""
+    group_dumps = [
+        dump_group(group, refs, pkg_import_name, symbol_dumper) for group in groups.groups if not group.is_root
+    ]
     root_group = groups.root_group
     if root_group.owned_refs:
-        group_dumps.insert(0, dump_group(root_group, refs, pkg_import_name))
+        group_dumps.insert(0, dump_group(root_group, refs, pkg_import_name, symbol_dumper))
     return PublicApiDump(
         pkg_import_name=pkg_import_name,
         version=version,
         groups=group_dumps,
         dumped_at=datetime.now(UTC),
+        engine=engine,
     )
@@ -0,0 +1,903 @@
+"""AST only engine for `dump-api --static`, builds the same `PublicApiDump` without importing the package.
+
+Modules are read from the package directory and names are resolved through their imports, imports within the
+package are followed to the definition. Only stdlib modules are imported (for `typing` constructs and the MRO of
+stdlib bases), so `Optional[X]`, `List[X]` or `class Color(StrEnum)` are dumped exactly like the runtime dump does.
+
+Where the static dump can differ from the runtime one:
+- `type_imports` use the module a name is imported from, the runtime dump uses `__module__` of the type
+  (`pydantic.BaseModel` vs `pydantic.main.BaseModel`).
+- Defaults that are not literals, also behind a constant, are the source text (`Path('x')` vs `PosixPath('x')`,
+  `Color.RED` vs `<Color.RED: 'red'>`, also inside `Literal[...]`), CLI defaults from a `default_factory` are the
+  call source text.
+- Field annotations of pydantic models are the source annotation, the runtime dump uses the annotation pydantic
+  keeps after moving `Annotated` metadata to the field (`DirectoryPath` vs `Path`).
+- Classes imported from third party packages are opaque: their bases are not part of `mro_bases`, their fields
+  are not inherited and their `__init__` counts as `object.__init__`.
+- Pydantic models are recognized by a base imported from `pydantic`, `pydantic_settings` or `model_lib`, or a base
+  in the package that is one. `env_vars` of settings fields use the literal `env_prefix`/`case_sensitive` of a
+  `model_config` in the class or its bases in the package and string aliases, `env_nested_delimiter` is ignored.
+- Type alias targets are the source text without a docstring, the runtime dump uses `str(alias)` and the
+  docstring of the alias object. Their line number is the assignment, the runtime dump has none for most aliases.
+- Symbols assigned at runtime (`setattr`, star imports, `if TYPE_CHECKING` branches) are not found and skipped.
+"""
+
+from __future__ import annotations
+
+import ast
+import builtins
+import importlib
+import logging
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, get_origin
+
+from pkg_ext._internal.models.api_dump import (
+    CallableSignature,
+    ClassDump,
+    ClassFieldInfo,
+    CLICommandDump,
+    CLIParamInfo,
+    ExceptionDump,
+    FuncParamInfo,
+    FunctionDump,
+    GlobalVarDump,
+    ParamDefault,
+    ParamKind,
+    SymbolDump,
+    TypeAliasDump,
+)
+from pkg_ext._internal.models.py_symbols import RefSymbol, SymbolType
+from pkg_ext._internal.signature_parser import (
+    _MRO_FILTER,
+    CLI_CONTEXT_TYPE_NAMES,
+    _annotation_str,
+    _collect_all_annotation_imports,
+    _normalize_module,
+    parse_signature,
+    stable_repr,
+)
+
+logger = logging.getLogger(__name__)
+_TYPING_MODULES = frozenset({"typing", "typing_extensions", "collections.abc"})
+_PYDANTIC_MODULE_ROOTS = frozenset({"pydantic", "pydantic_settings", "model_lib"})
+_DATACLASS_MODULES = frozenset({"dataclasses", "pydantic.dataclasses"})
+_ENUM_BASES = frozenset({"Enum", "StrEnum", "IntEnum", "Flag", "IntFlag"})
+_NOT_FIELDS = frozenset({"ClassVar", "InitVar"})
+_MAX_DEPTH = 10
+FuncNode = ast.FunctionDef | ast.AsyncFunctionDef
+
+
+@dataclass(frozen=True)
+class External:
+    """A name imported from outside the package, `attr` is empty for a module."""
+
+    module: str
+    attr: str = ""
+
+    @property
+    def root(self) -> str:
+        return self.module.split(".")[0]
+
+    @property
+    def is_typing(self) -> bool:
+        return self.module in _TYPING_MODULES and bool(self.attr)
+
+    def stdlib_object(self) -> Any | None:
+        """The runtime object for stdlib names, third party modules are never imported."""
+        if not self.attr or (self.root not in sys.stdlib_module_names and self.module != "builtins"):
+            return None
+        try:
+            return getattr(importlib.import_module(self.module), self.attr, None)
+        except ImportError:
+            return None
+
+
+@dataclass
+class StaticModule:
+    import_name: str
+    definitions: dict[str, ast.stmt] = field(default_factory=dict)
+    imports: dict[str, External] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Local:
+    module: StaticModule
+    node: ast.stmt
+    name: str
+
+    @property
+    def import_path(self) -> str:
+        return f"{_normalize_module(self.module.import_name)}.{self.name}"
+
+    @property
+    def class_node(self) -> ast.ClassDef | None:
+        return self.node if isinstance(self.node, ast.ClassDef) else None
+
+
+Resolved = Local | External | None
+
+
+def _call_name(node: ast.expr) -> str:
+    """Last name of a decorator or call target, `dataclasses.field(...)` -> `field`."""
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return node.id if isinstance(node, ast.Name) else ""
+
+
+def _first_line(node: ast.stmt) -> int:
+    """The first decorator line, same as `inspect.getsourcelines`."""
+    decorators = getattr(node, "decorator_list", [])
+    return min([node.lineno, *(decorator.lineno for decorator in decorators)])
+
+
+def _compiled_docstring(node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> str:
+    """`__doc__` as the compiler stores it: the first line and the common indentation of the rest are stripped."""
+    raw = ast.get_docstring(node, clean=False)
+    if raw is None:
+        return ""
+    first, *rest = raw.split("\n")
+    margin = min((len(line) - len(line.lstrip()) for line in rest if line.strip()), default=0)
+    return "\n".join([first.lstrip(), *(line[margin:] if line.strip() else "" for line in rest)])
+
+
+def _literal(node: ast.expr | None) -> Any:
+    if node is None:
+        return None
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+
+def _is_literal(node: ast.expr) -> bool:
+    try:
+        ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return False
+    return True
+
+
+def _literal_repr(node: ast.expr) -> str:
+    return stable_repr(ast.literal_eval(node)) if _is_literal(node) else ast.unparse(node)
+
+
+def _literal_text(node: ast.expr) -> str:
+    """`str()` of a `Literal[...]` arg, the runtime dump formats those with `str`."""
+    return str(ast.literal_eval(node)) if _is_literal(node) else ast.unparse(node)
+
+
+def _keyword(call: ast.Call, name: str) -> ast.expr | None:
+    return next((kw.value for kw in call.keywords if kw.arg == name), None)
+
+
+def _first_arg_or(call: ast.Call, name: str) -> ast.expr | None:
+    """`Field(default)`, `Field(default=default)` and `typer.Option(default)` style defaults."""
+    return _keyword(call, name) or (call.args[0] if call.args else None)
+
+
+def _is_ellipsis(node: ast.expr | None) -> bool:
+    return isinstance(node, ast.Constant) and node.value is Ellipsis
+
+
+def _subscript_args(node: ast.Subscript) -> list[ast.expr]:
+    return list(node.slice.elts) if isinstance(node.slice, ast.Tuple) else [node.slice]
+
+
+def _parse_forward_ref(node: ast.expr) -> ast.expr | None:
+    """String annotations are parsed, None when the string isn't an expression."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        try:
+            return ast.parse(node.value, mode="eval").body
+        except SyntaxError:
+            return None
+    return node
+
+
+def _add_imports(module: StaticModule, stmt: ast.Import | ast.ImportFrom, package_parts: list[str]) -> None:
+    if isinstance(stmt, ast.Import):
+        for alias in stmt.names:
+            name = alias.asname or alias.name.split(".")[0]
+            module.imports[name] = External(alias.name if alias.asname else name)
+        return
+    base = stmt.module or ""
+    if stmt.level:
+        parent = package_parts[: len(package_parts) - stmt.level + 1]
+        base = ".".join([*parent, base] if base else parent)
+    for alias in stmt.names:
+        if alias.name != "*":
+            module.imports[alias.asname or alias.name] = External(base, alias.name)
+
+
+def _index_module(import_name: str, tree: ast.Module, is_package: bool) -> StaticModule:
+    """Top level definitions and imports, a later statement for the same name wins like at runtime."""
+    module = StaticModule(import_name=import_name)
+    package_parts = import_name.split(".") if is_package else import_name.split(".")[:-1]
+    for stmt in tree.body:
+        match stmt:
+            case ast.FunctionDef() | ast.AsyncFunctionDef() | ast.ClassDef():
+                module.definitions[stmt.name] = stmt
+            case ast.Assign(targets=[ast.Name(id=name)]):
+                module.definitions[name] = stmt
+            case ast.AnnAssign(target=ast.Name(id=name), value=value) if value is not None:
+                module.definitions[name] = stmt
+            case ast.Import() | ast.ImportFrom():
+                _add_imports(module, stmt, package_parts)
+    return module
+
+
+@dataclass
+class StaticSymbolDumper:
+    """Drop-in for `api_dumper.dump_symbol`, parsed modules are kept for the whole dump."""
+
+    pkg_dir: Path
+    _modules: dict[str, StaticModule | None] = field(default_factory=dict, init=False, repr=False)
+
+    def __call__(self, ref: RefSymbol, pkg_import_name: str) -> SymbolDump | None:
+        module = self.module(f"{pkg_import_name}.{ref.module_path}")
+        resolved = self._resolve_name(module, ref.name) if module else None
+        if not isinstance(resolved, Local):
+            return None
+        node, module = resolved.node, resolved.module
+        match ref.type:
+            case SymbolType.FUNCTION if isinstance(node, FuncNode):
+                return self.dump_function(module, node, ref)
+            case SymbolType.CLASS if isinstance(node, ast.ClassDef):
+                return self.dump_class(module, node, ref)
+            case SymbolType.EXCEPTION if isinstance(node, ast.ClassDef):
+                return self.dump_exception(module, node, ref)
+            case SymbolType.TYPE_ALIAS if isinstance(node, ast.Assign | ast.AnnAssign):
+                return self.dump_type_alias(module, node, ref)
+            case SymbolType.GLOBAL_VAR if isinstance(node, ast.Assign | ast.AnnAssign):
+                return self.dump_global_var(module, node, ref)
+        return None
+
+    # --- modules and name resolution ---
+
+    def _source_path(self, import_name: str) -> Path | None:
+        pkg_name, _, rest = import_name.partition(".")
+        if pkg_name != self.pkg_dir.name:
+            return None
+        if not rest:
+            candidates = [self.pkg_dir / "__init__.py"]
+        else:
+            base = self.pkg_dir.joinpath(*rest.split("."))
+            candidates = [base.with_name(f"{base.name}.py"), base / "__init__.py"]
+        return next((path for path in candidates if path.is_file()), None)
+
+    def module(self, import_name: str) -> StaticModule | None:
+        if import_name in self._modules:
+            return self._modules[import_name]
+        module: StaticModule | None = None
+        if path := self._source_path(import_name):
+            try:
+                tree = ast.parse(path.read_text(), filename=str(path))
+            except (OSError, SyntaxError) as e:
+                logger.warning(f"static api dump: unable to parse {path}: {e!r}")
+            else:
+                module = _index_module(import_name, tree, is_package=path.name == "__init__.py")
+        self._modules[import_name] = module
+        return module
+
+    def _resolve_name(self, module: StaticModule, name: str, depth: int = 0) -> Resolved:
+        if node := module.definitions.get(name):
+            return Local(module, node, name)
+        if imported := module.imports.get(name):
+            return self._follow(imported, depth)
+        return External("builtins", name) if hasattr(builtins, name) else None
+
+    def _follow(self, imported: External, depth: int) -> Resolved:
+        """Imports from within the package are followed to the definition."""
+        if not imported.attr or depth > _MAX_DEPTH or self._source_path(imported.module) is None:
+            return imported
+        submodule = f"{imported.module}.{imported.attr}"
+        if self._source_path(submodule):
+            return External(submodule)
+        if target := self.module(imported.module):
+            return self._resolve_name(target, imported.attr, depth + 1) or imported
+        return imported
+
+    def resolve(self, module: StaticModule, node: ast.expr) -> Resolved:
+        if isinstance(node, ast.Name):
+            return self._resolve_name(module, node.id)
+        if isinstance(node, ast.Attribute) and isinstance(owner := self.resolve(module, node.value), External):
+            owner_module = f"{owner.module}.{owner.attr}" if owner.attr else owner.module
+            return self._follow(External(owner_module, node.attr), 0)
+        return None
+
+    def _typing_name(self, module: StaticModule, node: ast.expr) -> str:
+        resolved = self.resolve(module, node)
+        return resolved.attr if isinstance(resolved, External) and resolved.is_typing else ""
+
+    def _resolve_class(self, module: StaticModule, node: ast.expr) -> Local | None:
+        resolved = self.resolve(module, node.value if isinstance(node, ast.Subscript) else node)
+        return resolved if isinstance(resolved, Local) and resolved.class_node else None
+
+    def _is_typevar(self, module: StaticModule, value: ast.expr | None) -> bool:
+        return isinstance(value, ast.Call) and self._typing_name(module, value.func) == "TypeVar"
+
+    # --- annotations ---
+
+    def _union_members(self, module: StaticModule, node: ast.expr) -> list[ast.expr]:
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+            return self._union_members(module, node.left) + self._union_members(module, node.right)
+        if isinstance(node, ast.Subscript):
+            typing_name = self._typing_name(module, node.value)
+            if typing_name == "Union":
+                return [member for arg in _subscript_args(node) for member in self._union_members(module, arg)]
+            if typing_name == "Optional":
+                return [*self._union_members(module, node.slice), ast.Constant(None)]
+        return [node]
+
+    def annotation_str(self, module: StaticModule, node: ast.expr | None, depth: int = 0) -> str | None:
+        """Same text as `signature_parser._annotation_str` gives for the evaluated annotation."""
+        if node is None or depth > _MAX_DEPTH:
+            return None
+        if (parsed := _parse_forward_ref(node)) is None:
+            return str(node.value)  # type: ignore[attr-defined]
+        if (members := self._union_members(module, parsed)) != [parsed]:
+            parts = [self.annotation_str(module, member, depth + 1) for member in members]
+            return " | ".join(part for part in parts if part)
+        match parsed:
+            case ast.Constant(value=value):
+                return str(value)
+            case ast.List(elts=elts):
+                parts = [self.annotation_str(module, elt, depth + 1) for elt in elts]
+                return f"[{', '.join(part for part in parts if part)}]"
+            case ast.Subscript():
+                return self._generic_str(module, parsed, depth)
+            case ast.Name() | ast.Attribute():
+                return self._name_str(module, parsed, depth)
+        return ast.unparse(parsed)
+
+    def _generic_str(self, module: StaticModule, node: ast.Subscript, depth: int) -> str | None:
+        args = _subscript_args(node)
+        resolved = self.resolve(module, node.value)
+        if isinstance(resolved, External) and resolved.is_typing:
+            if resolved.attr == "Annotated":  # stripped by `get_type_hints`
+                return self.annotation_str(module, args[0], depth + 1)
+            if resolved.attr == "Literal":
+                return f"Literal[{', '.join(_literal_text(arg) for arg in args)}]"
+            typing_obj = resolved.stdlib_object()
+            origin = get_origin(typing_obj) or typing_obj
+            origin_name = getattr(origin, "__name__", resolved.attr)
+        else:
+            origin_name = self._name_str(module, node.value, depth) or ast.unparse(node.value)
+        parts = [self.annotation_str(module, arg, depth + 1) for arg in args]
+        return f"{origin_name}[{', '.join(part for part in parts if part)}]"
+
+    def _name_str(self, module: StaticModule, node: ast.expr, depth: int) -> str | None:
+        match resolved := self.resolve(module, node):
+            case External() if resolved.is_typing and (typing_obj := resolved.stdlib_object()) is not None:
+                return _annotation_str(typing_obj)
+            case Local(node=ast.Assign() | ast.AnnAssign() as assign):
+                if self._is_typevar(resolved.module, assign.value):
+                    return f"~{resolved.name}"
+                return self.annotation_str(resolved.module, assign.value, depth + 1)  # aliases are expanded
+            case Local():
+                return resolved.name
+        return node.attr if isinstance(node, ast.Attribute) else ast.unparse(node)
+
+    def annotation_imports(self, module: StaticModule, node: ast.expr | None, depth: int = 0) -> list[str]:
+        """Same paths as `signature_parser._collect_all_annotation_imports`, see the module docstring."""
+        if node is None or depth > _MAX_DEPTH or (parsed := _parse_forward_ref(node)) is None:
+            return []
+        match parsed:
+            case ast.BinOp(op=ast.BitOr(), left=left, right=right):
+                return self.annotation_imports(module, left, depth + 1) + self.annotation_imports(
+                    module, right, depth + 1
+                )
+            case ast.Subscript():
+                args = _subscript_args(parsed)
+                typing_name = self._typing_name(module, parsed.value)
+                if typing_name == "Literal":
+                    return []
+                if typing_name == "Annotated":
+                    args = args[:1]
+                return [path for arg in args for path in self.annotation_imports(module, arg, depth + 1)]
+            case ast.Name() | ast.Attribute():
+                return self._name_imports(module, parsed, depth)
+        return []  # e.g. the parameter list of `Callable[[A], R]`, skipped by the runtime dump too
+
+    def _name_imports(self, module: StaticModule, node: ast.expr, depth: int) -> list[str]:
+        match resolved := self.resolve(module, node):
+            case External(module="builtins"):
+                return []
+            case External() if resolved.is_typing:
+                typing_obj = resolved.stdlib_object()
+                return _collect_all_annotation_imports(typing_obj) if typing_obj is not None else []
+            case External(attr=attr) if attr:
+                return [f"{_normalize_module(resolved.module)}.{attr}"]
+            case Local(node=ast.ClassDef()):
+                return [resolved.import_path]
+            case Local(node=ast.Assign() | ast.AnnAssign() as assign):
+                if self._is_typevar(resolved.module, assign.value):
+                    return []
+                return self.annotation_imports(resolved.module, assign.value, depth + 1)
+        return []
+
+    # --- signatures ---
+
+    def _is_pydantic_field_call(self, module: StaticModule, node: ast.expr | None) -> bool:
+        if not isinstance(node, ast.Call):
+            return False
+        resolved = self.resolve(module, node.func)
+        return isinstance(resolved, External) and resolved.root == "pydantic" and resolved.attr == "Field"
+
+    def _class_attribute(self, module: StaticModule, node: ast.Attribute) -> tuple[StaticModule, ast.expr] | None:
+        """`Cls.NAME` assigned in the class body, enum members are left alone, their repr isn't the value."""
+        owner = self._resolve_class(module, node.value)
+        if owner is None or owner.class_node is None:
+            return None
+        if _ENUM_BASES.intersection(self.mro(owner.module, owner.class_node)):
+            return None
+        for stmt in reversed(owner.class_node.body):
+            match stmt:
+                case ast.Assign(targets=[ast.Name(id=name)], value=value) if name == node.attr:
+                    return owner.module, value
+                case ast.AnnAssign(target=ast.Name(id=name), value=value) if name == node.attr and value:
+                    return owner.module, value
+        return None
+
+    def assigned_value(self, module: StaticModule, node: ast.expr, depth: int = 0) -> tuple[StaticModule, ast.expr]:
+        """Follows names of module and class level assignments to the assigned expression."""
+        if depth > _MAX_DEPTH or not isinstance(node, ast.Name | ast.Attribute):
+            return module, node
+        match self.resolve(module, node):
+            case Local(node=ast.Assign() | ast.AnnAssign() as assign) as resolved if assign.value is not None:
+                return self.assigned_value(resolved.module, assign.value, depth + 1)
+            case None if isinstance(node, ast.Attribute) and (found := self._class_attribute(module, node)):
+                return self.assigned_value(*found, depth + 1)
+        return module, node
+
+    def value_repr(self, module: StaticModule, node: ast.expr) -> str:
+        """`stable_repr` of the value when it is a literal (also behind a constant), the source text otherwise."""
+        value_module, value = self.assigned_value(module, node)
+        if typer_kind := self._typer_kind(value_module, value):
+            return f"<typer.models.{typer_kind}Info object>"
+        return _literal_repr(value) if _is_literal(value) else ast.unparse(node)
+
+    def _param_default(self, module: StaticModule, node: ast.expr | None) -> ParamDefault | None:
+        if node is None:
+            return None
+        call_module, call = self.assigned_value(module, node)
+        if isinstance(call, ast.Call) and self._is_pydantic_field_call(call_module, call):
+            if _keyword(call, "default_factory") is not None:
+                return ParamDefault(value_repr="...", is_factory=True)
+            default = _first_arg_or(call, "default")
+            if default is None or _is_ellipsis(default):
+                return ParamDefault(value_repr="PydanticUndefined")
+            return ParamDefault(value_repr=self.value_repr(call_module, default))
+        return ParamDefault(value_repr=self.value_repr(module, node))
+
+    def _iter_args(self, node: FuncNode) -> list[tuple[ast.arg, ParamKind, ast.expr | None]]:
+        args = node.args
+        positional = [*args.posonlyargs, *args.args]
+        defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+        result: list[tuple[ast.arg, ParamKind, ast.expr | None]] = [
+            (arg, ParamKind.POSITIONAL_ONLY if i < len(args.posonlyargs) else ParamKind.POSITIONAL_OR_KEYWORD, default)
+            for i, (arg, default) in enumerate(zip(positional, defaults))
+        ]
+        if args.vararg:
+            result.append((args.vararg, ParamKind.VAR_POSITIONAL, None))
+        result.extend((arg, ParamKind.KEYWORD_ONLY, default) for arg, default in zip(args.kwonlyargs, args.kw_defaults))
+        if args.kwarg:
+            result.append((args.kwarg, ParamKind.VAR_KEYWORD, None))
+        return result
+
+    def signature(self, module: StaticModule, node: FuncNode) -> CallableSignature:
+        params = [
+            FuncParamInfo(
+                name=arg.arg,
+                kind=kind,
+                type_annotation=self.annotation_str(module, arg.annotation),
+                type_imports=self.annotation_imports(module, arg.annotation),
+                default=self._param_default(module, default),
+            )
+            for arg, kind, default in self._iter_args(node)
+        ]
+        return CallableSignature(
+            parameters=params,
+            return_annotation=self.annotation_str(module, node.returns),
+            return_type_imports=self.annotation_imports(module, node.returns),
+        )
+
+    # --- functions and CLI commands ---
+
+    def _typer_kind(self, module: StaticModule, node: ast.expr) -> str:
+        """`Option` or `Argument` for a `typer.Option(...)`/`typer.Argument(...)` call."""
+        if not isinstance(node, ast.Call):
+            return ""
+        resolved = self.resolve(module, node.func)
+        if isinstance(resolved, External) and resolved.root == "typer" and resolved.attr in {"Option", "Argument"}:
+            return resolved.attr
+        return ""
+
+    def _typer_info(self, module: StaticModule, default: ast.expr | None) -> tuple[StaticModule, ast.Call, str] | None:
+        """The `typer.Option(...)` call of a default, also when it is a shared module level option."""
+        if default is None:
+            return None
+        info_module, info = self.assigned_value(module, default)
+        if isinstance(info, ast.Call) and (kind := self._typer_kind(info_module, info)):
+            return info_module, info, kind
+        return None
+
+    def _is_cli_command(self, module: StaticModule, node: FuncNode) -> bool:
+        return any(
+            self._typer_info(module, default) or self.annotation_str(module, arg.annotation) in CLI_CONTEXT_TYPE_NAMES
+            for arg, _, default in self._iter_args(node)
+        )
+
+    def _enum_choices(self, enum_cls: Local) -> list[str] | None:
+        class_node = enum_cls.class_node
+        assert class_node is not None
+        mro = self.mro(enum_cls.module, class_node)
+        if not _ENUM_BASES.intersection(mro):
+            return None
+        is_str_enum = "StrEnum" in mro
+        choices = []
+        for stmt in class_node.body:
+            if not isinstance(stmt, ast.Assign) or not isinstance(target := stmt.targets[0], ast.Name):
+                continue
+            if target.id.startswith("_"):
+                continue
+            if not is_str_enum:
+                choices.append(target.id)
+            elif _call_name(stmt.value) == "auto":
+                choices.append(target.id.lower())
+            else:
+                choices.append(_literal_text(stmt.value))
+        return choices
+
+    def _choices(self, module: StaticModule, annotation: ast.expr | None) -> list[str] | None:
+        if annotation is None or (annotation := _parse_forward_ref(annotation)) is None:
+            return None
+        if isinstance(annotation, ast.Subscript) and self._typing_name(module, annotation.value) == "Literal":
+            return [_literal_text(arg) for arg in _subscript_args(annotation)]
+        if enum_cls := self._resolve_class(module, annotation):
+            return self._enum_choices(enum_cls)
+        return None
+
+    def _cli_param(
+        self, module: StaticModule, arg: ast.arg, typer_info: tuple[StaticModule, ast.Call, str]
+    ) -> CLIParamInfo:
+        info_module, info, kind = typer_info
+        default = _first_arg_or(info, "default")
+        factory = _keyword(info, "default_factory")
+        required = (default is None or _is_ellipsis(default)) and factory is None
+        default_repr = None
+        if factory is not None:
+            default_repr = f"{ast.unparse(factory)}()"
+        elif not required and default is not None:
+            default_repr = self.value_repr(info_module, default)
+        is_arg = kind == "Argument"
+        param_decls = [_literal_text(decl) for decl in info.args[1:]]
+        envvar = _literal(_keyword(info, "envvar"))
+        if isinstance(envvar, list):
+            envvar = envvar[0] if envvar else None
+        return CLIParamInfo(
+            param_name=arg.arg,
+            type_annotation=self.annotation_str(module, arg.annotation),
+            flags=[] if is_arg else param_decls or [f"--{arg.arg.replace('_', '-')}"],
+            help=_literal(_keyword(info, "help")),
+            default_repr=default_repr,
+            required=required,
+            envvar=envvar,
+            is_argument=is_arg,
+            hidden=bool(_literal(_keyword(info, "hidden"))),
+            choices=self._choices(module, arg.annotation),
+        )
+
+    def dump_function(self, module: StaticModule, node: FuncNode, ref: RefSymbol) -> FunctionDump | CLICommandDump:
+        base = {
+            "name": ref.name,
+            "module_path": ref.module_path,
+            "docstring": _compiled_docstring(node),
+            "signature": self.signature(module, node),
+            "line_number": _first_line(node),
+        }
+        if not self._is_cli_command(module, node):
+            return FunctionDump(**base)
+        cli_params = [
+            self._cli_param(module, arg, typer_info)
+            for arg, _, default in self._iter_args(node)
+            if (typer_info := self._typer_info(module, default))
+        ]
+        return CLICommandDump(**base, cli_params=cli_params)
+
+    # --- classes ---
+
+    def _local_bases(self, module: StaticModule, node: ast.ClassDef) -> list[Local]:
+        return [base_cls for base in node.bases if (base_cls := self._resolve_class(module, base))]
+
+    def _linearize(self, module: StaticModule, base: ast.expr, depth: int) -> list[str]:
+        if isinstance(base, ast.Subscript):
+            base = base.value
+        match resolved := self.resolve(module, base):
+            case Local(node=ast.ClassDef() as class_node) if depth < _MAX_DEPTH:
+                return [class_node.name, *self._c3(resolved.module, class_node, depth + 1)]
+            case External() if isinstance(cls := resolved.stdlib_object(), type):
+                return [mro_cls.__name__ for mro_cls in cls.__mro__]
+        return [base.attr if isinstance(base, ast.Attribute) else ast.unparse(base)]
+
+    def _c3(self, module: StaticModule, node: ast.ClassDef, depth: int = 0) -> list[str]:
+        """C3 linearization of the class names, without the class itself."""
+        sequences = [self._linearize(module, base, depth) for base in node.bases]
+        sequences.append([seq[0] for seq in sequences])
+        merged: list[str] = []
+        while sequences := [seq for seq in sequences if seq]:
+            head = next(
+                (seq[0] for seq in sequences if not any(seq[0] in other[1:] for other in sequences)),
+                sequences[0][0],  # inconsistent hierarchy, Python would raise, keep the first seen order
+            )
+            merged.append(head)
+            sequences = [[name for name in seq if name != head] for seq in sequences]
+        return merged
+
+    def mro(self, module: StaticModule, node: ast.ClassDef) -> list[str]:
+        return [name for name in self._c3(module, node) if name not in _MRO_FILTER]
+
+    def _mro_bases(self, module: StaticModule, node: ast.ClassDef) -> tuple[list[str], int]:
+        num_direct = sum(1 for base in node.bases if not (isinstance(base, ast.Name) and base.id == "object"))
+        return self.mro(module, node), num_direct
+
+    def _is_dataclass(self, module: StaticModule, node: ast.ClassDef) -> bool:
+        for decorator in node.decorator_list:
+            resolved = self.resolve(module, decorator.func if isinstance(decorator, ast.Call) else decorator)
+            if (
+                isinstance(resolved, External)
+                and resolved.module in _DATACLASS_MODULES
+                and resolved.attr == "dataclass"
+            ):
+                return True
+        return False
+
+    def _is_pydantic(self, module: StaticModule, node: ast.ClassDef, depth: int = 0) -> bool:
+        for base in node.bases:
+            resolved = self.resolve(module, base.value if isinstance(base, ast.Subscript) else base)
+            if isinstance(resolved, External) and resolved.root in _PYDANTIC_MODULE_ROOTS:
+                return True
+            base_node = resolved.class_node if isinstance(resolved, Local) else None
+            if base_node and depth < _MAX_DEPTH and self._is_pydantic(resolved.module, base_node, depth + 1):  # type: ignore[union-attr]
+                return True
+        return False
+
+    def _is_settings(self, module: StaticModule, node: ast.ClassDef, depth: int = 0) -> bool:
+        for base in node.bases:
+            resolved = self.resolve(module, base)
+            if (
+                isinstance(resolved, External)
+                and resolved.root == "pydantic_settings"
+                and resolved.attr == "BaseSettings"
+            ):
+                return True
+            base_node = resolved.class_node if isinstance(resolved, Local) else None
+            if base_node and depth < _MAX_DEPTH and self._is_settings(resolved.module, base_node, depth + 1):  # type: ignore[union-attr]
+                return True
+        return False
+
+    def _settings_config(self, module: StaticModule, node: ast.ClassDef, depth: int = 0) -> dict[str, Any]:
+        """Literal keywords of `model_config = SettingsConfigDict(...)`, merged over the bases like pydantic does."""
+        config: dict[str, Any] = {}
+        if depth < _MAX_DEPTH:
+            for base in reversed(self._local_bases(module, node)):
+                assert base.class_node is not None
+                config |= self._settings_config(base.module, base.class_node, depth + 1)
+        for stmt in node.body:
+            match stmt:
+                case (
+                    ast.Assign(targets=[ast.Name(id="model_config")], value=ast.Call() as call)
+                    | ast.AnnAssign(target=ast.Name(id="model_config"), value=ast.Call() as call)
+                ):
+                    config |= {kw.arg: _literal(kw.value) for kw in call.keywords if kw.arg}
+        return config
+
+    def _env_vars(self, config: dict[str, Any], name: str, call: ast.Call | None) -> list[str]:
+        alias = None
+        if call is not None:
+            alias = _literal(_keyword(call, "validation_alias")) or _literal(_keyword(call, "alias"))
+        env_name = alias if isinstance(alias, str) else f"{config.get('env_prefix') or ''}{name}"
+        return [env_name if config.get("case_sensitive") else env_name.lower()]
+
+    def _field_statements(self, node: ast.ClassDef) -> list[tuple[ast.AnnAssign, str]]:
+        """Annotated class attributes, `ClassVar` and `InitVar` are no fields."""
+        statements = []
+        for stmt in node.body:
+            if not isinstance(stmt, ast.AnnAssign) or not isinstance(stmt.target, ast.Name):
+                continue
+            annotation = _parse_forward_ref(stmt.annotation)
+            origin = annotation.value if isinstance(annotation, ast.Subscript) else annotation
+            if origin is not None and _call_name(origin) in _NOT_FIELDS:
+                continue
+            statements.append((stmt, stmt.target.id))
+        return statements
+
+    def _collect_fields(
+        self,
+        module: StaticModule,
+        node: ast.ClassDef,
+        own_fields: Callable[[StaticModule, ast.ClassDef], dict[str, ClassFieldInfo]],
+        depth: int = 0,
+    ) -> dict[str, ClassFieldInfo]:
+        """Fields of the bases in the package first, a redefined field keeps its position like at runtime."""
+        fields: dict[str, ClassFieldInfo] = {}
+        if depth < _MAX_DEPTH:
+            for base in reversed(self._local_bases(module, node)):
+                assert base.class_node is not None
+                fields |= self._collect_fields(base.module, base.class_node, own_fields, depth + 1)
+        return fields | own_fields(module, node)
+
+    def _field_info(self, module: StaticModule, stmt: ast.AnnAssign, name: str, **kwargs: Any) -> ClassFieldInfo:
+        return ClassFieldInfo(
+            name=name,
+            type_annotation=self.annotation_str(module, stmt.annotation),
+            type_imports=self.annotation_imports(module, stmt.annotation),
+            **kwargs,
+        )
+
+    def _dataclass_fields(self, module: StaticModule, node: ast.ClassDef) -> dict[str, ClassFieldInfo]:
+        fields = {}
+        for stmt, name in self._field_statements(node):
+            default: ParamDefault | None = None
+            value = stmt.value
+            if isinstance(value, ast.Call) and _call_name(value) == "field":
+                if _keyword(value, "default_factory") is not None:
+                    default = ParamDefault(value_repr="...", is_factory=True)
+                elif (explicit := _keyword(value, "default")) is not None:
+                    default = ParamDefault(value_repr=self.value_repr(module, explicit))
+            elif value is not None:
+                default = ParamDefault(value_repr=self.value_repr(module, value))
+            fields[name] = self._field_info(module, stmt, name, default=default)
+        return fields
+
+    def _pydantic_field_call(self, module: StaticModule, stmt: ast.AnnAssign) -> ast.Call | None:
+        if self._is_pydantic_field_call(module, stmt.value):
+            return stmt.value  # type: ignore[return-value]
+        annotation = stmt.annotation
+        if isinstance(annotation, ast.Subscript) and self._typing_name(module, annotation.value) == "Annotated":
+            for meta in _subscript_args(annotation)[1:]:
+                if self._is_pydantic_field_call(module, meta):
+                    return meta  # type: ignore[return-value]
+        return None
+
+    def _pydantic_fields(
+        self, module: StaticModule, node: ast.ClassDef, settings_config: dict[str, Any] | None = None
+    ) -> dict[str, ClassFieldInfo]:
+        fields = {}
+        for stmt, name in self._field_statements(node):
+            default: ParamDefault | None = None
+            description = deprecated = None
+            if call := self._pydantic_field_call(module, stmt):
+                explicit = _first_arg_or(call, "default") if call is stmt.value else stmt.value
+                if _keyword(call, "default_factory") is not None:
+                    default = ParamDefault(value_repr="...", is_factory=True)
+                elif explicit is not None and not _is_ellipsis(explicit):
+                    default = ParamDefault(value_repr=self.value_repr(module, explicit))
+                description = _literal(_keyword(call, "description"))
+                deprecated = _literal(_keyword(call, "deprecated"))
+            elif stmt.value is not None:
+                default = ParamDefault(value_repr=self.value_repr(module, stmt.value))
+            fields[name] = self._field_info(
+                module,
+                stmt,
+                name,
+                default=default,
+                description=description,
+                deprecated=deprecated if isinstance(deprecated, str) else None,
+                env_vars=None if settings_config is None else self._env_vars(settings_config, name, call),
+            )
+        return fields
+
+    def _computed_fields(self, module: StaticModule, node: ast.ClassDef) -> dict[str, ClassFieldInfo]:
+        fields = {}
+        for stmt in node.body:
+            if not isinstance(stmt, FuncNode):
+                continue
+            decorator = next((d for d in stmt.decorator_list if _call_name(d) == "computed_field"), None)
+            if decorator is None:
+                continue
+            description = _literal(_keyword(decorator, "description")) if isinstance(decorator, ast.Call) else None
+            fields[stmt.name] = ClassFieldInfo(
+                name=stmt.name,
+                type_annotation=self.annotation_str(module, stmt.returns),
+                type_imports=self.annotation_imports(module, stmt.returns),
+                is_computed=True,
+                description=description or ast.get_docstring(stmt),  # pydantic falls back to the docstring
+            )
+        return fields
+
+    def class_fields(self, module: StaticModule, node: ast.ClassDef) -> list[ClassFieldInfo] | None:
+        if self._is_pydantic(module, node):
+            settings_config = self._settings_config(module, node) if self._is_settings(module, node) else None
+            fields = self._collect_fields(
+                module,
+                node,
+                lambda field_module, field_node: self._pydantic_fields(field_module, field_node, settings_config),
+            )
+            computed = self._collect_fields(module, node, self._computed_fields)
+            return [info for name, info in (fields | computed).items() if not name.startswith("_")]
+        if self._is_dataclass(module, node):
+            fields = self._collect_fields(module, node, self._dataclass_fields)
+            return [info for name, info in fields.items() if not name.startswith("_")]
+        return None
+
+    def _find_init(self, module: StaticModule, node: ast.ClassDef, depth: int = 0) -> CallableSignature | None:
+        for stmt in node.body:
+            if isinstance(stmt, FuncNode) and stmt.name == "__init__":
+                return self.signature(module, stmt)
+        if self._is_dataclass(module, node):  # the generated `__init__` of a dataclass without fields
+            self_param = FuncParamInfo(name="self", kind=ParamKind.POSITIONAL_OR_KEYWORD)
+            return CallableSignature(parameters=[self_param], return_annotation="None")
+        if depth >= _MAX_DEPTH:
+            return None
+        for base in node.bases:
+            match resolved := self.resolve(module, base.value if isinstance(base, ast.Subscript) else base):
+                case Local(node=ast.ClassDef() as class_node):
+                    if found := self._find_init(resolved.module, class_node, depth + 1):
+                        return found
+                case External() if (
+                    isinstance(cls := resolved.stdlib_object(), type) and cls.__init__ is not object.__init__
+                ):
+                    return parse_signature(cls.__init__)
+        return None
+
+    def init_signature(self, module: StaticModule, node: ast.ClassDef) -> CallableSignature:
+        if found := self._find_init(module, node):
+            return found
+        if self._is_pydantic(module, node):
+            from pydantic import BaseModel
+
+            return parse_signature(BaseModel.__init__)
+        return parse_signature(object.__init__)
+
+    def dump_class(self, module: StaticModule, node: ast.ClassDef, ref: RefSymbol) -> ClassDump:
+        fields = self.class_fields(module, node)
+        mro_bases, num_direct = self._mro_bases(module, node)
+        return ClassDump(
+            name=ref.name,
+            module_path=ref.module_path,
+            docstring=_compiled_docstring(node),
+            mro_bases=mro_bases,
+            num_direct_bases=num_direct,
+            init_signature=None if fields else self.init_signature(module, node),
+            fields=fields,
+            line_number=_first_line(node),
+        )
+
+    def dump_exception(self, module: StaticModule, node: ast.ClassDef, ref: RefSymbol) -> ExceptionDump:
+        mro_bases, num_direct = self._mro_bases(module, node)
+        return ExceptionDump(
+            name=ref.name,
+            module_path=ref.module_path,
+            docstring=_compiled_docstring(node),
+            mro_bases=mro_bases,
+            num_direct_bases=num_direct,
+            init_signature=self.init_signature(module, node),
+            line_number=_first_line(node),
+        )
+
+    # --- module level assignments ---
+
+    def dump_type_alias(self, module: StaticModule, node: ast.Assign | ast.AnnAssign, ref: RefSymbol) -> TypeAliasDump:
+        value = node.value
+        assert value is not None
+        return TypeAliasDump(
+            name=ref.name,
+            module_path=ref.module_path,
+            alias_target=f"~{ref.name}" if self._is_typevar(module, value) else ast.unparse(value),
+            line_number=node.lineno,
+        )
+
+    def dump_global_var(self, module: StaticModule, node: ast.Assign | ast.AnnAssign, ref: RefSymbol) -> GlobalVarDump:
+        if node.value is None:
+            return GlobalVarDump(name=ref.name, module_path=ref.module_path, value_repr=None)
+        _, value = self.assigned_value(module, node.value)
+        is_none = isinstance(value, ast.Constant) and value.value is None
+        return GlobalVarDump(
+            name=ref.name,
+            module_path=ref.module_path,
+            value_repr=None if is_none else self.value_repr(module, node.value),
+        )
@@ -0,0 +1,123 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from pkg_ext._internal import api_dumper
+from pkg_ext._internal.api_dumper_static import StaticSymbolDumper
+from pkg_ext._internal.models.py_symbols import RefSymbol, SymbolType
+
+_MODELS_SRC = '''\
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import ClassVar, Generic, Literal, Optional, TypeVar, Union
+
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+T = TypeVar("T")
+DEFAULT_NAME = "default"
+MAX_SIZE: int = 10
+PathOrStr = Union[str, "Path"]
+
+
+class Color(StrEnum):
+    RED = "red"
+
+
+@dataclass
+class Item(Generic[T]):
+    """An item."""
+
+    name: str = DEFAULT_NAME
+    tags: list[str] = field(default_factory=list)
+    value: Optional[T] = None
+    LIMIT: ClassVar[int] = 3
+
+
+class Base(BaseModel):
+    kind: Literal["a", "b"] = "a"
+
+
+class Model(Base):
+    size: int = Field(MAX_SIZE, description="The size")
+    color: Color | None = None
+
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="my_")
+
+    foo_bar: str = ""
+    aliased: str = Field("", alias="BAZZ")
+
+
+class ItemError(Exception):
+    def __init__(self, item: Item[int], *, reason: str = "") -> None:
+        self.item = item
+'''
+
+_FUNCS_SRC = '''\
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from static_pkg.models import DEFAULT_NAME, Item, T
+
+
+def find(items: list[Item[T]], name: str = DEFAULT_NAME, /, *rest: int, key: Callable[[T], bool] | None = None, **kw) -> Item[T] | None:
+    """Find an item."""
+    return None
+
+
+async def fetch(url: str, timeout: float = 1.5) -> bytes:
+    return b""
+'''
+
+_REFS = [
+    ("T", SymbolType.TYPE_ALIAS, "models.py"),
+    ("DEFAULT_NAME", SymbolType.GLOBAL_VAR, "models.py"),
+    ("MAX_SIZE", SymbolType.GLOBAL_VAR, "models.py"),
+    ("Color", SymbolType.CLASS, "models.py"),
+    ("Item", SymbolType.CLASS, "models.py"),
+    ("Model", SymbolType.CLASS, "models.py"),
+    ("Settings", SymbolType.CLASS, "models.py"),
+    ("ItemError", SymbolType.EXCEPTION, "models.py"),
+    ("find", SymbolType.FUNCTION, "funcs.py"),
+    ("fetch", SymbolType.FUNCTION, "funcs.py"),
+]
+
+
+@pytest.fixture()
+def static_pkg(tmp_path, monkeypatch) -> Path:
+    pkg_dir = tmp_path / "static_pkg"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "models.py").write_text(_MODELS_SRC)
+    (pkg_dir / "funcs.py").write_text(_FUNCS_SRC)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield pkg_dir
+    for name in [name for name in sys.modules if name.split(".")[0] == "static_pkg"]:
+        del sys.modules[name]
+
+
+@pytest.mark.parametrize(("name", "symbol_type", "rel_path"), _REFS, ids=[ref[0] for ref in _REFS])
+def test_static_dump_matches_runtime_dump(static_pkg, name, symbol_type, rel_path):
+    ref = RefSymbol(name=name, type=symbol_type, rel_path=rel_path)
+    runtime = api_dumper.dump_symbol(ref, "static_pkg")
+    static = StaticSymbolDumper(static_pkg)(ref, "static_pkg")
+    assert runtime is not None
+    assert static is not None
+    expected = runtime.model_dump()
+    if symbol_type == SymbolType.TYPE_ALIAS:  # documented: line number of the assignment
+        expected["line_number"] = static.line_number
+    if name == "Settings":  # documented: third party bases are opaque
+        expected["mro_bases"].remove("BaseModel")
+    assert static.model_dump() == expected
+
+
+def test_static_dump_never_imports_the_package(static_pkg):
+    dumper = StaticSymbolDumper(static_pkg)
+    for name, symbol_type, rel_path in _REFS:
+        assert dumper(RefSymbol(name=name, type=symbol_type, rel_path=rel_path), "static_pkg") is not None
+    assert "static_pkg" not in sys.modules
+    assert dumper(RefSymbol(name="missing", type=SymbolType.FUNCTION, rel_path="funcs.py"), "static_pkg") is None
@@ -26,12 +26,14 @@ from .actions import (
     RenameAction,
     StabilityTarget,
     action_group,
+    append_changelog_actions,
     changelog_filepath,
     default_changelog_path,
     dump_changelog_actions,
     parse_changelog_actions,
     parse_changelog_file_path,
 )
+from .store import ChangelogStore
 
 __all__ = [
     "AdditionalChangeAction",
@@ -39,6 +41,7 @@ __all__ = [
     "BumpType",
     "ChangelogAction",
     "ChangelogActionBase",
+    "ChangelogStore",
     "ChoreAction",
     "DeleteAction",
     "DeprecatedAction",
@@ -53,6 +56,7 @@ __all__ = [
     "RenameAction",
     "StabilityTarget",
     "action_group",
+    "append_changelog_actions",
     "changelog_filepath",
     "default_changelog_path",
     "dump_changelog_actions",
@@ -0,0 +1,144 @@
+"""Compiled cache of validated changelog actions.
+
+Entries are keyed by the file path relative to the changelog dir and validated by (mtime_ns, size) first and the
+sha256 of the content second. Hits are rebuilt with `model_construct`, only changed files are YAML-parsed and
+validated again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from functools import cache
+from pathlib import Path
+from types import NoneType, UnionType
+from typing import Any, Callable, Self, Union, get_args, get_origin
+
+from model_lib import Entity
+
+from pkg_ext._internal.disk_cache import ensure_cache_dir, read_json_cache, write_json_cache
+from pkg_ext._internal.parse_cache import ParseCacheStats
+
+logger = logging.getLogger(__name__)
+CACHE_VERSION = 1
+CHANGELOG_CACHE_FILENAME = "changelog_actions.json"
+
+
+def action_cache_fingerprint(action_classes: list[type[Entity]]) -> str:
+    """Any change to the action models invalidates the whole cache."""
+    schema = sorted(
+        f"{cls.__name__}:{','.join(f'{name}={field_info.annotation!r}' for name, field_info in cls.model_fields.items())}"
+        for cls in action_classes
+    )
+    return hashlib.sha256(f"{CACHE_VERSION}:{';'.join(schema)}".encode()).hexdigest()
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """`X | None` -> X, other unions are left as is."""
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+@cache
+def _field_converters(cls: type[Entity]) -> dict[str, Callable[[Any], Any]]:
+    """JSON dumps datetimes and enums as strings, `model_construct` doesn't convert them back."""
+    converters: dict[str, Callable[[Any], Any]] = {}
+    for name, field_info in cls.model_fields.items():
+        annotation = _unwrap_optional(field_info.annotation)
+        if annotation is datetime:
+            converters[name] = datetime.fromisoformat
+        elif isinstance(annotation, type) and issubclass(annotation, Enum):
+            converters[name] = annotation
+    return converters
+
+
+def action_as_dict(action: Entity) -> dict[str, Any]:
+    return {
+        "values": action.model_dump(mode="json"),
+        "fields_set": sorted(action.model_fields_set),
+    }
+
+
+def action_from_dict(data: dict[str, Any], classes_by_type: dict[str, type[Entity]]) -> Entity:
+    values = dict(data["values"])
+    cls = classes_by_type[values["type"]]
+    for name, convert in _field_converters(cls).items():
+        if (value := values.get(name)) is not None:
+            values[name] = convert(value)
+    return cls.model_construct(_fields_set=set(data["fields_set"]), **values)
+
+
+@dataclass
+class ChangelogActionCache:
+    path: Path
+    fingerprint: str
+    entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    stats: ParseCacheStats = field(default_factory=ParseCacheStats)
+    _pending: dict[str, dict[str, Any]] = field(default_factory=dict)
+    _changed: bool = False
+
+    @classmethod
+    def load(cls, cache_dir: Path, fingerprint: str) -> Self:
+        path = cache_dir / CHANGELOG_CACHE_FILENAME
+        raw = read_json_cache(path)
+        if not isinstance(raw, dict) or raw.get("fingerprint") != fingerprint:
+            return cls(path=path, fingerprint=fingerprint)
+        return cls(path=path, fingerprint=fingerprint, entries=raw.get("entries", {}))
+
+    def cached(self, path: Path, rel_path: str, classes_by_type: dict[str, type[Entity]]) -> list[Any] | None:
+        """Actions of an unchanged file, None on a miss, call `store` with the parsed actions afterwards."""
+        stat = path.stat()
+        entry = self.entries.get(rel_path)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            self.stats.hits += 1
+            return [action_from_dict(action, classes_by_type) for action in entry["actions"]]
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        if entry and entry["sha256"] == digest:
+            self.stats.hits += 1
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            self._changed = True
+            return [action_from_dict(action, classes_by_type) for action in entry["actions"]]
+        self.stats.misses += 1
+        self._pending[rel_path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+        return None
+
+    def store(self, rel_path: str, actions: list[Any]) -> None:
+        entry = self._pending.pop(rel_path)
+        entry["actions"] = [action_as_dict(action) for action in actions]
+        self.entries[rel_path] = entry
+        self._changed = True
+
+    def parse(
+        self,
+        path: Path,
+        rel_path: str,
+        parse_fn: Callable[[Path], list[Any]],
+        classes_by_type: dict[str, type[Entity]],
+    ) -> list[Any]:
+        if (actions := self.cached(path, rel_path, classes_by_type)) is not None:
+            return actions
+        actions = parse_fn(path)
+        self.store(rel_path, actions)
+        return actions
+
+    def prune(self, rel_paths: set[str]) -> None:
+        if removed := self.entries.keys() - rel_paths:
+            for rel_path in removed:
+                del self.entries[rel_path]
+            self._changed = True
+
+    def save(self) -> None:
+        logger.debug(f"changelog cache {self.path.name}: {self.stats}")
+        if not self._changed:
+            return
+        ensure_cache_dir(self.path.parent)
+        write_json_cache(self.path, {"fingerprint": self.fingerprint, "entries": self.entries})
+        self._changed = False
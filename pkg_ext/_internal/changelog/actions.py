@@ -2,22 +2,33 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from functools import cache, total_ordering
 from pathlib import Path
-from typing import Annotated, ClassVar, Iterable, Literal, Self, Union
+from typing import Annotated, ClassVar, Iterable, Literal, Self, Union, get_args
 
-from ask_shell import shell
+import yaml
 from model_lib import Entity, dump, fields
-from model_lib.serialize.yaml_serialize import parse_yaml_str
 from pydantic import Field, TypeAdapter, model_validator
 from zero_3rdparty.datetime_utils import utc_now
 from zero_3rdparty.enum_utils import StrEnum
-from zero_3rdparty.file_utils import ensure_parents_write_text
 
+from pkg_ext._internal.changelog.action_cache import (
+    ChangelogActionCache,
+    action_as_dict,
+    action_cache_fingerprint,
+    action_from_dict,
+)
+from pkg_ext._internal.changelog.identity import resolve_author
+from pkg_ext._internal.disk_cache import write_text_if_changed
+from pkg_ext._internal.file_parser import resolve_parse_workers
 from pkg_ext._internal.git_usage.state import GitChanges
+from pkg_ext._internal.task_graph import process_pool_context
 
 logger = logging.getLogger(__name__)
 ACTION_FILE_SPLIT = "---\n"
+PARALLEL_CHANGELOG_MIN_FILES = 64
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class StabilityTarget(StrEnum):
@@ -50,18 +61,10 @@ class BumpType(StrEnum):
         return sorted(actions, key=as_index)
 
 
-def _run_cmd(script: str) -> str | None:
-    result = shell.run_and_wait(script, allow_non_zero_exit=True, skip_progress_output=True)
-    return result.stdout.strip() or None if result.exit_code == 0 else None
-
-
 @cache
 def current_user() -> str:
-    if username := _run_cmd("gh api user --jq .login"):
-        return username
-    if name := _run_cmd("git config user.name"):
-        return name
-    return ChangelogActionBase.DEFAULT_AUTHOR
+    """Once per process, see `resolve_author` for the overrides and the cache shared across processes."""
+    return resolve_author(ChangelogActionBase.DEFAULT_AUTHOR)
 
 
 @total_ordering
@@ -70,13 +73,18 @@ class ChangelogActionBase(Entity):
 
     name: str = Field(default="", description="Symbol name or Group name or Release Version")
     ts: fields.UtcDatetime = Field(default_factory=utc_now)
-    author: str = Field(default_factory=current_user)
+    author: str = Field(default="", description="Empty unless set explicitly, see `resolved_author`")
     pr: int | None = Field(default=0)
 
     @property
     def bump_type(self) -> BumpType:
         return BumpType.UNDEFINED
 
+    @property
+    def resolved_author(self) -> str:
+        """The explicit author or the current user, only resolved when displayed."""
+        return self.author or current_user()
+
     # Fields that should appear first in YAML output, in order
     _YAML_FIELD_ORDER: ClassVar[tuple[str, ...]] = ("name", "ts", "type")
 
@@ -387,30 +395,105 @@ def action_group(action: ChangelogAction) -> str | None:
 _changelog_action_adapter: TypeAdapter[ChangelogAction] = TypeAdapter(ChangelogAction)
 
 
+def parse_yaml_documents(content: str) -> list[object]:
+    """All documents in one pass, with the libyaml C loader when pyyaml was built with it."""
+    return [data for data in yaml.load_all(content, Loader=_YamlLoader) if data is not None]
+
+
 def parse_changelog_file_path(path: Path) -> list[ChangelogAction]:
     if not path.exists():
         logger.warning(f"no changelog file @ {path}")
         return []
     pr_number = int(path.stem)
     actions = []
-    for action_raw in path.read_text().split(ACTION_FILE_SPLIT):
-        if not action_raw.strip():
-            continue
-        raw_data = parse_yaml_str(action_raw)
+    for raw_data in parse_yaml_documents(path.read_text()):
         assert isinstance(raw_data, dict)
         raw_data["pr"] = pr_number
         actions.append(_changelog_action_adapter.validate_python(raw_data))
     return actions
 
 
-def parse_changelog_actions(changelog_dir_path: Path) -> list[ChangelogAction]:
-    assert changelog_dir_path.is_dir(), f"expected a directory @ {changelog_dir_path}"
+_action_classes = list(get_args(get_args(ChangelogAction)[0]))
+_action_classes_by_type = {cls.model_fields["type"].default: cls for cls in _action_classes}
+
+
+def _parse_changelog_file_compact(path: Path) -> list[dict]:
+    """Worker entrypoint, the validated actions cross the process boundary as dicts."""
+    return [action_as_dict(action) for action in parse_changelog_file_path(path)]
+
+
+def parse_changelog_files(paths: list[Path], workers: int = 1) -> list[list[ChangelogAction]]:
+    """Actions per path in order, using a process pool when `workers` > 1 and there are enough files."""
+    workers = min(resolve_parse_workers(workers), len(paths))
+    if workers <= 1 or len(paths) < PARALLEL_CHANGELOG_MIN_FILES:
+        return [parse_changelog_file_path(path) for path in paths]
+    chunksize = max(1, len(paths) // (workers * 4))
+    logger.debug(f"parsing {len(paths)} changelog files with {workers} workers (chunksize={chunksize})")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=process_pool_context()) as executor:
+        return [
+            [action_from_dict(data, _action_classes_by_type) for data in compact]
+            for compact in executor.map(_parse_changelog_file_compact, paths, chunksize=chunksize)
+        ]
+
+
+def archived_changelog_files(changelog_dir: Path) -> list[Path]:
+    return sorted(path for path in changelog_dir.rglob("*.yaml") if path.parent != changelog_dir)
+
+
+def parse_changelog_paths(
+    changelog_dir_path: Path,
+    paths: list[Path],
+    cache_dir: Path | None = None,
+    *,
+    workers: int = 1,
+    prune_cache: bool = False,
+) -> list[ChangelogAction]:
+    """Sorted actions of `paths`, `prune_cache` drops cache entries of other files so only use it with all paths."""
+    if cache_dir is None:
+        return sorted(action for file_actions in parse_changelog_files(paths, workers) for action in file_actions)
+    cache = ChangelogActionCache.load(cache_dir, action_cache_fingerprint(_action_classes))
     actions: list[ChangelogAction] = []
-    for path in changelog_dir_path.rglob("*.yaml"):
-        actions.extend(parse_changelog_file_path(path))
+    missing: list[tuple[Path, str]] = []
+    for path in paths:
+        rel_path = str(path.relative_to(changelog_dir_path))
+        if (cached := cache.cached(path, rel_path, _action_classes_by_type)) is not None:
+            actions.extend(cached)
+        else:
+            missing.append((path, rel_path))
+    parsed = parse_changelog_files([path for path, _ in missing], workers)
+    for (_, rel_path), file_actions in zip(missing, parsed, strict=True):
+        cache.store(rel_path, file_actions)
+        actions.extend(file_actions)
+    if prune_cache:
+        cache.prune({str(path.relative_to(changelog_dir_path)) for path in paths})
+    cache.save()
     return sorted(actions)
 
 
+def prune_changelog_action_cache(changelog_dir_path: Path, paths: list[Path], cache_dir: Path) -> None:
+    """Drops cache entries of files not in `paths`, pass every live and archived file."""
+    cache = ChangelogActionCache.load(cache_dir, action_cache_fingerprint(_action_classes))
+    cache.prune({str(path.relative_to(changelog_dir_path)) for path in paths})
+    cache.save()
+
+
+def parse_changelog_actions(
+    changelog_dir_path: Path,
+    cache_dir: Path | None = None,
+    *,
+    include_archived: bool = True,
+    workers: int = 1,
+) -> list[ChangelogAction]:
+    """With a `cache_dir`, only files changed since the last call are parsed and validated.
+
+    `include_archived=False` skips the numbered archive subdirectories.
+    `workers` follows `parse_workers`, 0 uses one process per cpu and 1 parses serially.
+    """
+    assert changelog_dir_path.is_dir(), f"expected a directory @ {changelog_dir_path}"
+    paths = sorted(changelog_dir_path.rglob("*.yaml") if include_archived else changelog_dir_path.glob("*.yaml"))
+    return parse_changelog_paths(changelog_dir_path, paths, cache_dir, workers=workers, prune_cache=include_archived)
+
+
 def changelog_filename(pr_number: int) -> str:
     return f"{pr_number:03d}.yaml"
 
@@ -456,7 +539,27 @@ def default_changelog_path(changelog_dir: Path) -> Path:
 
 
 def dump_changelog_actions(path: Path, actions: Sequence[ChangelogAction]) -> Path:
+    """Rewrites the file in canonical (sorted) order, skipped when the content is unchanged."""
     assert actions, "no actions to dump"
     yaml_content = ACTION_FILE_SPLIT.join(action.file_content for action in sorted(actions))
-    ensure_parents_write_text(path, yaml_content)
+    write_text_if_changed(path, yaml_content)
+    return path
+
+
+def append_changelog_actions(path: Path, existing: Sequence[ChangelogAction], new: Sequence[ChangelogAction]) -> Path:
+    """Serializes only `new`, `existing` must be the actions parsed from `path`.
+
+    Appending keeps the canonical order when every new action sorts after the existing ones (the usual case, new
+    actions get the current timestamp), otherwise all actions are dumped again.
+    """
+    if not new:
+        return path
+    new_sorted = sorted(new)
+    if not existing or not path.exists() or not max(existing) < new_sorted[0]:
+        return dump_changelog_actions(path, [*existing, *new_sorted])
+    content = path.read_text()
+    if not content.endswith("\n"):
+        content += "\n"
+    appended = ACTION_FILE_SPLIT.join(action.file_content for action in new_sorted)
+    write_text_if_changed(path, f"{content}{ACTION_FILE_SPLIT}{appended}")
     return path
@@ -1,23 +1,48 @@
+import logging
+import os
+import time
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import Literal
 
 import pytest
 from model_lib.serialize.yaml_serialize import parse_yaml_str
 
+from pkg_ext._internal.changelog import actions as actions_mod
+from pkg_ext._internal.changelog.action_cache import (
+    ChangelogActionCache,
+    action_as_dict,
+    action_cache_fingerprint,
+    action_from_dict,
+)
 from pkg_ext._internal.changelog.actions import (
+    ACTION_FILE_SPLIT,
     AdditionalChangeAction,
     BreakingChangeAction,
     BumpType,
+    ChoreAction,
     DeprecatedAction,
     ExperimentalAction,
+    FixAction,
     GAAction,
+    MakePublicAction,
     MaxBumpTypeAction,
     StabilityTarget,
+    _action_classes,
+    _action_classes_by_type,
     _changelog_action_adapter,
+    append_changelog_actions,
     archive_old_actions,
     changelog_filename,
     changelog_filepath,
+    dump_changelog_actions,
+    parse_changelog_actions,
+    parse_changelog_file_path,
+    parse_yaml_documents,
 )
 
+logger = logging.getLogger(__name__)
+
 
 def test_archive_old_actions_no_cleanup_when_below_trigger(tmp_path: Path):
     changelog_dir = tmp_path / "changelog"
@@ -193,3 +218,196 @@ def test_auto_generated_field_serializes_correctly():
     )
     assert "auto_generated: true" in action_auto.file_content
     assert "auto_generated" not in action_default.file_content
+
+
+def _write_changelog_files(changelog_dir: Path) -> None:
+    meta = "ts: 2024-01-01T10:00:00Z\nauthor: me"
+    changelog_filepath(changelog_dir, 1).write_text(
+        f"name: my_func\n{meta}\ntype: make_public\ngroup: core\nfull_path: _internal.my_func\n"
+    )
+    (changelog_dir / "000").mkdir()
+    (changelog_dir / "000" / changelog_filename(2)).write_text(
+        f"name: core\n{meta}\ntype: experimental\ntarget: group\n"
+        f"---\nname: '0.1.0'\n{meta}\ntype: release\nold_version: '0.0.1'\n"
+        f"---\nname: core\n{meta}\ntype: max_bump_type\nmax_bump: minor\nreason: beta\n"
+        f"---\nname: core\n{meta}\ntype: fix\nshort_sha: abc123\nmessage: fix it\nextra_field: kept\n"
+    )
+
+
+def test_parse_changelog_actions_cache_matches_full_parse(tmp_path: Path):
+    changelog_dir, cache_dir = tmp_path / ".changelog", tmp_path / "cache"
+    changelog_dir.mkdir()
+    _write_changelog_files(changelog_dir)
+    expected = parse_changelog_actions(changelog_dir)
+    assert parse_changelog_actions(changelog_dir, cache_dir) == expected
+    cached = parse_changelog_actions(changelog_dir, cache_dir)
+    assert cached == expected
+    assert [action.file_content for action in cached] == [action.file_content for action in expected]
+    assert [action.model_fields_set for action in cached] == [action.model_fields_set for action in expected]
+    assert isinstance(cached[0].ts, type(expected[0].ts))
+
+
+def test_changelog_action_cache_only_parses_changed_files(tmp_path: Path):
+    changelog_dir, cache_dir = tmp_path / ".changelog", tmp_path / "cache"
+    changelog_dir.mkdir()
+    _write_changelog_files(changelog_dir)
+    parse_changelog_actions(changelog_dir, cache_dir)
+    parsed: list[str] = []
+
+    def parse_counting(path: Path):
+        parsed.append(path.name)
+        return parse_changelog_file_path(path)
+
+    def parse_all() -> ChangelogActionCache:
+        cache = ChangelogActionCache.load(cache_dir, action_cache_fingerprint(_action_classes))
+        for path in sorted(changelog_dir.rglob("*.yaml")):
+            cache.parse(path, str(path.relative_to(changelog_dir)), parse_counting, _action_classes_by_type)
+        cache.save()
+        return cache
+
+    assert parse_all().stats.hits == 2
+    assert parsed == []
+    path = changelog_filepath(changelog_dir, 1)
+    path.write_text(path.read_text().replace("my_func", "other_func"))
+    cache = parse_all()
+    assert parsed == ["001.yaml"]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def _write_synthetic_changelog(changelog_dir: Path, files: int, actions_per_file: int) -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    for pr in range(1, files + 1):
+        ts = start + timedelta(hours=pr)
+        actions = [
+            MakePublicAction(
+                name=f"func_{pr}_{i}", group="core", full_path=f"_internal.func_{pr}_{i}", ts=ts, author="test"
+            )
+            for i in range(actions_per_file - 1)
+        ]
+        actions.append(
+            FixAction(name="core", group="core", short_sha=f"{pr:06x}", message="fix: it", ts=ts, author="test")
+        )
+        dump_changelog_actions(changelog_filepath(changelog_dir, pr), actions)
+
+
+def _parse_split_documents(path: Path) -> list[dict]:
+    return [parse_yaml_str(raw) for raw in path.read_text().split(ACTION_FILE_SPLIT) if raw.strip()]  # type: ignore[misc]
+
+
+def test_parse_yaml_documents_matches_split_parse(tmp_path: Path):
+    changelog_dir = tmp_path / ".changelog"
+    changelog_dir.mkdir()
+    _write_changelog_files(changelog_dir)
+    _write_synthetic_changelog(changelog_dir, 2, 3)
+    for path in sorted(changelog_dir.rglob("*.yaml")):
+        assert parse_yaml_documents(path.read_text()) == _parse_split_documents(path)
+
+
+def test_parse_changelog_actions_parallel_matches_serial(tmp_path: Path, monkeypatch):
+    changelog_dir = tmp_path / ".changelog"
+    changelog_dir.mkdir()
+    _write_synthetic_changelog(changelog_dir, 8, 3)
+    expected = parse_changelog_actions(changelog_dir)
+    monkeypatch.setattr(actions_mod, "PARALLEL_CHANGELOG_MIN_FILES", 2)
+    parallel = parse_changelog_actions(changelog_dir, workers=2)
+    assert parallel == expected
+    assert [action.file_content for action in parallel] == [action.file_content for action in expected]
+    assert parse_changelog_actions(changelog_dir, tmp_path / "cache", workers=2) == expected
+
+
+@pytest.mark.skipif(os.environ.get("MANUAL", "") == "", reason="needs os.environ[MANUAL]")
+def test_parse_changelog_actions_benchmark_5000_actions(tmp_path: Path):
+    changelog_dir = tmp_path / ".changelog"
+    changelog_dir.mkdir()
+    _write_synthetic_changelog(changelog_dir, 500, 10)
+
+    start = time.perf_counter()
+    expected = sorted(
+        _changelog_action_adapter.validate_python({**raw, "pr": int(path.stem)})
+        for path in changelog_dir.glob("*.yaml")
+        for raw in _parse_split_documents(path)
+    )
+    split_parse = time.perf_counter() - start
+    start = time.perf_counter()
+    serial = parse_changelog_actions(changelog_dir, workers=1)
+    fast_serial = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = parse_changelog_actions(changelog_dir, workers=0)
+    fast_parallel = time.perf_counter() - start
+
+    assert len(expected) == 5000
+    assert serial == expected
+    assert parallel == expected
+    logger.info(
+        f"5000 actions: split + safe_load {split_parse:.2f}s, "
+        f"load_all serial {fast_serial:.2f}s, load_all workers {fast_parallel:.2f}s"
+    )
+    assert fast_serial < split_parse
+
+
+def test_append_changelog_actions_matches_canonical_dump(tmp_path: Path):
+    path = changelog_filepath(tmp_path, 1)
+    existing = [
+        MakePublicAction(
+            name="f", group="core", full_path="_internal.f", ts=datetime(2024, 1, 2, tzinfo=UTC), author="a"
+        )
+    ]
+    dump_changelog_actions(path, existing)
+    newer = [
+        FixAction(name="core", group="core", short_sha="abc", message="fix", ts=datetime(2024, 1, 4, tzinfo=UTC)),
+        ChoreAction(description="ci", ts=datetime(2024, 1, 3, tzinfo=UTC), author="a"),
+    ]
+    append_changelog_actions(path, existing, newer)
+    appended = path.read_text()
+    dump_changelog_actions(path, existing + newer)
+    assert path.read_text() == appended
+
+    older = [ChoreAction(description="old", ts=datetime(2024, 1, 1, tzinfo=UTC), author="a")]
+    append_changelog_actions(path, parse_changelog_file_path(path), older)
+    assert path.read_text().startswith(older[0].file_content)
+
+    mtime = path.stat().st_mtime_ns
+    dump_changelog_actions(path, parse_changelog_file_path(path))
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_actions_never_resolve_the_author(tmp_path: Path, monkeypatch):
+    def fail(default: str) -> str:
+        raise AssertionError("resolve_author called")
+
+    monkeypatch.setattr(actions_mod, "resolve_author", fail)
+    path = tmp_path / "1.yaml"
+    dump_changelog_actions(
+        path, [ChoreAction(description="ci"), FixAction(name="core", short_sha="abc", message="fix")]
+    )
+    assert "author" not in path.read_text()
+    assert [action.author for action in parse_changelog_file_path(path)] == ["", ""]
+    actions_mod.current_user.cache_clear()
+    monkeypatch.setattr(actions_mod, "resolve_author", lambda default: "me")
+    assert ChoreAction(description="ci").resolved_author == "me"
+    assert ChoreAction(description="ci", author="other").resolved_author == "other"
+    actions_mod.current_user.cache_clear()
+
+
+def test_action_cache_converts_optional_fields():
+    class OptionalAction(ChoreAction):
+        type: Literal["optional"] = "optional"  # pyright: ignore[reportIncompatibleVariableOverride]
+        released_at: datetime | None = None
+        bump: BumpType | None = None
+
+    action = OptionalAction(description="ci", released_at=datetime(2024, 1, 2, tzinfo=UTC), bump=BumpType.MINOR)
+    cached = action_from_dict(action_as_dict(action), {"optional": OptionalAction})
+    assert cached == action
+    assert isinstance(cached.released_at, datetime)
+    assert cached.bump is BumpType.MINOR
+
+
+def test_action_cache_fingerprint_includes_annotations():
+    class Before(ChoreAction):
+        count: int = 0
+
+    class After(ChoreAction):
+        count: str = ""
+
+    After.__name__ = Before.__name__
+    assert action_cache_fingerprint([Before]) != action_cache_fingerprint([After])
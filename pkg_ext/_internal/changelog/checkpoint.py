@@ -0,0 +1,155 @@
+"""Checkpoint of `PkgExtState` as of the newest archived changelog action.
+
+`clean_old_entries` writes `.changelog/checkpoint.json` (committed) after archiving old PR files to the numbered
+subdirectories. `parse_changelog` starts from the checkpoint and only replays the live `.changelog/*.yaml` files.
+Groups are read from `.groups.yaml` as before, it already contains the effects of the archived actions, the
+checkpoint groups are only used when that file is missing.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Self
+
+from pkg_ext._internal.changelog.actions import ChangelogAction, archived_changelog_files, parse_changelog_file_path
+from pkg_ext._internal.disk_cache import atomic_write_text
+from pkg_ext._internal.models import PublicGroups
+from pkg_ext._internal.pkg_state import PkgExtState
+
+logger = logging.getLogger(__name__)
+CHECKPOINT_FILENAME = "checkpoint.json"
+CHECKPOINT_VERSION = 1
+_STATE_FIELDS = (
+    "refs",
+    "decided_local_ids",
+    "ignored_shas",
+    "included_shas",
+    "group_stability",
+    "symbol_stability",
+    "arg_stability",
+    "deprecation_replacements",
+)
+_SET_FIELDS = ("decided_local_ids", "ignored_shas", "included_shas")
+
+
+def _rel_paths(paths: list[Path], changelog_dir: Path) -> list[str]:
+    return [str(path.relative_to(changelog_dir)) for path in paths]
+
+
+def state_as_dict(state: PkgExtState) -> dict[str, Any]:
+    """JSON friendly dump with sorted collections, stable across runs for a committed file."""
+    data = state.model_dump(mode="json", include=set(_STATE_FIELDS))
+    for name in _SET_FIELDS:
+        data[name] = sorted(data[name])
+    data["refs"] = dict(sorted(data["refs"].items()))
+    return data
+
+
+def groups_as_list(groups: PublicGroups) -> list[dict[str, Any]]:
+    return [
+        {"name": group.name, "owned_refs": sorted(group.owned_refs), "owned_modules": sorted(group.owned_modules)}
+        for group in sorted(groups.groups)
+    ]
+
+
+def state_differences(state: PkgExtState, other: PkgExtState) -> list[str]:
+    """Names of the fields that differ, `groups` included."""
+    data, other_data = state_as_dict(state), state_as_dict(other)
+    differences = [name for name in _STATE_FIELDS if data[name] != other_data[name]]
+    if groups_as_list(state.groups) != groups_as_list(other.groups):
+        differences.append("groups")
+    return differences
+
+
+@dataclass
+class ChangelogCheckpoint:
+    archived_files: list[str]
+    newest_archived_ts: datetime | None
+    state: dict[str, Any]
+    groups: list[dict[str, Any]]
+
+    @classmethod
+    def path(cls, changelog_dir: Path) -> Path:
+        return changelog_dir / CHECKPOINT_FILENAME
+
+    @classmethod
+    def load(cls, changelog_dir: Path) -> Self | None:
+        """None when missing, from another version or when the archived files changed since it was written."""
+        path = cls.path(changelog_dir)
+        if not path.exists():
+            return None
+        try:
+            raw = json.loads(path.read_text())
+        except ValueError as e:
+            logger.warning(f"ignoring unreadable changelog checkpoint {path}: {e!r}")
+            return None
+        if raw.get("version") != CHECKPOINT_VERSION:
+            logger.info(f"ignoring changelog checkpoint with version {raw.get('version')}")
+            return None
+        archived = _rel_paths(archived_changelog_files(changelog_dir), changelog_dir)
+        if raw["archived_files"] != archived:
+            logger.warning(f"archived changelog files changed since {path.name} was written, replaying all actions")
+            return None
+        ts = raw["newest_archived_ts"]
+        return cls(
+            archived_files=raw["archived_files"],
+            newest_archived_ts=datetime.fromisoformat(ts) if ts else None,
+            state=raw["state"],
+            groups=raw["groups"],
+        )
+
+    def save(self, changelog_dir: Path) -> Path:
+        path = self.path(changelog_dir)
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "archived_files": self.archived_files,
+            "newest_archived_ts": self.newest_archived_ts.isoformat() if self.newest_archived_ts else None,
+            "state": self.state,
+            "groups": self.groups,
+        }
+        atomic_write_text(path, json.dumps(data, indent=2) + "\n")
+        return path
+
+    def covers(self, live_actions: list[ChangelogAction]) -> bool:
+        """Replaying on top of the checkpoint keeps the action order only if no live action is older."""
+        newest = self.newest_archived_ts
+        return newest is None or all(action.ts > newest for action in live_actions)
+
+    def public_groups(self, storage_path: Path | None) -> PublicGroups:
+        return PublicGroups(groups=self.groups, storage_path=storage_path)  # type: ignore[arg-type]
+
+    def tool_state(self, repo_root: Path, changelog_dir: Path, pkg_path: Path, groups: PublicGroups) -> PkgExtState:
+        return PkgExtState(
+            repo_root=repo_root,
+            changelog_dir=changelog_dir,
+            pkg_path=pkg_path,
+            groups=groups,
+            **self.state,
+        )
+
+
+def write_changelog_checkpoint(repo_root: Path, changelog_dir: Path, pkg_path: Path) -> Path | None:
+    """Replays the archived actions only, returns None when nothing is archived."""
+    archived = archived_changelog_files(changelog_dir)
+    if not archived:
+        return None
+    actions = sorted(action for path in archived for action in parse_changelog_file_path(path))
+    tool_state = PkgExtState(
+        repo_root=repo_root,
+        changelog_dir=changelog_dir,
+        pkg_path=pkg_path,
+        groups=PublicGroups(),
+    )
+    for action in actions:
+        tool_state.update_state(action)
+    checkpoint = ChangelogCheckpoint(
+        archived_files=_rel_paths(archived, changelog_dir),
+        newest_archived_ts=actions[-1].ts if actions else None,
+        state=state_as_dict(tool_state),
+        groups=groups_as_list(tool_state.groups),
+    )
+    return checkpoint.save(changelog_dir)
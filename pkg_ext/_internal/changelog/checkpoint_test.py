@@ -0,0 +1,100 @@
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from pkg_ext._internal.changelog import actions as actions_mod
+from pkg_ext._internal.changelog.actions import (
+    ChangelogAction,
+    ExperimentalAction,
+    FixAction,
+    GroupModuleAction,
+    KeepPrivateAction,
+    MakePublicAction,
+    StabilityTarget,
+    changelog_filepath,
+    dump_changelog_actions,
+)
+from pkg_ext._internal.changelog.checkpoint import ChangelogCheckpoint, state_differences
+from pkg_ext._internal.changelog.parser import parse_changelog
+from pkg_ext._internal.cli.workflows import clean_old_entries
+from pkg_ext._internal.errors import ChangelogCheckpointMismatchError
+from pkg_ext._internal.settings import PkgSettings
+
+_START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _pr_actions(pr: int) -> list[ChangelogAction]:
+    ts = _START + timedelta(days=pr)
+    common = {"ts": ts, "author": "test"}
+    return [
+        MakePublicAction(name=f"func_{pr}", group="core", full_path=f"_internal.func_{pr}", **common),
+        GroupModuleAction(name="core", module_path="_internal", **common),
+        FixAction(name="core", group="core", short_sha=f"sha{pr:03d}", message="fix", ignored=pr % 2 == 0, **common),
+        KeepPrivateAction(name=f"helper_{pr}", full_path=f"_internal.helper_{pr}", **common),
+        ExperimentalAction(name=f"func_{pr}", group="core", target=StabilityTarget.symbol, **common),
+    ]
+
+
+def _write_prs(settings: PkgSettings, prs: range) -> None:
+    for pr in prs:
+        dump_changelog_actions(changelog_filepath(settings.changelog_dir, pr), _pr_actions(pr))
+
+
+def _archive(settings: PkgSettings) -> Path:
+    settings.changelog_dir.mkdir(parents=True, exist_ok=True)
+    _write_prs(settings, range(1, 7))
+    settings.changelog_cleanup_count = 5
+    settings.changelog_keep_count = 2
+    clean_old_entries(settings)
+    path = ChangelogCheckpoint.path(settings.changelog_dir)
+    assert path.exists()
+    return path
+
+
+def test_checkpoint_replay_matches_full_replay(settings: PkgSettings, monkeypatch):
+    checkpoint_path = _archive(settings)
+    settings.use_cache = False
+    parsed: list[str] = []
+    parse_file = actions_mod.parse_changelog_file_path
+
+    def parse_counting(path: Path):
+        parsed.append(str(path.relative_to(settings.changelog_dir)))
+        return parse_file(path)
+
+    monkeypatch.setattr(actions_mod, "parse_changelog_file_path", parse_counting)
+    from_checkpoint, _ = parse_changelog(settings)
+    assert parsed == ["005.yaml", "006.yaml"]
+    settings.verify_checkpoint = True
+    parse_changelog(settings)
+
+    checkpoint_path.unlink()
+    full_replay, _ = parse_changelog(settings)
+    assert state_differences(from_checkpoint, full_replay) == []
+    assert from_checkpoint.included_shas == {"sha001", "sha003", "sha005"}
+
+
+def test_verify_checkpoint_detects_stale_checkpoint(settings: PkgSettings):
+    checkpoint_path = _archive(settings)
+    raw = json.loads(checkpoint_path.read_text())
+    raw["state"]["decided_local_ids"].remove("_internal.func_1")
+    checkpoint_path.write_text(json.dumps(raw))
+    settings.verify_checkpoint = True
+    with pytest.raises(ChangelogCheckpointMismatchError) as exc:
+        parse_changelog(settings)
+    assert exc.value.fields == ["decided_local_ids"]
+
+
+def test_checkpoint_ignored_when_archive_changes_or_live_actions_are_older(settings: PkgSettings):
+    _archive(settings)
+    assert ChangelogCheckpoint.load(settings.changelog_dir) is not None
+    old_live = [MakePublicAction(name="old", group="core", full_path="_internal.old", ts=_START, author="test")]
+    dump_changelog_actions(changelog_filepath(settings.changelog_dir, 7), old_live)
+    checkpoint = ChangelogCheckpoint.load(settings.changelog_dir)
+    assert checkpoint is not None
+    assert not checkpoint.covers(old_live)
+    assert parse_changelog(settings)[0].is_exposed("core", "old")
+
+    (settings.changelog_dir / "000" / "001.yaml").unlink()
+    assert ChangelogCheckpoint.load(settings.changelog_dir) is None
@@ -1,22 +1,31 @@
 import difflib
 import logging
-from collections import Counter
+from collections import Counter, deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import TypeVar
 
 from ask_shell._internal.rich_live import print_to_live
 from rich.markdown import Markdown
 
 from pkg_ext._internal.changelog.actions import FixAction
 from pkg_ext._internal.changelog.rebase import (
-    UnmatchedResolution,
+    CommitMessageIndex,
+    PatchIdReader,
     apply_remap_to_actions,
     build_sha_remap,
     find_stale_shas,
-    prompt_unmatched_fix,
+    prompt_unmatched_fixes,
     remove_actions_by_sha,
 )
 from pkg_ext._internal.context import pkg_ctx
 from pkg_ext._internal.errors import NoPublicGroupMatch
+from pkg_ext._internal.git_usage import git_patch_ids
 from pkg_ext._internal.git_usage.state import GitCommit
 from pkg_ext._internal.interactive import (
     SKIPPED,
@@ -29,6 +38,10 @@ from pkg_ext._internal.models import PublicGroup, PublicGroups, as_module_path
 from pkg_ext._internal.pkg_state import PkgExtState
 
 logger = logging.getLogger(__name__)
+T = TypeVar("T")
+R = TypeVar("R")
+FIX_PROMPT_LOOKAHEAD = 4
+FIX_PROMPT_WORKERS = 2
 
 
 def py_diff(old: str, new: str) -> str:
@@ -81,7 +94,23 @@ def prompt_for_fix(sha: str, commit_message: str, prompt_text: str) -> FixAction
     return fix
 
 
-def fix_changelog_action(commit: GitCommit, ctx: pkg_ctx) -> FixAction | None:
+@dataclass
+class FixPromptInput:
+    """Everything shown before the fix prompts, computed without user input so it can run ahead of the prompts."""
+
+    commit: GitCommit
+    diffs: dict[str, str]
+    group: str
+
+    @property
+    def prompt_md(self) -> Markdown:
+        prompt_context = []
+        for rel_path, diff in self.diffs.items():
+            prompt_context.extend([f"### {rel_path} ###", diff])
+        return Markdown("\n".join(prompt_context))
+
+
+def prepare_fix_prompt(commit: GitCommit, ctx: pkg_ctx) -> FixPromptInput | None:
     tool_state = ctx.tool_state
     git_changes = ctx.git_changes
     assert git_changes
@@ -90,7 +119,6 @@ def fix_changelog_action(commit: GitCommit, ctx: pkg_ctx) -> FixAction | None:
     )
     if not pkg_changes:
         return None
-    prompt_context = []
     diff_suffixes = ctx.settings.commit_fix_diff_suffixes
     diffs: dict[str, str] = {}
     for rel_path in pkg_changes:
@@ -101,22 +129,19 @@ def fix_changelog_action(commit: GitCommit, ctx: pkg_ctx) -> FixAction | None:
             continue
         new_content = path.read_text()
         old_content = git_changes.old_version(rel_path)
-        diffs[rel_path] = diff = py_diff(old_content, new_content)
-        prompt_context.extend(
-            [
-                f"### {rel_path} ###",
-                diff,
-            ]
-        )
-    prompt_md = Markdown("\n".join(prompt_context))
-    print_to_live(prompt_md)
+        diffs[rel_path] = py_diff(old_content, new_content)
+    return FixPromptInput(commit=commit, diffs=diffs, group=infer_group(tool_state.groups, diffs))
+
+
+def prompt_fix_action(prepared: FixPromptInput, ctx: pkg_ctx) -> FixAction:
+    print_to_live(prepared.prompt_md)
+    commit = prepared.commit
     commit_message = commit.message
     commit_sha = commit.sha
 
-    groups = tool_state.groups
-    group = infer_group(groups, diffs)
+    groups = ctx.tool_state.groups
     prompt_text = f"commit({commit_sha}): {commit_message}"
-    public_group = select_group_name_or_skip(prompt_text, groups, default=group)
+    public_group = select_group_name_or_skip(prompt_text, groups, default=prepared.group)
     if public_group == SKIPPED:
         return FixAction(
             name="",
@@ -137,15 +162,28 @@ def fix_changelog_action(commit: GitCommit, ctx: pkg_ctx) -> FixAction | None:
     return fix
 
 
-def _resolve_unmatched(unmatched: list[FixAction], commits: list[GitCommit], remap: dict[str, str]) -> set[str]:
-    shas_to_remove: set[str] = set()
-    for action in unmatched:
-        resolution, new_sha = prompt_unmatched_fix(action, commits)
-        if resolution == UnmatchedResolution.PICK_COMMIT:
-            remap[action.short_sha] = new_sha
-        elif resolution == UnmatchedResolution.REMOVE_ENTRY:
-            shas_to_remove.add(action.short_sha)
-    return shas_to_remove
+def fix_changelog_action(commit: GitCommit, ctx: pkg_ctx) -> FixAction | None:
+    if prepared := prepare_fix_prompt(commit, ctx):
+        return prompt_fix_action(prepared, ctx)
+    return None
+
+
+def iter_prefetched(prepare: Callable[[T], R], items: list[T], lookahead: int = FIX_PROMPT_LOOKAHEAD) -> Iterator[R]:
+    """Yields `prepare(item)` in order while the next `lookahead` items are prepared in background threads.
+
+    Threads suit the work here, git reads wait on the `cat-file` process. Stopping early cancels what hasn't started.
+    """
+    pool = ThreadPoolExecutor(max_workers=FIX_PROMPT_WORKERS, thread_name_prefix="pkg-ext-prefetch")
+    remaining = iter(items)
+    try:
+        pending: deque[Future[R]] = deque(pool.submit(prepare, item) for item in islice(remaining, lookahead + 1))
+        while pending:
+            result = pending.popleft().result()
+            for item in islice(remaining, 1):
+                pending.append(pool.submit(prepare, item))
+            yield result
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
 
 
 def _refresh_tool_state_shas(tool_state: PkgExtState, remap: dict[str, str], shas_to_remove: set[str]) -> None:
@@ -169,12 +207,23 @@ def _resolve_stale_shas(ctx: pkg_ctx) -> None:
     stale = find_stale_shas(fix_actions, commits)
     if not stale:
         return
-    remap, unmatched = build_sha_remap(stale, commits)
-    shas_to_remove = _resolve_unmatched(unmatched, commits, remap)
+    git = ctx.git_changes.git
+    repo_path = Path(git.working_dir) if git else None
+    store = ctx.git_changes.commit_store  # patch-ids of commits seen by earlier runs are read from disk
+    read_patch_ids: PatchIdReader | None = None
+    if repo_path:
+        read_patch_ids = partial(store.read_patch_ids, repo_path) if store else partial(git_patch_ids, repo_path)
+    remap, unmatched = build_sha_remap(stale, CommitMessageIndex(commits), read_patch_ids)
+    if repo_path and store:
+        store.save(repo_path)
+    picked, shas_to_remove = prompt_unmatched_fixes(unmatched, commits)
+    remap |= picked
     if remap:
         apply_remap_to_actions(ctx._actions, remap)
     if shas_to_remove:
         ctx._actions = remove_actions_by_sha(ctx._actions, shas_to_remove)
+    if remap or shas_to_remove:
+        ctx._actions_modified = True
     _refresh_tool_state_shas(ctx.tool_state, remap, shas_to_remove)
     kept_stale = len(unmatched) - len(shas_to_remove)
     logger.info(f"Rebased changelog: {len(remap)} remapped, {len(shas_to_remove)} removed, {kept_stale} kept stale")
@@ -185,13 +234,17 @@ def add_git_changes(ctx: pkg_ctx) -> None:
     git_changes = ctx.git_changes
     commit_fix_prefixes = ctx.settings.commit_fix_prefixes
     tool_state = ctx.tool_state
-    for commit in git_changes.commits:
-        if tool_state.sha_processed(commit.sha):
-            continue
-        message = commit.message
-        if not message.startswith(commit_fix_prefixes):
-            continue
-        if commit_fix := fix_changelog_action(commit, ctx):
+    fix_commits = [
+        commit
+        for commit in git_changes.commits
+        if not tool_state.sha_processed(commit.sha) and commit.message.startswith(commit_fix_prefixes)
+    ]
+    if not fix_commits:
+        return
+    if git_changes.git:
+        _ = git_changes.blob_reader  # created once here, the prefetch threads share it
+    for prepared in iter_prefetched(partial(prepare_fix_prompt, ctx=ctx), fix_commits):
+        if prepared and (commit_fix := prompt_fix_action(prepared, ctx)):
             ctx.add_changelog_action(commit_fix)
 
 
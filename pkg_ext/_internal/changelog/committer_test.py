@@ -0,0 +1,34 @@
+import threading
+
+import pytest
+
+from pkg_ext._internal.changelog.committer import iter_prefetched
+
+
+def test_iter_prefetched_prepares_ahead_in_order():
+    prepared: list[int] = []
+    lookahead_done = threading.Event()
+
+    def prepare(item: int) -> int:
+        prepared.append(item)
+        if item == 2:
+            lookahead_done.set()
+        return item * 10
+
+    results = iter_prefetched(prepare, list(range(6)), lookahead=2)
+    assert next(results) == 0
+    assert lookahead_done.wait(timeout=5)  # items 1 and 2 are ready while the caller handles item 0
+    assert list(results) == [10, 20, 30, 40, 50]
+    assert sorted(prepared) == list(range(6))
+
+
+def test_iter_prefetched_stops_early_and_raises_in_order():
+    def prepare(item: int) -> int:
+        if item == 1:
+            raise ValueError("boom")
+        return item
+
+    results = iter_prefetched(prepare, list(range(100)), lookahead=3)
+    assert next(results) == 0
+    with pytest.raises(ValueError, match="boom"):
+        next(results)
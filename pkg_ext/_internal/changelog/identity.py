@@ -0,0 +1,98 @@
+"""Default author of new changelog actions.
+
+Resolution order: `PKG_EXT_AUTHOR`, `[user] author` in the user config, the identity cache, `gh api user` and
+`git config user.name`. Lookups through `gh`/`git` are stored in `identity.json` next to the user config for
+`IDENTITY_CACHE_TTL`, keyed by the `gh` host and the git remote, so only the first command in a while pays for them.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from pkg_ext._internal.disk_cache import read_json_cache, write_json_cache
+from pkg_ext._internal.errors import RemoteURLNotFound
+from pkg_ext._internal.git_usage.url import read_remote_url
+
+logger = logging.getLogger(__name__)
+AUTHOR_ENV_VAR = "PKG_EXT_AUTHOR"
+IDENTITY_CACHE_FILENAME = "identity.json"
+IDENTITY_CACHE_TTL = timedelta(days=7)
+GH_TIMEOUT_SECONDS = 5.0
+DEFAULT_GH_HOST = "github.com"
+
+
+def _run_cmd(args: list[str], timeout: float) -> str | None:
+    """None when the command is missing, fails or times out (a sandboxed `gh` can hang on the network)."""
+    try:
+        result = subprocess.run(args, capture_output=True, text=True, timeout=timeout, check=False)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug(f"{args[0]} not usable for the author: {e!r}")
+        return None
+    return result.stdout.strip() or None if result.returncode == 0 else None
+
+
+def identity_cache_key(repo_path: Path) -> str:
+    gh_host = os.environ.get("GH_HOST", DEFAULT_GH_HOST)
+    try:
+        remote = read_remote_url(repo_path)
+    except RemoteURLNotFound:
+        remote = ""
+    return f"{gh_host}|{remote}"
+
+
+def _configured_author() -> str:
+    from pkg_ext._internal.config import load_user_config  # config imports the changelog actions
+
+    return os.environ.get(AUTHOR_ENV_VAR, "") or load_user_config().author
+
+
+def _identity_cache_path() -> Path:
+    from pkg_ext._internal.config import user_config_dir
+
+    return user_config_dir() / IDENTITY_CACHE_FILENAME
+
+
+def read_cached_identity(cache_path: Path, key: str, now: datetime) -> str | None:
+    raw = read_json_cache(cache_path)
+    entry = raw.get(key) if isinstance(raw, dict) else None
+    if not isinstance(entry, dict):
+        return None
+    try:
+        resolved_at = datetime.fromisoformat(entry["resolved_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if now - resolved_at > IDENTITY_CACHE_TTL:
+        return None
+    return entry.get("author") or None
+
+
+def write_cached_identity(cache_path: Path, key: str, author: str, now: datetime) -> None:
+    raw = read_json_cache(cache_path)
+    entries = raw if isinstance(raw, dict) else {}
+    entries[key] = {"author": author, "resolved_at": now.isoformat()}
+    try:
+        write_json_cache(cache_path, entries)
+    except OSError as e:
+        logger.debug(f"unable to write identity cache {cache_path}: {e!r}")
+
+
+def resolve_author(default: str, repo_path: Path | None = None, cache_path: Path | None = None) -> str:
+    if author := _configured_author():
+        return author
+    repo_path = repo_path or Path.cwd()
+    cache_path = cache_path or _identity_cache_path()
+    key = identity_cache_key(repo_path)
+    now = datetime.now(UTC)
+    if cached := read_cached_identity(cache_path, key, now):
+        return cached
+    author = _run_cmd(["gh", "api", "user", "--jq", ".login"], GH_TIMEOUT_SECONDS) or _run_cmd(
+        ["git", "config", "user.name"], GH_TIMEOUT_SECONDS
+    )
+    if not author:
+        return default
+    write_cached_identity(cache_path, key, author, now)
+    return author
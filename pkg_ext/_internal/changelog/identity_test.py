@@ -0,0 +1,56 @@
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pkg_ext._internal.changelog import identity
+from pkg_ext._internal.changelog.identity import (
+    AUTHOR_ENV_VAR,
+    IDENTITY_CACHE_TTL,
+    read_cached_identity,
+    resolve_author,
+    write_cached_identity,
+)
+
+
+def _patch_commands(monkeypatch, login: str | None) -> list[str]:
+    calls: list[str] = []
+
+    def run_cmd(args: list[str], timeout: float) -> str | None:
+        calls.append(args[0])
+        return login if args[0] == "gh" else None
+
+    monkeypatch.setattr(identity, "_run_cmd", run_cmd)
+    monkeypatch.setattr(identity, "_configured_author", lambda: "")
+    return calls
+
+
+def test_resolve_author_prefers_env_var(monkeypatch, tmp_path: Path):
+    calls: list[str] = []
+    monkeypatch.setattr(identity, "_run_cmd", lambda args, _: calls.append(args[0]))
+    monkeypatch.setenv(AUTHOR_ENV_VAR, "env-author")
+    assert resolve_author("UNSET", tmp_path, tmp_path / "identity.json") == "env-author"
+    assert calls == []
+
+
+def test_resolve_author_caches_across_calls_until_ttl(monkeypatch, tmp_path: Path):
+    cache_path = tmp_path / "identity.json"
+    calls = _patch_commands(monkeypatch, "gh-login")
+    assert resolve_author("UNSET", tmp_path, cache_path) == "gh-login"
+    assert resolve_author("UNSET", tmp_path, cache_path) == "gh-login"
+    assert calls == ["gh"]
+
+    key = identity.identity_cache_key(tmp_path)
+    now = datetime.now(UTC)
+    assert read_cached_identity(cache_path, key, now) == "gh-login"
+    assert read_cached_identity(cache_path, key, now + IDENTITY_CACHE_TTL * 2) is None
+    assert read_cached_identity(cache_path, "other-host|", now) is None
+    write_cached_identity(cache_path, key, "stale", now - IDENTITY_CACHE_TTL * 2)
+    assert resolve_author("UNSET", tmp_path, cache_path) == "gh-login"
+    assert calls == ["gh", "gh"]
+
+
+def test_resolve_author_falls_back_to_default_without_caching(monkeypatch, tmp_path: Path):
+    cache_path = tmp_path / "identity.json"
+    calls = _patch_commands(monkeypatch, None)
+    assert resolve_author("UNSET", tmp_path, cache_path) == "UNSET"
+    assert calls == ["gh", "git"]
+    assert not cache_path.exists()
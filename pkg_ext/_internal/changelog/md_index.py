@@ -0,0 +1,171 @@
+"""Byte offset index of the version headers in `CHANGELOG.md`.
+
+The index is stored in `changelog_md_index.json` in the cache dir, keyed by the changelog file name and validated by
+(mtime_ns, size). A missing or stale index is rebuilt with one streaming pass over the file. Sections are read with a
+seek and inserted by copying the unchanged prefix and suffix in chunks, the text functions in `write_changelog_md`
+remain the reference behavior and the fallback for files the index can't represent (`\\r` line endings).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Self
+
+from pkg_ext._internal.disk_cache import atomic_writer, ensure_cache_dir, read_json_cache, write_json_cache
+
+logger = logging.getLogger(__name__)
+CHANGELOG_MD_INDEX_FILENAME = "changelog_md_index.json"
+_HEADER_LINE = re.compile(rb"(?P<hashes>#{2,5})\s")
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class MdHeader:
+    start: int
+    end: int  # after the hashes and the whitespace, where the version starts
+    level: int
+    title: str
+
+    def matches(self, version: str) -> bool:
+        """Same semantics as `_header_regex.pattern + version`, the version is used as a regex prefix."""
+        return re.match(version, self.title) is not None
+
+    def shifted(self, delta: int) -> MdHeader:
+        return MdHeader(self.start + delta, self.end + delta, self.level, self.title)
+
+
+def scan_headers(lines: BinaryIO | list[bytes], offset: int = 0) -> list[MdHeader] | None:
+    """None when a line contains `\\r`, `read_text` would translate it and the offsets would no longer match."""
+    headers = []
+    for line in lines:
+        if b"\r" in line:
+            return None
+        if match := _HEADER_LINE.match(line):
+            title = line[match.end() :].removesuffix(b"\n").decode("utf-8", errors="replace")
+            headers.append(MdHeader(offset, offset + match.end(), len(match["hashes"]), title))
+        offset += len(line)
+    return headers
+
+
+def _copy_range(src: BinaryIO, dest: BinaryIO, length: int) -> None:
+    while length > 0:
+        chunk = src.read(min(length, _COPY_CHUNK_SIZE))
+        if not chunk:
+            break
+        dest.write(chunk)
+        length -= len(chunk)
+
+
+def _splice_file(path: Path, keep_until: int, inserted: bytes, resume_at: int) -> None:
+    """Atomically replace `path[keep_until:resume_at]` with `inserted`, the rest is streamed."""
+    with path.open("rb") as src, atomic_writer(path) as dest:
+        _copy_range(src, dest, keep_until)
+        dest.write(inserted)
+        src.seek(resume_at)
+        shutil.copyfileobj(src, dest, _COPY_CHUNK_SIZE)
+
+
+@dataclass
+class ChangelogMdIndex:
+    path: Path
+    size: int
+    mtime_ns: int
+    headers: list[MdHeader] = field(default_factory=list)
+
+    @classmethod
+    def scan(cls, path: Path) -> Self | None:
+        stat = path.stat()
+        with path.open("rb") as f:
+            headers = scan_headers(f)
+        if headers is None:
+            return None
+        return cls(path, stat.st_size, stat.st_mtime_ns, headers)
+
+    @classmethod
+    def load(cls, path: Path, cache_dir: Path | None) -> Self | None:
+        """None when the file can't be indexed, the caller should fall back to the text functions."""
+        if cache_dir is None:
+            return cls.scan(path)
+        stat = path.stat()
+        raw = read_json_cache(cache_dir / CHANGELOG_MD_INDEX_FILENAME)
+        entry = raw.get(path.name) if isinstance(raw, dict) else None
+        if isinstance(entry, dict) and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            try:
+                headers = [MdHeader(*header) for header in entry["headers"]]
+            except (KeyError, TypeError):
+                logger.debug(f"ignoring malformed index entry for {path.name}")
+            else:
+                return cls(path, stat.st_size, stat.st_mtime_ns, headers)
+        if index := cls.scan(path):
+            index.save(cache_dir)
+        return index
+
+    def save(self, cache_dir: Path | None) -> None:
+        if cache_dir is None:
+            return
+        index_path = cache_dir / CHANGELOG_MD_INDEX_FILENAME
+        raw = read_json_cache(index_path)
+        entries = raw if isinstance(raw, dict) else {}
+        entries[self.path.name] = {
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "headers": [[h.start, h.end, h.level, h.title] for h in self.headers],
+        }
+        ensure_cache_dir(cache_dir)
+        write_json_cache(index_path, entries)
+
+    def find(self, version: str) -> MdHeader | None:
+        return next((header for header in self.headers if header.matches(version)), None)
+
+    def header_level(self, version: str) -> int | None:
+        return header.level if (header := self.find(version)) else None
+
+    def read_section(self, new_version: str, old_version: str) -> str:
+        """See `read_changelog_section`, only the bytes of the section are read."""
+        if (new_header := self.find(new_version)) is None:
+            raise ValueError(f"unable to find {new_version} in changelog")
+        old_header = self.find(old_version) if old_version else None
+        end = old_header.start if old_header else self.size
+        with self.path.open("rb") as f:
+            f.seek(new_header.start)
+            section = f.read(max(end - new_header.start, 0)).decode("utf-8")
+        if old_header is None:
+            section = section[:-1]  # the text function slices with -1 when there is no older section
+        return section.strip() + "\n"
+
+    def insert_section(self, new_section: str, version: str) -> None:
+        """See `_add_changelog_section`, updates the file and the headers in place."""
+        inserted = new_section.encode("utf-8")
+        if existing := self.find(version):
+            end_header = next(
+                (h for h in self.headers if h.start >= existing.end and h.level == existing.level),
+                None,
+            )
+            keep_until, resume_at = existing.start, end_header.end if end_header else self.size
+        elif self.headers and self.headers[0].start:
+            inserted += b"\n\n"
+            keep_until = resume_at = self.headers[0].start
+        else:
+            keep_until = resume_at = self.size
+        _splice_file(self.path, keep_until, inserted, resume_at)
+        joins_at_line_start = keep_until == resume_at and inserted.endswith(b"\n") and keep_until in self._line_starts()
+        new_headers = scan_headers(inserted.splitlines(keepends=True), keep_until) if joins_at_line_start else None
+        if new_headers is not None:
+            before = [h for h in self.headers if h.start < keep_until]
+            after = [h.shifted(len(inserted)) for h in self.headers if h.start >= resume_at]
+            self.headers = before + new_headers + after
+        elif rescanned := self.scan(self.path):
+            self.headers = rescanned.headers
+        else:
+            self.headers, self.size = [], -1  # never matches the file, the next load falls back to the text scan
+            return
+        stat = self.path.stat()
+        self.size, self.mtime_ns = stat.st_size, stat.st_mtime_ns
+
+    def _line_starts(self) -> set[int]:
+        """Offsets known to start a line without reading the file: every header and the start of the file."""
+        return {0} | {header.start for header in self.headers}
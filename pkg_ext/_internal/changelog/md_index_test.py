@@ -0,0 +1,77 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from pkg_ext._internal.changelog.md_index import CHANGELOG_MD_INDEX_FILENAME, ChangelogMdIndex
+from pkg_ext._internal.changelog.write_changelog_md import (
+    _add_changelog_section,
+    add_changelog_md_section,
+    read_changelog_md_section,
+    read_changelog_section,
+)
+
+_CHANGELOG = """\
+# Changelog
+
+## 0.1.1 2025-10-18 21:13:06.12345+00:00
+
+### __Root__
+- fix: adds chosen file ✓ (GIT_SHA)
+
+
+## 0.1.0 2025-10-18 21:13:06.12345+00:00
+
+### Git_Inferred
+- New function inferred
+"""
+
+
+def _section(version: str) -> str:
+    return f"## {version} 2025-10-19\n\n### Core\n- New function `ü`\n"
+
+
+@pytest.mark.parametrize("version", ["0.2.0", "0.1.1", "0.1.0"])
+def test_add_section_matches_text_functions(tmp_path: Path, version: str):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text(_CHANGELOG)
+    path.chmod(0o644)
+    add_changelog_md_section(path, _section(version), version, tmp_path)
+    assert path.read_text() == _add_changelog_section(_CHANGELOG, _section(version), version)
+    assert path.stat().st_mode & 0o777 == 0o644
+    assert ChangelogMdIndex.load(path, tmp_path) == ChangelogMdIndex.scan(path)
+
+
+def test_read_section_matches_text_functions(tmp_path: Path):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text(_CHANGELOG)
+    add_changelog_md_section(path, _section("0.2.0"), "0.2.0", tmp_path)
+    content = path.read_text()
+    for old_version, new_version in [("0.1.1", "0.2.0"), ("0.1.0", "0.1.1"), ("", "0.1.0"), ("missing", "0.1.0")]:
+        expected = read_changelog_section(content, old_version, new_version)
+        assert read_changelog_md_section(path, old_version, new_version, tmp_path) == expected
+    with pytest.raises(ValueError):
+        read_changelog_md_section(path, "0.1.0", "9.9.9", tmp_path)
+
+
+def test_stale_index_is_rebuilt(tmp_path: Path):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text(_CHANGELOG)
+    assert ChangelogMdIndex.load(path, tmp_path)
+    assert (tmp_path / CHANGELOG_MD_INDEX_FILENAME).exists()
+    edited = _CHANGELOG.replace("# Changelog\n", "# Changelog\n\nManual edit\n")
+    path.write_text(edited)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert read_changelog_md_section(path, "0.1.0", "0.1.1", tmp_path) == read_changelog_section(
+        edited, "0.1.0", "0.1.1"
+    )
+
+
+def test_crlf_changelog_falls_back_to_text_scan(tmp_path: Path):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_bytes(_CHANGELOG.replace("\n", "\r\n").encode())
+    assert ChangelogMdIndex.load(path, tmp_path) is None
+    assert read_changelog_md_section(path, "0.1.0", "0.1.1", tmp_path) == read_changelog_section(
+        _CHANGELOG, "0.1.0", "0.1.1"
+    )
@@ -1,27 +1,64 @@
-from pkg_ext._internal.changelog.actions import (
-    ChangelogAction,
-    parse_changelog_actions,
-)
+import logging
+
+from pkg_ext._internal.changelog.actions import ChangelogAction
+from pkg_ext._internal.changelog.checkpoint import ChangelogCheckpoint, state_differences
+from pkg_ext._internal.changelog.store import ChangelogStore
+from pkg_ext._internal.errors import ChangelogCheckpointMismatchError
 from pkg_ext._internal.models import PkgCodeState, PublicGroups
 from pkg_ext._internal.pkg_state import PkgExtState
 from pkg_ext._internal.settings import PkgSettings
 
+logger = logging.getLogger(__name__)
 
-def parse_changelog(
-    settings: PkgSettings, code_state: PkgCodeState | None = None
-) -> tuple[PkgExtState, list[ChangelogAction]]:
-    changelog_path = settings.changelog_dir
-    changelog_path.mkdir(parents=True, exist_ok=True)
-    actions = parse_changelog_actions(changelog_path)
-    groups = settings.parse_computed_public_groups(PublicGroups)
+
+def _replay_all(settings: PkgSettings, store: ChangelogStore, groups: PublicGroups) -> PkgExtState:
     tool_state = PkgExtState(
         repo_root=settings.repo_root,
-        changelog_dir=changelog_path,
+        changelog_dir=settings.changelog_dir,
         pkg_path=settings.pkg_directory,
         groups=groups,
     )
-    for action in actions:
+    for action in store.all():
         tool_state.update_state(action)
+    return tool_state
+
+
+def _replay_from_checkpoint(
+    settings: PkgSettings, store: ChangelogStore, checkpoint: ChangelogCheckpoint, groups: PublicGroups
+) -> PkgExtState | None:
+    live_actions = store.live()
+    if not checkpoint.covers(live_actions):
+        logger.info("live changelog actions are older than the checkpoint, replaying all actions")
+        return None
+    if not settings.public_groups_path.exists():
+        groups = checkpoint.public_groups(groups.storage_path)
+    tool_state = checkpoint.tool_state(settings.repo_root, settings.changelog_dir, settings.pkg_directory, groups)
+    for action in live_actions:
+        tool_state.update_state(action)
+    return tool_state
+
+
+def parse_changelog(
+    settings: PkgSettings,
+    code_state: PkgCodeState | None = None,
+    store: ChangelogStore | None = None,
+) -> tuple[PkgExtState, list[ChangelogAction]]:
+    """Pass a `store` to reuse the parsed actions afterwards, the archives are only parsed without a checkpoint."""
+    store = store or settings.changelog_store()
+    changelog_path = settings.changelog_dir
+    changelog_path.mkdir(parents=True, exist_ok=True)
+    groups = settings.parse_computed_public_groups(PublicGroups)
+    checkpoint = ChangelogCheckpoint.load(changelog_path)
+    if checkpoint is None:
+        return _replay_all(settings, store, groups), []
+    unchanged_groups = groups.model_copy(deep=True, update={"storage_path": None})
+    tool_state = _replay_from_checkpoint(settings, store, checkpoint, groups)
+    if tool_state is None:
+        return _replay_all(settings, store, groups), []
+    if settings.verify_checkpoint:
+        if differences := state_differences(tool_state, _replay_all(settings, store, unchanged_groups)):
+            raise ChangelogCheckpointMismatchError(ChangelogCheckpoint.path(changelog_path), differences)
+        logger.info("changelog checkpoint matches a full replay")
     # Note: Group module tracking is now handled via GroupModuleAction in changelog
     # No extra actions needed - groups are updated when changelog is parsed
     return tool_state, []
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Sequence
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from ask_shell._internal.interactive import ChoiceTyped, select_dict, select_list_choice
@@ -14,6 +16,8 @@ if TYPE_CHECKING:
     from pkg_ext._internal.changelog.actions import ChangelogAction
 
 logger = logging.getLogger(__name__)
+PatchIdReader = Callable[[list[str]], dict[str, str]]
+MAX_LISTED_UNMATCHED = 20
 
 
 def find_stale_shas(fix_actions: list[FixAction], current_commits: list[GitCommit]) -> list[FixAction]:
@@ -21,25 +25,86 @@ def find_stale_shas(fix_actions: list[FixAction], current_commits: list[GitCommi
     return [a for a in fix_actions if a.short_sha not in current_shas]
 
 
-def match_by_message(stale_action: FixAction, current_commits: list[GitCommit]) -> GitCommit | None:
-    matches = [c for c in current_commits if c.message == stale_action.message]
-    if not matches:
+def normalize_message(message: str) -> str:
+    return " ".join(message.split())
+
+
+def first_message_line(message: str) -> str:
+    return normalize_message(message.strip().split("\n", 1)[0])
+
+
+def _closest_commit(candidates: list[GitCommit], stale_action: FixAction) -> GitCommit:
+    if len(candidates) == 1:
+        return candidates[0]
+    return min(candidates, key=lambda c: abs((c.ts - stale_action.ts).total_seconds()))
+
+
+@dataclass
+class CommitMessageIndex:
+    """Built once from `GitChanges.commits`, each stale action is then resolved with dict lookups.
+
+    Lookup order: normalized message, normalized first line and the `git patch-id` of the old commit.
+    Ties are broken by the commit closest in time to the action.
+    """
+
+    commits: list[GitCommit]
+    by_message: dict[str, list[GitCommit]] = field(init=False, default_factory=dict)
+    by_first_line: dict[str, list[GitCommit]] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        by_message: dict[str, list[GitCommit]] = defaultdict(list)
+        by_first_line: dict[str, list[GitCommit]] = defaultdict(list)
+        for commit in self.commits:
+            by_message[normalize_message(commit.message)].append(commit)
+            by_first_line[first_message_line(commit.message)].append(commit)
+        self.by_message = dict(by_message)
+        self.by_first_line = dict(by_first_line)
+
+    def match(self, stale_action: FixAction) -> GitCommit | None:
+        message = stale_action.message
+        if candidates := self.by_message.get(normalize_message(message)):
+            return _closest_commit(candidates, stale_action)
+        if candidates := self.by_first_line.get(first_message_line(message)):
+            return _closest_commit(candidates, stale_action)
         return None
-    if len(matches) == 1:
-        return matches[0]
-    return min(matches, key=lambda c: abs((c.ts - stale_action.ts).total_seconds()))
+
+    def match_by_patch_id(self, stale_actions: list[FixAction], read_patch_ids: PatchIdReader) -> dict[str, GitCommit]:
+        """Two git calls at most, the current commits are only read when an old commit still has a patch-id."""
+        stale_patch_ids = read_patch_ids([action.short_sha for action in stale_actions])
+        if not stale_patch_ids:
+            return {}
+        by_patch_id: dict[str, list[GitCommit]] = defaultdict(list)
+        commits_by_sha = {commit.sha: commit for commit in self.commits}
+        for sha, patch_id in read_patch_ids(list(commits_by_sha)).items():
+            by_patch_id[patch_id].append(commits_by_sha[sha])
+        matches: dict[str, GitCommit] = {}
+        for action in stale_actions:
+            if candidates := by_patch_id.get(stale_patch_ids.get(action.short_sha, "")):
+                matches[action.short_sha] = _closest_commit(candidates, action)
+        return matches
+
+
+def match_by_message(stale_action: FixAction, current_commits: list[GitCommit]) -> GitCommit | None:
+    return CommitMessageIndex(current_commits).match(stale_action)
 
 
 def build_sha_remap(
-    stale_actions: list[FixAction], current_commits: list[GitCommit]
+    stale_actions: list[FixAction],
+    current_commits: list[GitCommit] | CommitMessageIndex,
+    read_patch_ids: PatchIdReader | None = None,
 ) -> tuple[dict[str, str], list[FixAction]]:
+    index = current_commits if isinstance(current_commits, CommitMessageIndex) else CommitMessageIndex(current_commits)
     remap: dict[str, str] = {}
     unmatched: list[FixAction] = []
     for action in stale_actions:
-        if commit := match_by_message(action, current_commits):
+        if commit := index.match(action):
             remap[action.short_sha] = commit.sha
         else:
             unmatched.append(action)
+    if unmatched and read_patch_ids:
+        patch_matches = index.match_by_patch_id(unmatched, read_patch_ids)
+        remap |= {sha: commit.sha for sha, commit in patch_matches.items()}
+        unmatched = [action for action in unmatched if action.short_sha not in patch_matches]
     return remap, unmatched
 
 
@@ -74,3 +139,45 @@ def prompt_unmatched_fix(stale_action: FixAction, current_commits: list[GitCommi
         new_sha = select_list_choice("Pick replacement commit:", choices)
         return UnmatchedResolution.PICK_COMMIT, new_sha
     return resolution, ""
+
+
+class BatchResolution(StrEnum):
+    KEEP_ALL = "keep_all"
+    REMOVE_ALL = "remove_all"
+    ONE_BY_ONE = "one_by_one"
+
+
+def _unmatched_summary(unmatched: list[FixAction]) -> str:
+    lines = [f"  {a.short_sha}: {a.message} (group={a.name})" for a in unmatched[:MAX_LISTED_UNMATCHED]]
+    if (hidden := len(unmatched) - MAX_LISTED_UNMATCHED) > 0:
+        lines.append(f"  ... and {hidden} more")
+    return "\n".join(lines)
+
+
+def prompt_unmatched_fixes(
+    unmatched: list[FixAction], current_commits: list[GitCommit]
+) -> tuple[dict[str, str], set[str]]:
+    """One screen for all unmatched actions, resolving them one by one is opt-in.
+
+    Returns the picked replacement shas and the shas whose actions should be removed.
+    """
+    remap: dict[str, str] = {}
+    shas_to_remove: set[str] = set()
+    if not unmatched:
+        return remap, shas_to_remove
+    if len(unmatched) == 1:
+        choice = BatchResolution.ONE_BY_ONE
+    else:
+        prompt = f"{len(unmatched)} stale SHAs have no matching commit:\n{_unmatched_summary(unmatched)}\n"
+        choice = select_dict(prompt, {r: r for r in list(BatchResolution)}, default=BatchResolution.KEEP_ALL)
+    match choice:
+        case BatchResolution.REMOVE_ALL:
+            shas_to_remove.update(action.short_sha for action in unmatched)
+        case BatchResolution.ONE_BY_ONE:
+            for action in unmatched:
+                resolution, new_sha = prompt_unmatched_fix(action, current_commits)
+                if resolution == UnmatchedResolution.PICK_COMMIT:
+                    remap[action.short_sha] = new_sha
+                elif resolution == UnmatchedResolution.REMOVE_ENTRY:
+                    shas_to_remove.add(action.short_sha)
+    return remap, shas_to_remove
@@ -1,16 +1,20 @@
-from datetime import UTC, datetime
+import time
+from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
 from ask_shell._internal.interactive import select_dict, select_list_choice
 
 from pkg_ext._internal.changelog.actions import FixAction, KeepPrivateAction
 from pkg_ext._internal.changelog.rebase import (
+    BatchResolution,
+    CommitMessageIndex,
     UnmatchedResolution,
     apply_remap_to_actions,
     build_sha_remap,
     find_stale_shas,
     match_by_message,
     prompt_unmatched_fix,
+    prompt_unmatched_fixes,
     remove_actions_by_sha,
 )
 from pkg_ext._internal.git_usage.state import GitCommit
@@ -79,6 +83,45 @@ def test_build_sha_remap():
     assert unmatched[0].short_sha == "old222"
 
 
+def test_match_by_message_normalized_and_first_line():
+    commit = _commit("new111", "fix: wrapped   message\n\nbody after rebase")
+    index = CommitMessageIndex([commit])
+    assert index.match(_fix("old111", "fix: wrapped message\n\nbody after rebase")) == commit
+    assert index.match(_fix("old222", "fix: wrapped message\n\noriginal body")) == commit
+    assert index.match(_fix("old333", "fix: other")) is None
+
+
+def test_build_sha_remap_patch_id_fallback():
+    commits = [_commit("new111", "fix: reworded"), _commit("new222", "fix: B")]
+    stale = [_fix("old111", "fix: original wording"), _fix("old333", "fix: dropped")]
+    calls: list[list[str]] = []
+
+    def read_patch_ids(shas: list[str]) -> dict[str, str]:
+        calls.append(shas)
+        return {sha: "patch-1" for sha in shas if sha in {"old111", "new111"}}
+
+    remap, unmatched = build_sha_remap(stale, commits, read_patch_ids)
+    assert remap == {"old111": "new111"}
+    assert [a.short_sha for a in unmatched] == ["old333"]
+    assert calls == [["old111", "old333"], ["new111", "new222"]]
+
+
+def test_build_sha_remap_2k_commits_500_stale():
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    commits = [_commit(f"n{i:05d}", f"fix: change {i}\n\nbody {i}", start + timedelta(minutes=i)) for i in range(2000)]
+    stale = [
+        _fix(f"o{i:05d}", f"fix: change {i * 4}\n\nbody {i * 4}", start + timedelta(minutes=i * 4)) for i in range(500)
+    ]
+    stale.append(_fix("o99999", "fix: dropped in rebase"))
+    started = time.perf_counter()
+    remap, unmatched = build_sha_remap(stale, commits)
+    elapsed = time.perf_counter() - started
+    assert len(remap) == 500
+    assert remap["o00123"] == "n00492"
+    assert [a.short_sha for a in unmatched] == ["o99999"]
+    assert elapsed < 1.0, f"remap took {elapsed:.2f}s"
+
+
 def test_apply_remap_to_actions():
     actions = [_fix("aaa111", "fix: A"), _fix("bbb222", "fix: B")]
     count = apply_remap_to_actions(actions, {"aaa111": "ccc333"})
@@ -131,3 +174,16 @@ def test_prompt_unmatched_fix_remove():
         resolution, sha = prompt_unmatched_fix(action, [])
     assert resolution == UnmatchedResolution.REMOVE_ENTRY
     assert sha == ""
+
+
+def test_prompt_unmatched_fixes_single_screen():
+    module_name = prompt_unmatched_fixes.__module__
+    unmatched = [_fix(f"old{i:03d}", f"fix: gone {i}") for i in range(30)]
+    with patch(f"{module_name}.{select_dict.__name__}", return_value=BatchResolution.REMOVE_ALL) as select:
+        remap, shas_to_remove = prompt_unmatched_fixes(unmatched, [])
+    assert select.call_count == 1
+    assert "... and 10 more" in select.call_args.args[0]
+    assert remap == {}
+    assert shas_to_remove == {a.short_sha for a in unmatched}
+    with patch(f"{module_name}.{select_dict.__name__}", return_value=BatchResolution.KEEP_ALL):
+        assert prompt_unmatched_fixes(unmatched, []) == ({}, set())
@@ -0,0 +1,134 @@
+"""Scoped access to the `.changelog` directory.
+
+Each query reads only what it needs: `for_pr` a single file, `live` the unarchived files, `find_release` the file
+found through a text scan for release documents, and `all` adds the numbered archive subdirectories on first use.
+Results are memoized per store, create a new store (or call `clear`) after writing changelog files.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pkg_ext._internal.changelog.actions import (
+    ACTION_FILE_SPLIT,
+    ChangelogAction,
+    ReleaseAction,
+    archived_changelog_files,
+    changelog_archive_path,
+    changelog_filepath,
+    parse_changelog_actions,
+    parse_changelog_file_path,
+    parse_changelog_paths,
+    prune_changelog_action_cache,
+)
+
+_RELEASE_TYPE_LINE = re.compile(r"^type: release$", re.MULTILINE)
+_NAME_LINE = re.compile(r"^name: (?P<name>.+)$", re.MULTILINE)
+
+
+def release_versions_in_text(content: str) -> list[str]:
+    """Versions of the release documents in a changelog file without parsing the YAML.
+
+    Top level keys are never indented, so multi line values cannot produce false matches.
+    """
+    versions = []
+    for document in content.split(ACTION_FILE_SPLIT):
+        if _RELEASE_TYPE_LINE.search(document) and (match := _NAME_LINE.search(document)):
+            versions.append(match["name"].strip().strip("'\""))
+    return versions
+
+
+@dataclass
+class ChangelogStore:
+    changelog_dir: Path
+    cache_dir: Path | None = None
+    workers: int = 1
+    _live: list[ChangelogAction] | None = field(default=None, init=False, repr=False)
+    _archived: list[ChangelogAction] | None = field(default=None, init=False, repr=False)
+    _all: list[ChangelogAction] | None = field(default=None, init=False, repr=False)
+    _release_files: dict[str, Path] = field(default_factory=dict, init=False, repr=False)
+    _scanned_live: bool = field(default=False, init=False, repr=False)
+    _scanned_archived: bool = field(default=False, init=False, repr=False)
+
+    def clear(self) -> None:
+        self._live = self._archived = self._all = None
+        self._release_files = {}
+        self._scanned_live = self._scanned_archived = False
+
+    def pr_path(self, pr_number: int) -> Path:
+        """The live file, or the archived file when the PR has been archived."""
+        path = changelog_filepath(self.changelog_dir, pr_number)
+        if path.exists():
+            return path
+        archived = changelog_archive_path(path, self.changelog_dir.name)
+        return archived if archived.exists() else path
+
+    def for_pr(self, pr_number: int) -> list[ChangelogAction]:
+        path = self.pr_path(pr_number)
+        return parse_changelog_file_path(path) if path.exists() else []
+
+    def live(self) -> list[ChangelogAction]:
+        if self._live is None:
+            self._live = parse_changelog_actions(
+                self.changelog_dir, self.cache_dir, include_archived=False, workers=self.workers
+            )
+        return self._live
+
+    def archived(self) -> list[ChangelogAction]:
+        if self._archived is None:
+            paths = archived_changelog_files(self.changelog_dir)
+            self._archived = parse_changelog_paths(self.changelog_dir, paths, self.cache_dir, workers=self.workers)
+        return self._archived
+
+    def all(self) -> list[ChangelogAction]:
+        """The only query that knows every file, so it also prunes the action cache of archived or deleted files."""
+        if self._all is None:
+            self._all = sorted(self.archived() + self.live())
+            if self.cache_dir is not None:
+                paths = archived_changelog_files(self.changelog_dir) + sorted(self.changelog_dir.glob("*.yaml"))
+                prune_changelog_action_cache(self.changelog_dir, paths, self.cache_dir)
+        return self._all
+
+    def _scan_releases(self, *, archived: bool) -> None:
+        if archived:
+            if self._scanned_archived:
+                return
+            paths = archived_changelog_files(self.changelog_dir)
+            self._scanned_archived = True
+        else:
+            if self._scanned_live:
+                return
+            paths = sorted(self.changelog_dir.glob("*.yaml"), reverse=True)
+            self._scanned_live = True
+        for path in paths:
+            for version in release_versions_in_text(path.read_text()):
+                self._release_files.setdefault(version, path)
+
+    def release_path(self, version: str) -> Path | None:
+        """Live files are scanned first, the archives only when the version is not found there."""
+        if version not in self._release_files:
+            self._scan_releases(archived=False)
+        if version not in self._release_files:
+            self._scan_releases(archived=True)
+        return self._release_files.get(version)
+
+    def find_release(self, version: str) -> ReleaseAction | None:
+        if path := self.release_path(version):
+            for action in parse_changelog_file_path(path):
+                if isinstance(action, ReleaseAction) and action.name == version:
+                    return action
+        # the text scan only misses hand edited files, a full parse keeps the lookup exact
+        return next(
+            (action for action in self.all() if isinstance(action, ReleaseAction) and action.name == version),
+            None,
+        )
+
+    def releases(self) -> list[ReleaseAction]:
+        self._scan_releases(archived=False)
+        self._scan_releases(archived=True)
+        paths = sorted(set(self._release_files.values()))
+        return sorted(
+            action for path in paths for action in parse_changelog_file_path(path) if isinstance(action, ReleaseAction)
+        )
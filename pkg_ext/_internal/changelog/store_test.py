@@ -0,0 +1,102 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from pkg_ext._internal.changelog import actions as actions_mod
+from pkg_ext._internal.changelog import store as store_mod
+from pkg_ext._internal.changelog.action_cache import ChangelogActionCache, action_cache_fingerprint
+from pkg_ext._internal.changelog.actions import (
+    ChangelogAction,
+    FixAction,
+    MakePublicAction,
+    ReleaseAction,
+    _action_classes,
+    changelog_archive_path,
+    changelog_filepath,
+    dump_changelog_actions,
+    parse_changelog_actions,
+)
+from pkg_ext._internal.changelog.store import ChangelogStore, release_versions_in_text
+
+_START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _pr_actions(pr: int) -> list[ChangelogAction]:
+    common = {"ts": _START + timedelta(days=pr), "author": "test"}
+    return [
+        MakePublicAction(name=f"func_{pr}", group="core", full_path=f"_internal.func_{pr}", **common),
+        FixAction(name="core", group="core", short_sha=f"sha{pr:03d}", message="fix: it", **common),
+        ReleaseAction(name=f"0.{pr}.0", old_version=f"0.{pr - 1}.0", **common),
+    ]
+
+
+@pytest.fixture()
+def changelog_dir(tmp_path: Path) -> Path:
+    changelog_dir = tmp_path / ".changelog"
+    for pr in range(1, 5):
+        path = changelog_filepath(changelog_dir, pr)
+        if pr < 3:
+            path = changelog_archive_path(path, changelog_dir.name)
+        dump_changelog_actions(path, _pr_actions(pr))
+    return changelog_dir
+
+
+def _count_parsed(monkeypatch, changelog_dir: Path) -> list[str]:
+    parsed: list[str] = []
+    parse_file = actions_mod.parse_changelog_file_path
+
+    def parse_counting(path: Path):
+        parsed.append(str(path.relative_to(changelog_dir)))
+        return parse_file(path)
+
+    monkeypatch.setattr(actions_mod, "parse_changelog_file_path", parse_counting)
+    monkeypatch.setattr(store_mod, "parse_changelog_file_path", parse_counting)
+    return parsed
+
+
+def test_find_release_only_parses_the_release_file(changelog_dir: Path, monkeypatch):
+    store = ChangelogStore(changelog_dir)
+    parsed = _count_parsed(monkeypatch, changelog_dir)
+    release = store.find_release("0.4.0")
+    assert release is not None
+    assert (release.pr, release.old_version) == (4, "0.3.0")
+    assert parsed == ["004.yaml"]
+    assert not store._scanned_archived
+
+    release = store.find_release("0.1.0")
+    assert release is not None
+    assert release.pr == 1
+    assert parsed == ["004.yaml", "000/001.yaml"]
+    assert store.find_release("9.9.9") is None
+
+
+def test_store_scopes_match_full_parse(changelog_dir: Path):
+    store = ChangelogStore(changelog_dir)
+    assert [action.pr for action in store.live()] == [3, 3, 3, 4, 4, 4]
+    assert store.all() == parse_changelog_actions(changelog_dir)
+    assert [release.name for release in store.releases()] == ["0.1.0", "0.2.0", "0.3.0", "0.4.0"]
+    assert store.pr_path(1).relative_to(changelog_dir) == Path("000/001.yaml")
+    assert [action.name for action in store.for_pr(1)] == [action.name for action in sorted(_pr_actions(1))]
+    assert store.for_pr(99) == []
+
+
+def test_release_versions_in_text():
+    content = (
+        "name: '1.0'\nts: 2024-01-01T00:00:00Z\ntype: release\nold_version: '0.9'\n"
+        "---\nname: core\ntype: fix\nmessage: |\n  type: release\n  name: fake\n"
+        "---\nname: 1.1.0\ntype: release\nold_version: '1.0'\n"
+    )
+    assert release_versions_in_text(content) == ["1.0", "1.1.0"]
+
+
+def test_all_prunes_the_action_cache(changelog_dir: Path, tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    assert ChangelogStore(changelog_dir, cache_dir).all()
+    live_path = changelog_filepath(changelog_dir, 3)
+    live_path.rename(changelog_archive_path(live_path, changelog_dir.name))
+
+    store = ChangelogStore(changelog_dir, cache_dir)
+    assert store.all() == parse_changelog_actions(changelog_dir)
+    cache = ChangelogActionCache.load(cache_dir, action_cache_fingerprint(_action_classes))
+    assert sorted(cache.entries) == ["000/001.yaml", "000/002.yaml", "000/003.yaml", "004.yaml"]
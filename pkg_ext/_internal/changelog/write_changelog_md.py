@@ -21,6 +21,7 @@ from pkg_ext._internal.changelog.actions import (
     RenameAction,
     StabilityTarget,
 )
+from pkg_ext._internal.changelog.md_index import ChangelogMdIndex
 from pkg_ext._internal.context import pkg_ctx
 from pkg_ext._internal.errors import NoPublicGroupMatch
 from pkg_ext._internal.models import PublicGroup
@@ -69,6 +70,20 @@ def _add_changelog_section(old_content: str, new_section: str, version: str) ->
     return old_content + new_section
 
 
+def read_changelog_md_section(path: Path, old_version: str, new_version: str, cache_dir: Path | None = None) -> str:
+    if index := ChangelogMdIndex.load(path, cache_dir):
+        return index.read_section(new_version, old_version)
+    return read_changelog_section(path.read_text(), old_version, new_version)
+
+
+def add_changelog_md_section(path: Path, new_section: str, version: str, cache_dir: Path | None = None) -> None:
+    if index := ChangelogMdIndex.load(path, cache_dir):
+        index.insert_section(new_section, version)
+        index.save(cache_dir)
+    else:
+        path.write_text(_add_changelog_section(path.read_text(), new_section, version))
+
+
 def _commit_url(remote_url: str, sha: str) -> str:
     if remote_url:
         url = f"{remote_url}/commit/{sha}"
@@ -124,10 +139,14 @@ def as_changelog_line(action: ChangelogAction, remote_url: str, ctx: pkg_ctx) ->
     return ""
 
 
-def _get_section_header_level(path: Path, version: str):
+def _get_section_header_level(path: Path, version: str, cache_dir: Path | None = None):
     section_header_level = 2
     if path.exists():
-        if current_header_level := _header_level(path.read_text(), version):
+        if index := ChangelogMdIndex.load(path, cache_dir):
+            current_header_level = index.header_level(version)
+        else:
+            current_header_level = _header_level(path.read_text(), version)
+        if current_header_level:
             section_header_level = current_header_level
     return section_header_level
 
@@ -154,7 +173,8 @@ def _create_changelog_content(
     remote_url = git_changes.remote_url
     group_sections, other_sections = _group_changelog_entries(ctx, actions, remote_url)
     changelog_md: list[str] = []
-    root_prefix = "#" * _get_section_header_level(ctx.settings.changelog_md, old_version)
+    settings = ctx.settings
+    root_prefix = "#" * _get_section_header_level(settings.changelog_md, old_version, settings.active_cache_dir)
 
     def add_section(header: str, lines: list[str], *, header_level=1) -> None:
         header_prefix = root_prefix + header_level * "#"
@@ -190,6 +210,5 @@ def write_changelog_md(ctx: pkg_ctx) -> Path:
     path = ctx.settings.changelog_md
     if not path.exists():
         ensure_parents_write_text(path, "# Changelog\n\n")
-    new_content = _add_changelog_section(path.read_text(), "\n".join(changelog_md), new_version)
-    path.write_text(new_content)
+    add_changelog_md_section(path, "\n".join(changelog_md), new_version, settings.active_cache_dir)
     return path
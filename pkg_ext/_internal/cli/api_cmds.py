@@ -1,4 +1,4 @@
-"""API inspection and comparison commands: dump_api, diff_api."""
+"""API inspection and comparison commands: dump_api, diff_api, usages."""
 
 import logging
 from pathlib import Path
@@ -8,8 +8,8 @@ from model_lib import dump, parse
 from zero_3rdparty.file_utils import ensure_parents_write_text
 
 from pkg_ext._internal import api_diff
-from pkg_ext._internal.cli.options import option_dev_mode, option_output_file
-from pkg_ext._internal.cli.workflows import create_api_dump, write_api_dump
+from pkg_ext._internal.cli.options import option_dev_mode, option_output_file, option_static_dump
+from pkg_ext._internal.cli.workflows import create_api_dump, find_symbol_usages, write_api_dump
 from pkg_ext._internal.git_usage import git_show_file
 from pkg_ext._internal.models.api_dump import PublicApiDump
 from pkg_ext._internal.settings import PkgSettings
@@ -21,13 +21,17 @@ def dump_api(
     ctx: typer.Context,
     output: Path | None = option_output_file,
     dev: bool = option_dev_mode,
+    static: bool = option_static_dump,
 ):
     """Dump public API to YAML for diffing and breaking change detection."""
     settings: PkgSettings = ctx.obj
+    if static and output is None and not dev:
+        logger.error("--static can't write the baseline, diff-api compares it with a runtime dump. Use --dev or -o")
+        raise typer.Exit(1)
     if output is None:
-        write_api_dump(settings, dev_mode=dev)
+        write_api_dump(settings, dev_mode=dev, static=static)
     else:
-        api_dump = create_api_dump(settings)
+        api_dump = create_api_dump(settings, static=static)
         yaml_text = dump.dump_as_str(api_dump.model_dump(exclude_none=True), "yaml")
         ensure_parents_write_text(output, yaml_text)
         logger.info(f"API dump written to {output}")
@@ -63,3 +67,21 @@ def diff_api(
 
     results = api_diff.compare_api_dumps(baseline, dev_dump)
     typer.echo(api_diff.format_diff_results(results))
+
+
+def usages(
+    ctx: typer.Context,
+    symbol: str = typer.Argument(..., help="Full id (my_pkg.mod.func), local id (mod.func) or short name (func)"),
+):
+    """List the files importing a symbol, served from the local usage index."""
+    settings: PkgSettings = ctx.obj
+    matches = find_symbol_usages(settings, symbol)
+    if not matches:
+        typer.echo(f"No usages found for {symbol}")
+        return
+    for match in matches:
+        typer.echo(match.symbol)
+        for rel_path in match.src_usages:
+            typer.echo(f"  src  {rel_path}")
+        for rel_path in match.test_usages:
+            typer.echo(f"  test {rel_path}")
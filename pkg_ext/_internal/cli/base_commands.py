@@ -70,6 +70,24 @@ def main(
         envvar="PKG_EXT_TAG_PREFIX",
         help="{tag_prefix}{version} used in the git tag",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        envvar="PKG_EXT_NO_CACHE",
+        help="Ignore and skip writing the local parse cache",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        envvar="PKG_EXT_INCREMENTAL",
+        help="Only re-parse files changed (git diff/status) since the last snapshot",
+    ),
+    verify_checkpoint: bool = typer.Option(
+        False,
+        "--verify-checkpoint",
+        envvar="PKG_EXT_VERIFY_CHECKPOINT",
+        help="Replay all changelog actions and fail if the changelog checkpoint is out of sync",
+    ),
 ):  # sourcery skip: raise-from-previous-error
     if ctx.invoked_subcommand is None:
         typer.echo(ctx.get_help())
@@ -97,20 +115,24 @@ def main(
         pkg_path=pkg_path_str,
         skip_open_in_editor=skip_open,
         tag_prefix=tag_prefix,
+        use_cache=not no_cache,
+        incremental=incremental,
+        verify_checkpoint=verify_checkpoint,
     )
 
 
 # Register commands from other modules (imports must be after app creation to avoid circular imports)
-from pkg_ext._internal.cli.api_cmds import diff_api, dump_api  # noqa: E402
+from pkg_ext._internal.cli.api_cmds import diff_api, dump_api, usages  # noqa: E402
 from pkg_ext._internal.cli.changelog_cmds import chore, promote, release_notes  # noqa: E402
 from pkg_ext._internal.cli.example_cmds import check_examples, gen_example_prompt  # noqa: E402
 from pkg_ext._internal.cli.gen_cmds import gen_docs  # noqa: E402
 from pkg_ext._internal.cli.stability_cmds import dep, exp, ga  # noqa: E402
-from pkg_ext._internal.cli.workflow_cmds import change_base, post_merge, pre_change, pre_commit  # noqa: E402
+from pkg_ext._internal.cli.workflow_cmds import change_base, post_merge, pre_change, pre_commit, watch  # noqa: E402
 
 app.command()(post_merge)
 app.command()(pre_change)
 app.command()(pre_commit)
+app.command()(watch)
 app.command(name="change-base")(change_base)
 app.command()(chore)
 app.command()(promote)
@@ -120,6 +142,7 @@ app.command()(dep)
 app.command(name="docs")(gen_docs)
 app.command()(dump_api)
 app.command()(diff_api)
+app.command()(usages)
 app.command()(release_notes)
 app.command()(gen_example_prompt)
 app.command()(check_examples)
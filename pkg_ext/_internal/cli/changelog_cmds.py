@@ -7,14 +7,14 @@ import typer
 from zero_3rdparty.file_utils import ensure_parents_write_text
 
 from pkg_ext._internal.changelog import (
+    ChangelogStore,
     ChoreAction,
     ReleaseAction,
+    append_changelog_actions,
     changelog_filepath,
-    dump_changelog_actions,
-    parse_changelog_actions,
     parse_changelog_file_path,
 )
-from pkg_ext._internal.changelog.write_changelog_md import read_changelog_section
+from pkg_ext._internal.changelog.write_changelog_md import read_changelog_md_section
 from pkg_ext._internal.cli.workflows import (
     GenerateApiInput,
     create_ctx,
@@ -36,7 +36,7 @@ def _create_chore_action(settings: PkgSettings, pr_number: int, description: str
     changelog_path = changelog_filepath(settings.changelog_dir, pr_number)
     existing = parse_changelog_file_path(changelog_path) if changelog_path.exists() else []
     action = ChoreAction(description=description)
-    dump_changelog_actions(changelog_path, existing + [action])
+    append_changelog_actions(changelog_path, existing, [action])
     logger.info(f"Created chore action in {changelog_path.name}: {description}")
 
 
@@ -109,13 +109,13 @@ def promote(
         logger.info("No symbols promoted")
 
 
-def find_release_action(changelog_dir: Path, version: str) -> ReleaseAction:
-    for changelog_action in parse_changelog_actions(changelog_dir):
-        if isinstance(changelog_action, ReleaseAction) and changelog_action.name == version:
-            pr = changelog_action.pr
-            assert pr, f"found changelog action: {changelog_action} but pr missing"
-            return changelog_action
-    raise ValueError(f"couldn't find a release for {version}")
+def find_release_action(changelog_dir: Path, version: str, cache_dir: Path | None = None) -> ReleaseAction:
+    """Only parses the file holding the release, found through the release index of `ChangelogStore`."""
+    changelog_action = ChangelogStore(changelog_dir, cache_dir).find_release(version)
+    if changelog_action is None:
+        raise ValueError(f"couldn't find a release for {version}")
+    assert changelog_action.pr, f"found changelog action: {changelog_action} but pr missing"
+    return changelog_action
 
 
 def release_notes(
@@ -124,11 +124,12 @@ def release_notes(
 ):
     settings: PkgSettings = ctx.obj
     version = tag_name.removeprefix(settings.tag_prefix)
-    action = find_release_action(settings.changelog_dir, version)
-    content = read_changelog_section(
-        settings.changelog_md.read_text(),
+    action = find_release_action(settings.changelog_dir, version, settings.active_cache_dir)
+    content = read_changelog_md_section(
+        settings.changelog_md,
         old_version=action.old_version,
         new_version=action.name,
+        cache_dir=settings.active_cache_dir,
     )
     output_file = settings.repo_root / f"dist/{tag_name}.changelog.md"
     ensure_parents_write_text(output_file, content)
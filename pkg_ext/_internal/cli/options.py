@@ -34,6 +34,11 @@ option_skip_docs = typer.Option(False, "--skip-docs", help="Skip doc regeneratio
 option_skip_clean = typer.Option(False, "--skip-clean", help="Skip cleaning old entries")
 option_skip_dirty_check = typer.Option(False, "--skip-dirty-check", help="Skip dirty file check (for tests)")
 option_dev_mode = typer.Option(False, "--dev", help="Write to -dev file (gitignored for local comparison)")
+option_static_dump = typer.Option(
+    False,
+    "--static",
+    help="Read signatures from the source (AST) instead of importing the package",
+)
 option_skip_fix_commits = typer.Option(False, "--skip-fix-commits", help="Skip prompts for fix commits in git history")
 option_full = typer.Option(
     False,
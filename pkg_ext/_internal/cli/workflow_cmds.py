@@ -1,4 +1,4 @@
-"""Git workflow commands: pre_change, pre_commit, post_merge, change_base."""
+"""Git workflow commands: pre_change, pre_commit, post_merge, change_base, watch."""
 
 import logging
 from pathlib import Path
@@ -7,7 +7,7 @@ import typer
 from git import InvalidGitRepositoryError, Repo
 
 from pkg_ext._internal import api_dumper
-from pkg_ext._internal.changelog import changelog_filepath, parse_changelog_actions
+from pkg_ext._internal.changelog import changelog_filepath
 from pkg_ext._internal.changelog.change_base import (
     consolidate_changelog_files,
     find_changelog_files_in_diff,
@@ -42,12 +42,14 @@ from pkg_ext._internal.cli.workflows import (
     write_api_dump,
 )
 from pkg_ext._internal.config import load_project_config
+from pkg_ext._internal.context import pkg_ctx
 from pkg_ext._internal.generation import docs, docs_mkdocs
 from pkg_ext._internal.git_usage import GitSince, find_pr_info_or_none, head_merge_pr
 from pkg_ext._internal.models import PublicGroups
 from pkg_ext._internal.settings import PkgSettings
 from pkg_ext._internal.signature_parser import doc_repr_context
 from pkg_ext._internal.version_bump import read_current_version
+from pkg_ext._internal.watch import DEFAULT_DEBOUNCE_SECONDS, WatchSession, watch_changes
 
 logger = logging.getLogger(__name__)
 
@@ -90,15 +92,18 @@ def generate_docs_for_pkg(
     settings: PkgSettings,
     output_dir: Path | None = None,
     filter_group: str | None = None,
+    *,
+    filter_groups: set[str] | None = None,
+    stability_ctx: pkg_ctx | None = None,
 ) -> int:
-    pkg_ctx = create_stability_ctx(settings)
+    pkg_ctx = stability_ctx or create_stability_ctx(settings)
     groups = settings.parse_computed_public_groups(PublicGroups)
     version = str(read_current_version(pkg_ctx))
     refs = {ref.local_id: ref for ref in pkg_ctx.code_state.import_id_refs.values()}
     with doc_repr_context(settings.pkg_directory, settings.repo_root):
         api_dump = api_dumper.dump_public_api(groups, refs, settings.pkg_import_name, version)
     config = load_project_config(settings.state_dir)
-    changelog_actions = parse_changelog_actions(settings.changelog_dir)
+    changelog_actions = (pkg_ctx.changelog_store or settings.changelog_store()).all()
     docs_dir = output_dir or settings.docs_dir
 
     output = docs.generate_docs(
@@ -109,8 +114,10 @@ def generate_docs_for_pkg(
         pkg_src_dir=settings.repo_root,
     )
     if filter_group:
-        dir_name = docs.group_dir_name(api_dump.get_group(filter_group))
-        output.path_contents = {k: v for k, v in output.path_contents.items() if k.startswith(dir_name)}
+        filter_groups = (filter_groups or set()) | {filter_group}
+    if filter_groups is not None:
+        dir_names = tuple(docs.group_dir_name(api_dump.get_group(name)) for name in sorted(filter_groups))
+        output.path_contents = {k: v for k, v in output.path_contents.items() if k.startswith(dir_names)}
     docs_mkdocs.copy_readme_as_index(
         settings.state_dir,
         docs_dir,
@@ -306,3 +313,26 @@ def change_base(
     consolidate_changelog_files(target, foreign)
     stems = ", ".join(f.stem for f in foreign)
     logger.info(f"Consolidated {len(foreign)} changelog files into {target.name}: {stems}")
+
+
+def watch(
+    ctx: typer.Context,
+    debounce: float = typer.Option(
+        DEFAULT_DEBOUNCE_SECONDS, "--debounce", help="Seconds without new saves before a cycle starts"
+    ),
+    force_polling: bool = typer.Option(False, "--poll", help="Poll file mtimes even when watchfiles is installed"),
+    skip_docs: bool = option_skip_docs,
+):
+    """Regenerate package modules and docs of the affected groups on every save.
+
+    `__init__.py` and the group modules are rewritten in place, only CHANGELOG.md and the public groups file get the
+    -dev suffix.
+    """
+    settings: PkgSettings = ctx.obj
+    settings.dev_mode = True
+    session = WatchSession(settings, skip_docs=skip_docs)
+    logger.info(f"watching {settings.pkg_directory} (ctrl+c to stop)")
+    try:
+        session.run(watch_changes(session.roots, debounce, force_polling))
+    except KeyboardInterrupt:
+        logger.info("stopped watching")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
 from typing import Self
 
@@ -14,21 +15,25 @@ from pydantic import model_validator
 from zero_3rdparty.file_utils import ensure_parents_write_text, iter_paths_and_relative
 
 from pkg_ext._internal import api_diff, api_dumper, py_format
+from pkg_ext._internal.api_dumper_static import StaticSymbolDumper
 from pkg_ext._internal.changelog import (
     AdditionalChangeAction,
     BreakingChangeAction,
     ReleaseAction,
+    append_changelog_actions,
     changelog_filepath,
     dump_changelog_actions,
     parse_changelog_file_path,
 )
 from pkg_ext._internal.changelog.actions import archive_old_actions
+from pkg_ext._internal.changelog.checkpoint import write_changelog_checkpoint
 from pkg_ext._internal.changelog.committer import add_git_changes
 from pkg_ext._internal.changelog.parser import parse_changelog
 from pkg_ext._internal.changelog.write_changelog_md import write_changelog_md
+from pkg_ext._internal.code_snapshot import CodeSnapshot, parse_incremental
 from pkg_ext._internal.context import pkg_ctx
 from pkg_ext._internal.errors import NoHumanRequiredError
-from pkg_ext._internal.file_parser import parse_code_symbols, parse_symbols
+from pkg_ext._internal.file_parser import ParsedFile, parse_code_symbols, parse_symbols_many
 from pkg_ext._internal.generation import update_pyproject_toml, write_groups, write_init
 from pkg_ext._internal.git_usage import (
     GitChanges,
@@ -39,10 +44,13 @@ from pkg_ext._internal.git_usage import (
     git_commit,
 )
 from pkg_ext._internal.models import PkgCodeState, PublicGroups
-from pkg_ext._internal.models.api_dump import PublicApiDump
+from pkg_ext._internal.models.api_dump import STATIC_API_DUMP_ENGINE, PublicApiDump
+from pkg_ext._internal.parse_cache import ParseCache, parse_cache_fingerprint
 from pkg_ext._internal.reference_handling import handle_added_refs, handle_removed_refs
 from pkg_ext._internal.settings import PkgSettings
 from pkg_ext._internal.signature_parser import doc_repr_context
+from pkg_ext._internal.task_graph import Task, run_task_graph
+from pkg_ext._internal.usage_index import USAGE_INDEX_FILENAME, SymbolUsages, UsageIndex
 from pkg_ext._internal.version_bump import bump_version, read_current_version
 from pkg_ext._internal.warnings_gen import write_warnings_module
 
@@ -75,18 +83,47 @@ class GenerateApiInput(Entity):
         return self.settings.is_bot
 
 
-def parse_pkg_code_state(settings: PkgSettings) -> PkgCodeState:
+def _parse_pkg_files(settings: PkgSettings) -> tuple[list[tuple[str, ParsedFile | None]], UsageIndex]:
     pkg_py_files = list(iter_paths_and_relative(settings.pkg_directory, "*.py", only_files=True))
     pkg_import_name = settings.pkg_import_name
 
-    def is_generated(py_text: str) -> bool:
-        return py_text.startswith(settings.file_header)
+    def parse_many(files: list[tuple[Path, str]]) -> list[ParsedFile | None]:
+        return parse_symbols_many(files, pkg_import_name, settings.file_header, workers=settings.parse_workers)
+
+    fingerprint = parse_cache_fingerprint(pkg_import_name, settings.file_header)
+    if settings.use_cache:
+        cache = ParseCache.load(settings.cache_dir, fingerprint)
+
+        def cached_parse_many(files: list[tuple[Path, str]]) -> list[ParsedFile | None]:
+            return cache.parse_many(files, pkg_import_name, parse_many)
+
+        parsed_files = None
+        if settings.incremental:
+            snapshot = CodeSnapshot.load(settings.cache_dir, fingerprint)
+            parsed_files = parse_incremental(
+                settings.repo_root, settings.pkg_directory, pkg_py_files, pkg_import_name, snapshot, cached_parse_many
+            )
+        if parsed_files is None:
+            parsed_files = cached_parse_many(pkg_py_files)
+        cache.prune({rel_path for _, rel_path in pkg_py_files})
+        cache.save()
+        logger.info(f"parse cache: {cache.stats}")
+        usage_index = UsageIndex.load(settings.cache_dir, fingerprint)
+    else:
+        parsed_files = parse_many(pkg_py_files)
+        usage_index = UsageIndex(path=settings.cache_dir / USAGE_INDEX_FILENAME, fingerprint=fingerprint)
+    rel_path_parsed = [(rel_path, parsed) for (_, rel_path), parsed in zip(pkg_py_files, parsed_files, strict=True)]
+    if updated := usage_index.update(rel_path_parsed):
+        logger.debug(f"usage index updated for {updated} files")
+    if settings.use_cache:
+        usage_index.save()
+    return rel_path_parsed, usage_index
 
-    files = sorted(
-        parsed
-        for path, rel_path in pkg_py_files
-        if (parsed := parse_symbols(path, rel_path, pkg_import_name, is_generated=is_generated))
-    )
+
+def parse_pkg_code_state(settings: PkgSettings) -> PkgCodeState:
+    pkg_import_name = settings.pkg_import_name
+    parsed_files, _ = _parse_pkg_files(settings)
+    files = sorted(parsed for _, parsed in parsed_files if parsed)
 
     import_id_symbols = parse_code_symbols(files, pkg_import_name, ignored_symbols=settings.ignored_symbols)
     return PkgCodeState(
@@ -96,21 +133,55 @@ def parse_pkg_code_state(settings: PkgSettings) -> PkgCodeState:
     )
 
 
+def reparse_pkg_code_state(settings: PkgSettings, code_state: PkgCodeState, changed: set[Path]) -> PkgCodeState:
+    """`code_state` with only the `changed` package files parsed again, deleted files are dropped.
+
+    Same result as `parse_pkg_code_state`, the usages are rebuilt over all files because they span modules.
+    """
+    pkg_dir = settings.pkg_directory
+    changed_rel_paths = {
+        str(path.relative_to(pkg_dir)) for path in changed if path.suffix == ".py" and path.is_relative_to(pkg_dir)
+    }
+    to_parse = [
+        (pkg_dir / rel_path, rel_path) for rel_path in sorted(changed_rel_paths) if (pkg_dir / rel_path).is_file()
+    ]
+    parsed = parse_symbols_many(to_parse, settings.pkg_import_name, settings.file_header)
+    kept = [file for file in code_state.files if file.relative_path not in changed_rel_paths]
+    files = sorted([*kept, *(file for file in parsed if file)], key=lambda file: file.relative_path)
+    import_id_symbols = parse_code_symbols(files, settings.pkg_import_name, ignored_symbols=settings.ignored_symbols)
+    return PkgCodeState(pkg_import_name=settings.pkg_import_name, import_id_refs=import_id_symbols, files=files)
+
+
+def find_symbol_usages(settings: PkgSettings, symbol: str) -> list[SymbolUsages]:
+    """Files importing `symbol`, which can be a full id, a local id or a short name (can match multiple symbols)."""
+    _, usage_index = _parse_pkg_files(settings)
+    return usage_index.usages(symbol, settings.pkg_import_name)
+
+
 def create_ctx(api_input: GenerateApiInput) -> pkg_ctx:
     settings = api_input.settings
     exit_stack = ExitStack()
     if api_input.is_bot:
         exit_stack.enter_context(raise_on_question(raise_error=NoHumanRequiredError))
     with exit_stack:
-        code_state = parse_pkg_code_state(settings)
-        tool_state, extra_actions = parse_changelog(settings, code_state)
-        tool_state.reconcile_with_code(code_state.import_id_refs)
-
+        store = settings.changelog_store()
         git_changes_input = GitChangesInput(
             repo_path=settings.repo_root,
             since=api_input.git_changes_since,
+            cache_dir=settings.active_cache_dir,
+        )
+        results = run_task_graph(
+            "create-ctx",
+            [
+                Task("code_state", partial(parse_pkg_code_state, settings)),
+                Task("changelog", partial(parse_changelog, settings, store=store)),
+                Task("git_changes", partial(find_git_changes, git_changes_input)),
+            ],
         )
-        git_changes = find_git_changes(git_changes_input)
+        code_state: PkgCodeState = results["code_state"]
+        tool_state, extra_actions = results["changelog"]
+        git_changes = results["git_changes"]
+        tool_state.reconcile_with_code(code_state.import_id_refs)
         return pkg_ctx(
             settings=settings,
             tool_state=tool_state,
@@ -118,6 +189,7 @@ def create_ctx(api_input: GenerateApiInput) -> pkg_ctx:
             git_changes=git_changes,
             _actions=extra_actions,
             explicit_pr=api_input.explicit_pr,
+            changelog_store=store,
         )
 
 
@@ -139,13 +211,16 @@ def update_changelog_entries(api_input: GenerateApiInput) -> pkg_ctx | None:
     return ctx
 
 
-def write_generated_modules(ctx: pkg_ctx, version: str) -> None:
-    """Write group modules, __init__.py, warnings module, and .groups.yaml."""
+def write_generated_modules(ctx: pkg_ctx, version: str, group_names: set[str] | None = None) -> None:
+    """Write group modules, __init__.py, warnings module, and .groups.yaml.
+
+    `group_names` limits the rewritten group modules, the other files depend on all groups and are always written.
+    """
     settings = ctx.settings
     generated_py_paths: list[Path] = []
     if warnings_path := write_warnings_module(settings, ctx.tool_state):
         generated_py_paths.append(warnings_path)
-    generated_py_paths.extend(write_groups(ctx))
+    generated_py_paths.extend(write_groups(ctx, group_names))
     generated_py_paths.append(write_init(ctx, version))
     py_format.format_python_files(generated_py_paths, settings.format_command)
     ctx.tool_state.groups.write()
@@ -186,7 +261,7 @@ def create_release_action(
     ):
         raise ValueError(f"pr has already been released: {release_action!r}")
     release_action = ReleaseAction(name=new_version, old_version=old_version)
-    return dump_changelog_actions(changelog_pr_path, old_actions + [release_action])
+    return append_changelog_actions(changelog_pr_path, old_actions, [release_action])
 
 
 def post_merge_commit_workflow(
@@ -213,16 +288,21 @@ def generate_api_workflow(api_input: GenerateApiInput) -> pkg_ctx | None:
 
 
 def clean_old_entries(settings: PkgSettings):
-    archive_old_actions(
+    archived = archive_old_actions(
         settings.changelog_dir,
         settings.changelog_cleanup_count,
         settings.changelog_keep_count,
     )
+    if archived and (
+        path := write_changelog_checkpoint(settings.repo_root, settings.changelog_dir, settings.pkg_directory)
+    ):
+        logger.info(f"wrote changelog checkpoint @ {path}")
 
 
 def create_stability_ctx(settings: PkgSettings) -> pkg_ctx:
     code_state = parse_pkg_code_state(settings)
-    tool_state, extra_actions = parse_changelog(settings, code_state)
+    store = settings.changelog_store()
+    tool_state, extra_actions = parse_changelog(settings, code_state, store)
     tool_state.reconcile_with_code(code_state.import_id_refs)
 
     return pkg_ctx(
@@ -231,20 +311,24 @@ def create_stability_ctx(settings: PkgSettings) -> pkg_ctx:
         code_state=code_state,
         git_changes=GitChanges.empty(),
         _actions=extra_actions,
+        changelog_store=store,
     )
 
 
-def create_api_dump(settings: PkgSettings):
+def create_api_dump(settings: PkgSettings, static: bool = False):
+    """`static` reads the symbols from the source without importing the package, see `api_dumper_static`."""
     pkg_ctx = create_stability_ctx(settings)
     groups = settings.parse_computed_public_groups(PublicGroups)
     version = str(read_current_version(pkg_ctx))
     refs = {ref.local_id: ref for ref in pkg_ctx.code_state.import_id_refs.values()}
+    symbol_dumper = StaticSymbolDumper(settings.pkg_directory) if static else api_dumper.dump_symbol
+    engine = STATIC_API_DUMP_ENGINE if static else None
     with doc_repr_context(settings.pkg_directory, settings.repo_root):
-        return api_dumper.dump_public_api(groups, refs, settings.pkg_import_name, version)
+        return api_dumper.dump_public_api(groups, refs, settings.pkg_import_name, version, symbol_dumper, engine)
 
 
-def write_api_dump(settings: PkgSettings, dev_mode: bool = False) -> Path:
-    api_dump = create_api_dump(settings)
+def write_api_dump(settings: PkgSettings, dev_mode: bool = False, static: bool = False) -> Path:
+    api_dump = create_api_dump(settings, static=static)
     output = settings.api_dump_dev_path if dev_mode else settings.api_dump_baseline_path
     yaml_text = dump.dump_as_str(api_dump.model_dump(exclude_none=True), "yaml")
     ensure_parents_write_text(output, yaml_text)
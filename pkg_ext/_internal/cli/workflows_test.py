@@ -1,7 +1,14 @@
 from datetime import UTC, datetime
 
-from pkg_ext._internal.changelog import DeleteAction, KeepPrivateAction, MakePublicAction
+import pytest
+from model_lib import dump
+from zero_3rdparty.file_utils import ensure_parents_write_text
+
+from pkg_ext._internal.changelog import DeleteAction, KeepPrivateAction, MakePublicAction, changelog_filepath
+from pkg_ext._internal.cli.workflows import run_api_diff
+from pkg_ext._internal.errors import ApiDumpEngineMismatchError
 from pkg_ext._internal.models import PublicGroups, RefSymbol, SymbolType
+from pkg_ext._internal.models.api_dump import STATIC_API_DUMP_ENGINE, GlobalVarDump, GroupDump, PublicApiDump
 from pkg_ext._internal.pkg_state import PkgExtState
 
 
@@ -96,3 +103,30 @@ def test_make_public_then_keep_private_removes(tmp_path):
     group = state.groups.name_to_group.get("my_group")
     assert group is not None
     assert ref.local_id not in group.owned_refs
+
+
+def _write_api_dump(settings, path, annotation: str, engine: str | None = None) -> None:
+    var = GlobalVarDump(name="MODE", module_path="my_pkg.consts", annotation=annotation)
+    api_dump = PublicApiDump(
+        pkg_import_name="my_pkg",
+        version="0.1.0",
+        groups=[GroupDump(name="consts", symbols=[var])],
+        dumped_at=datetime.now(UTC),
+        engine=engine,
+    )
+    ensure_parents_write_text(path, dump.dump_as_str(api_dump.model_dump(exclude_none=True), "yaml"))
+
+
+def test_run_api_diff_refuses_static_baseline(settings):
+    # the static engine renders some annotations differently, a cross engine diff reports bogus changes
+    _write_api_dump(settings, settings.api_dump_baseline_path, "Literal[SymbolType.CLASS]", STATIC_API_DUMP_ENGINE)
+    _write_api_dump(settings, settings.api_dump_dev_path, "Literal['class']")
+    with pytest.raises(ApiDumpEngineMismatchError):
+        run_api_diff(settings, pr_number=1)
+    assert not changelog_filepath(settings.changelog_dir, 1).exists()
+
+
+def test_run_api_diff_same_engine(settings):
+    _write_api_dump(settings, settings.api_dump_baseline_path, "Literal[SymbolType.CLASS]", STATIC_API_DUMP_ENGINE)
+    _write_api_dump(settings, settings.api_dump_dev_path, "Literal['class']", STATIC_API_DUMP_ENGINE)
+    assert run_api_diff(settings)
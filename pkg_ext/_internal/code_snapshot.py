@@ -0,0 +1,122 @@
+"""Code state snapshot keyed by the HEAD commit for `--incremental` runs.
+
+The snapshot stores the parse result of every package file together with the commit sha and the files that were
+dirty when it was written. The next run only re-parses files that `git diff <sha>` or `git status` reports,
+files that were dirty at snapshot time and files missing from the snapshot. Files git doesn't track (gitignored
+`.py` files in the package) are invisible to both commands, they are always passed to `parse_many`, so the parse
+cache decides by mtime and size like a full parse.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Self
+
+from pkg_ext._internal.disk_cache import ensure_cache_dir, read_json_cache, write_json_cache
+from pkg_ext._internal.file_parser import ParsedFile, parsed_file_as_dict, parsed_file_from_dict
+from pkg_ext._internal.git_usage import git_changed_paths_since, git_dirty_paths, git_head_sha, git_tracked_paths
+
+logger = logging.getLogger(__name__)
+CODE_SNAPSHOT_FILENAME = "code_snapshot.json"
+
+
+def _pkg_rel_paths(repo_paths: set[str], repo_root: Path, pkg_directory: Path) -> set[str]:
+    rel_paths = set()
+    for repo_path in repo_paths:
+        path = repo_root / repo_path
+        if path.is_relative_to(pkg_directory):
+            rel_paths.add(str(path.relative_to(pkg_directory)))
+    return rel_paths
+
+
+@dataclass
+class CodeSnapshot:
+    path: Path
+    fingerprint: str
+    head_sha: str = ""
+    dirty: set[str] = field(default_factory=set)
+    files: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, cache_dir: Path, fingerprint: str) -> Self:
+        path = cache_dir / CODE_SNAPSHOT_FILENAME
+        raw = read_json_cache(path)
+        if not isinstance(raw, dict) or raw.get("fingerprint") != fingerprint:
+            return cls(path=path, fingerprint=fingerprint)
+        return cls(
+            path=path,
+            fingerprint=fingerprint,
+            head_sha=raw["head_sha"],
+            dirty=set(raw["dirty"]),
+            files=raw["files"],
+        )
+
+    def save(self) -> None:
+        ensure_cache_dir(self.path.parent)
+        write_json_cache(
+            self.path,
+            {
+                "fingerprint": self.fingerprint,
+                "head_sha": self.head_sha,
+                "dirty": sorted(self.dirty),
+                "files": self.files,
+            },
+        )
+
+
+def parse_incremental(
+    repo_root: Path,
+    pkg_directory: Path,
+    pkg_py_files: list[tuple[Path, str]],
+    pkg_import_name: str,
+    snapshot: CodeSnapshot,
+    parse_many: Callable[[list[tuple[Path, str]]], list[ParsedFile | None]],
+) -> list[ParsedFile | None] | None:
+    """Returns None outside a git repository, the caller must do a full parse.
+
+    Without a usable snapshot (first run, unknown sha after a rebase, changed fingerprint) every file is passed to
+    `parse_many`, so it should be backed by the content hash cache.
+    """
+    head_sha = git_head_sha(repo_root)
+    dirty_repo_paths = git_dirty_paths(repo_root, pkg_directory)
+    tracked_repo_paths = git_tracked_paths(repo_root, pkg_directory)
+    if head_sha is None or dirty_repo_paths is None or tracked_repo_paths is None:
+        logger.info("incremental parse disabled: not a git repository with commits")
+        return None
+    stale: set[str] | None = None
+    if snapshot.head_sha:
+        if changed := git_changed_paths_since(repo_root, snapshot.head_sha, pkg_directory):
+            stale = _pkg_rel_paths(changed, repo_root, pkg_directory)
+        elif changed is not None:
+            stale = set()
+    dirty = _pkg_rel_paths(dirty_repo_paths, repo_root, pkg_directory)
+    if stale is None:
+        logger.info("incremental parse: no usable snapshot, parsing all files")
+        stale = {rel_path for _, rel_path in pkg_py_files}
+    tracked = _pkg_rel_paths(tracked_repo_paths, repo_root, pkg_directory)
+    stale |= dirty | snapshot.dirty | {rel_path for _, rel_path in pkg_py_files if rel_path not in tracked}
+
+    to_parse = [
+        (path, rel_path) for path, rel_path in pkg_py_files if rel_path in stale or rel_path not in snapshot.files
+    ]
+    logger.info(
+        f"incremental parse: {len(to_parse)}/{len(pkg_py_files)} files changed since {snapshot.head_sha[:6] or '-'}"
+    )
+    parsed_changed = dict(zip((rel_path for _, rel_path in to_parse), parse_many(to_parse), strict=True))
+    results: list[ParsedFile | None] = []
+    files: dict[str, dict[str, Any]] = {}
+    for path, rel_path in pkg_py_files:
+        if rel_path in parsed_changed:
+            parsed = parsed_changed[rel_path]
+            files[rel_path] = parsed_file_as_dict(parsed)
+        else:
+            files[rel_path] = snapshot.files[rel_path]
+            parsed = parsed_file_from_dict(files[rel_path], path, rel_path, pkg_import_name)
+        results.append(parsed)
+    snapshot.head_sha = head_sha
+    snapshot.dirty = dirty
+    snapshot.files = files
+    snapshot.save()
+    return results
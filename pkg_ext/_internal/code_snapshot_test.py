@@ -0,0 +1,108 @@
+from pathlib import Path
+
+from git import Actor, Repo
+from zero_3rdparty.file_utils import iter_paths_and_relative
+
+from pkg_ext._internal.cli.workflows import parse_pkg_code_state
+from pkg_ext._internal.code_snapshot import CodeSnapshot, parse_incremental
+from pkg_ext._internal.file_parser import ParsedFile, parse_symbols
+from pkg_ext._internal.settings import PkgSettings
+
+_AUTHOR = Actor("test", "test@example.com")
+
+
+def _commit_all(repo: Repo, message: str) -> None:
+    repo.git.add(A=True)
+    repo.index.commit(message, author=_AUTHOR, committer=_AUTHOR)
+
+
+class _CountingParser:
+    def __init__(self):
+        self.parsed: list[str] = []
+
+    def __call__(self, files: list[tuple[Path, str]]) -> list[ParsedFile | None]:
+        self.parsed.extend(rel_path for _, rel_path in files)
+        return [parse_symbols(path, rel_path, "my_pkg") for path, rel_path in files]
+
+
+def _parse(settings: PkgSettings) -> list[str]:
+    parser = _CountingParser()
+    files = list(iter_paths_and_relative(settings.pkg_directory, "*.py", only_files=True))
+    snapshot = CodeSnapshot.load(settings.cache_dir, "fingerprint")
+    results = parse_incremental(settings.repo_root, settings.pkg_directory, files, "my_pkg", snapshot, parser)
+    assert results is not None
+    assert len(results) == len(files)
+    return sorted(parser.parsed)
+
+
+def test_parse_incremental_only_parses_git_changes(settings: PkgSettings):
+    pkg_dir = settings.pkg_directory
+    for name in ["a", "b", "c", "d"]:
+        (pkg_dir / f"{name}.py").write_text(f"def {name}(): ...\n")
+    repo = Repo.init(settings.repo_root)
+    _commit_all(repo, "initial")
+    assert _parse(settings) == ["__init__.py", "a.py", "b.py", "c.py", "d.py"]
+    assert _parse(settings) == []
+
+    (pkg_dir / "a.py").write_text("def a2(): ...\n")
+    _commit_all(repo, "change a")
+    (pkg_dir / "b.py").write_text("def b2(): ...\n")
+    (pkg_dir / "e.py").write_text("def e(): ...\n")
+    (pkg_dir / "d.py").unlink()
+    assert _parse(settings) == ["a.py", "b.py", "e.py"]
+
+    (pkg_dir / "b.py").write_text("def b(): ...\n")  # reverted, but the snapshot has the dirty parse
+    assert _parse(settings) == ["b.py", "e.py"]
+    assert _parse(settings) == ["e.py"]  # still untracked
+
+
+def test_parse_incremental_unknown_sha_parses_all(settings: PkgSettings):
+    (settings.pkg_directory / "a.py").write_text("def a(): ...\n")
+    _commit_all(Repo.init(settings.repo_root), "initial")
+    assert _parse(settings) == ["__init__.py", "a.py"]
+    snapshot = CodeSnapshot.load(settings.cache_dir, "fingerprint")
+    snapshot.head_sha = "0" * 40
+    snapshot.save()
+    assert _parse(settings) == ["__init__.py", "a.py"]
+
+
+def test_parse_incremental_outside_git_repo(settings: PkgSettings):
+    snapshot = CodeSnapshot.load(settings.cache_dir, "fingerprint")
+    files = list(iter_paths_and_relative(settings.pkg_directory, "*.py", only_files=True))
+    assert (
+        parse_incremental(settings.repo_root, settings.pkg_directory, files, "my_pkg", snapshot, _CountingParser())
+        is None
+    )
+
+
+def test_incremental_code_state_matches_full_parse(settings: PkgSettings):
+    pkg_dir = settings.pkg_directory
+    (pkg_dir / "core.py").write_text("def helper(): ...\n")
+    (pkg_dir / "api.py").write_text("from my_pkg.core import helper\n\ndef public(): ...\n")
+    repo = Repo.init(settings.repo_root)
+    _commit_all(repo, "initial")
+    settings.incremental = True
+    parse_pkg_code_state(settings)
+    (pkg_dir / "cli.py").write_text("from my_pkg.api import public\n\ndef run(): ...\n")
+    incremental = parse_pkg_code_state(settings)
+    settings.incremental = False
+    settings.use_cache = False
+    full = parse_pkg_code_state(settings)
+    assert incremental.import_id_refs == full.import_id_refs
+    assert incremental.import_id_refs["my_pkg.api.public"].src_usages == ["cli.py"]
+    assert [file.relative_path for file in incremental.files] == [file.relative_path for file in full.files]
+
+
+def test_parse_incremental_always_passes_ignored_files(settings: PkgSettings):
+    pkg_dir = settings.pkg_directory
+    (pkg_dir / "a.py").write_text("def a(): ...\n")
+    (pkg_dir / "local_settings.py").write_text("def local(): ...\n")
+    (settings.repo_root / ".gitignore").write_text("local_settings.py\n")
+    _commit_all(Repo.init(settings.repo_root), "initial")
+    assert _parse(settings) == ["__init__.py", "a.py", "local_settings.py"]
+    assert _parse(settings) == ["local_settings.py"]  # the parse cache decides in production
+
+    settings.incremental = True
+    parse_pkg_code_state(settings)
+    (pkg_dir / "local_settings.py").write_text("def local2(): ...\n")
+    assert "my_pkg.local_settings.local2" in parse_pkg_code_state(settings).import_id_refs
@@ -32,6 +32,7 @@ class UserConfig:
 
     editor: str = "cursor"  # fallback to $EDITOR env var
     skip_open_in_editor: bool = False
+    author: str = ""  # skips `gh api user` when set, PKG_EXT_AUTHOR takes precedence
 
 
 class Stability(StrEnum):
@@ -82,6 +83,7 @@ class ProjectConfig(Entity):
     DEFAULT_FILE_HEADER: ClassVar[str] = f"# Generated by {PKG_EXT_TOOL_NAME}"
     DEFAULT_FORMAT_COMMAND: ClassVar[tuple[str, ...]] = ("ruff", "format")
     DEFAULT_BRANCH: ClassVar[str] = "main"
+    DEFAULT_PARSE_WORKERS: ClassVar[int] = 0
 
     tag_prefix: str = ""
     default_branch: str = DEFAULT_BRANCH
@@ -96,6 +98,7 @@ class ProjectConfig(Entity):
     mkdocs_skip_sections: tuple[str, ...] = ()
     format_command: tuple[str, ...] = DEFAULT_FORMAT_COMMAND
     max_bump_type: MaxBumpLiteral | None = None
+    parse_workers: int = Field(default=DEFAULT_PARSE_WORKERS, ge=0)
     groups: dict[str, GroupConfig] = Field(default_factory=dict)
 
     def get_max_bump(self) -> BumpType | None:
@@ -142,15 +145,20 @@ def _safe_load_toml(path: Path) -> dict[str, Any]:
         return {}
 
 
+def user_config_dir() -> Path:
+    return Path.home() / ".config" / "pkg-ext"
+
+
 def load_user_config() -> UserConfig:
     """Load user configuration from ~/.config/pkg-ext/config.toml."""
-    config_path = Path.home() / ".config" / "pkg-ext" / "config.toml"
+    config_path = user_config_dir() / "config.toml"
     data = _safe_load_toml(config_path)
 
     user_data = data.get("user", {})
     return UserConfig(
         editor=user_data.get("editor", UserConfig.editor),
         skip_open_in_editor=user_data.get("skip_open_in_editor", UserConfig.skip_open_in_editor),
+        author=user_data.get("author", UserConfig.author),
     )
 
 
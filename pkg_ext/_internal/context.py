@@ -6,7 +6,9 @@ from pathlib import Path
 from pkg_ext._internal.changelog import (
     ChangelogAction,
     ChangelogActionBase,
+    ChangelogStore,
     action_group,
+    append_changelog_actions,
     changelog_filepath,
     default_changelog_path,
     dump_changelog_actions,
@@ -37,9 +39,12 @@ class pkg_ctx:
     git_changes: GitChanges
     run_state: RunState = field(default_factory=RunState)
     explicit_pr: int = 0
+    changelog_store: ChangelogStore | None = None
 
     _actions: list[ChangelogAction] = field(default_factory=list)
     _actions_dumped: bool = True
+    _persisted_count: int = 0  # `_actions[:_persisted_count]` are on disk
+    _actions_modified: bool = False  # set when persisted actions are changed or removed, forces a full dump
 
     @property
     def changelog_path(self) -> Path:
@@ -51,14 +56,18 @@ class pkg_ctx:
         path = self.changelog_path
         default_path = default_changelog_path(changelog_dir)
         dump_to_disk = False
+        persisted: list[ChangelogAction] = []
         if default_path.exists() and path != default_path:
-            self._actions.extend(parse_changelog_file_path(default_path))
+            persisted.extend(parse_changelog_file_path(default_path))
             default_path.unlink()
             dump_to_disk = True
         if path.exists():
-            self._actions.extend(parse_changelog_file_path(path))
+            persisted.extend(parse_changelog_file_path(path))
+        self._actions[:0] = persisted
+        self._persisted_count = len(persisted)
         if dump_to_disk:
             dump_changelog_actions(path, self._actions)
+            self._persisted_count = len(self._actions)
 
     def add_versions(self, old_version: str, new_version: str):
         self.run_state.old_version = old_version
@@ -84,5 +93,14 @@ class pkg_ctx:
 
     def __exit__(self, *_):
         self._actions_dumped = True
-        if actions := self._actions:
-            dump_changelog_actions(self.changelog_path, actions)
+        actions = self._actions
+        persisted, new = actions[: self._persisted_count], actions[self._persisted_count :]
+        if actions and (self._actions_modified or new):
+            if self._actions_modified:
+                dump_changelog_actions(self.changelog_path, actions)
+            else:
+                append_changelog_actions(self.changelog_path, persisted, new)
+            if self.changelog_store:
+                self.changelog_store.clear()
+        self._persisted_count = len(actions)
+        self._actions_modified = False
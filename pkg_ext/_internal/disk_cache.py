@@ -0,0 +1,90 @@
+"""Helpers for the local, git-ignored cache directory and atomic file writes."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO
+
+logger = logging.getLogger(__name__)
+_GITIGNORE_CONTENT = "# Created by pkg-ext, safe to delete\n*\n"
+
+
+def ensure_cache_dir(path: Path) -> Path:
+    """Create the cache dir with a `.gitignore` so cache files never show up in `git status`."""
+    path.mkdir(parents=True, exist_ok=True)
+    gitignore = path / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text(_GITIGNORE_CONTENT)
+    return path
+
+
+def _read_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_NEW_FILE_MODE = 0o666 & ~_read_umask()  # read once, `os.umask` is process wide and writes run on threads
+
+
+@contextmanager
+def atomic_writer(path: Path) -> Iterator[BinaryIO]:
+    """Yields a temp file in the same directory that is renamed over `path` when the block succeeds.
+
+    The temp file gets the mode of the existing file (or the umask default for a new one), `mkstemp` creates it
+    with 0600 and committed files like `.changelog/*.yaml` must stay readable for others.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = _NEW_FILE_MODE
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    """Write to a temp file in the same directory and rename it over `path`."""
+    with atomic_writer(path) as f:
+        f.write(content)
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    """Atomic write that leaves the file (and its mtime) alone when the content is unchanged."""
+    content = text.encode("utf-8")
+    if path.exists() and path.read_bytes() == content:
+        return False
+    atomic_write_bytes(path, content)
+    return True
+
+
+def read_json_cache(path: Path) -> Any | None:
+    """Returns None when the cache file is missing or unreadable, a corrupt cache is never an error."""
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_bytes())
+    except (OSError, ValueError) as e:
+        logger.warning(f"ignoring unreadable cache file {path}: {e!r}")
+        return None
+
+
+def write_json_cache(path: Path, data: Any) -> None:
+    atomic_write_bytes(path, json.dumps(data, separators=(",", ":")).encode("utf-8"))
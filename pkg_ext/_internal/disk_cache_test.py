@@ -0,0 +1,23 @@
+import os
+import stat
+from pathlib import Path
+
+from pkg_ext._internal.disk_cache import atomic_write_bytes, write_text_if_changed
+
+
+def test_atomic_write_keeps_the_file_mode(tmp_path: Path):
+    path = tmp_path / "001.yaml"
+    path.write_text("old")
+    path.chmod(0o644)
+    assert write_text_if_changed(path, "new")
+    assert path.read_text() == "new"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+
+def test_atomic_write_new_file_gets_the_default_mode(tmp_path: Path):
+    path = tmp_path / "changelog" / "new.yaml"
+    atomic_write_bytes(path, b"content")
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+    assert [p.name for p in path.parent.iterdir()] == ["new.yaml"]
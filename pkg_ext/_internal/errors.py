@@ -47,3 +47,23 @@ class NoHumanRequiredError(Exception):
 class PRFromCommitsNotFoundError(Exception):
     def __init__(self, *args: object) -> None:
         super().__init__(*args)
+
+
+class ApiDumpEngineMismatchError(Exception):
+    def __init__(self, baseline_engine: str | None, dev_engine: str | None):
+        self.baseline_engine = baseline_engine
+        self.dev_engine = dev_engine
+        super().__init__(
+            f"api dumps from different engines can't be compared: baseline={baseline_engine or 'runtime'}, "
+            f"dev={dev_engine or 'runtime'}. Regenerate the baseline with `dump-api` (without --static)"
+        )
+
+
+class ChangelogCheckpointMismatchError(Exception):
+    def __init__(self, path: Path, fields: list[str]):
+        self.path = path
+        self.fields = fields
+        super().__init__(
+            f"changelog checkpoint @ {path} differs from a full replay in: {', '.join(fields)}. "
+            "Delete it to replay all actions"
+        )
@@ -1,8 +1,10 @@
 import ast
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
 from zero_3rdparty.iter_utils import flat_map
 
@@ -14,8 +16,12 @@ from pkg_ext._internal.models import (
     is_test_file,
     ref_id,
 )
+from pkg_ext._internal.task_graph import process_pool_context
 
 logger = logging.getLogger(__name__)
+ParsedFile = PkgSrcFile | PkgTestFile
+PARALLEL_PARSE_MIN_FILES = 32
+_SRC_LIST_FIELDS = ("type_aliases", "global_vars", "functions", "classes", "exceptions")
 
 
 @dataclass
@@ -158,6 +164,84 @@ def parse_symbols(
     )
 
 
+def parsed_file_as_dict(parsed: ParsedFile | None) -> dict[str, Any]:
+    """Compact, json/pickle friendly form of a `parse_symbols` result."""
+    if parsed is None:
+        return {"kind": "skip"}
+    data: dict[str, Any] = {"local_imports": sorted(parsed.local_imports)}
+    if isinstance(parsed, PkgTestFile):
+        data["kind"] = "test"
+        return data
+    data["kind"] = "src"
+    for name in _SRC_LIST_FIELDS:
+        data[name] = getattr(parsed, name)
+    return data
+
+
+def parsed_file_from_dict(data: dict[str, Any], path: Path, rel_path: str, pkg_import_name: str) -> ParsedFile | None:
+    match data["kind"]:
+        case "skip":
+            return None
+        case "test":
+            return PkgTestFile(
+                path=path,
+                relative_path=rel_path,
+                pkg_import_name=pkg_import_name,
+                local_imports=set(data["local_imports"]),
+            )
+        case _:
+            return PkgSrcFile(
+                path=path,
+                relative_path=rel_path,
+                pkg_import_name=pkg_import_name,
+                local_imports=set(data["local_imports"]),
+                **{name: data[name] for name in _SRC_LIST_FIELDS},
+            )
+
+
+def _parse_symbols_compact(path: Path, rel_path: str, pkg_import_name: str, file_header: str) -> dict[str, Any]:
+    """Worker entrypoint, only the compact dict crosses the process boundary."""
+    parsed = parse_symbols(path, rel_path, pkg_import_name, is_generated=lambda text: text.startswith(file_header))
+    return parsed_file_as_dict(parsed)
+
+
+def resolve_parse_workers(workers: int) -> int:
+    """0 means one worker per cpu."""
+    return workers if workers > 0 else os.cpu_count() or 1
+
+
+def parse_symbols_many(
+    files: list[tuple[Path, str]],
+    pkg_import_name: str,
+    file_header: str,
+    workers: int = 1,
+) -> list[ParsedFile | None]:
+    """Parse files in order, using a process pool when `workers` > 1 and there are enough files to amortize it."""
+    workers = min(resolve_parse_workers(workers), len(files))
+    if workers <= 1 or len(files) < PARALLEL_PARSE_MIN_FILES:
+        return [
+            parse_symbols(path, rel_path, pkg_import_name, is_generated=lambda text: text.startswith(file_header))
+            for path, rel_path in files
+        ]
+    paths = [path for path, _ in files]
+    rel_paths = [rel_path for _, rel_path in files]
+    chunksize = max(1, len(files) // (workers * 4))
+    logger.debug(f"parsing {len(files)} files with {workers} workers (chunksize={chunksize})")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=process_pool_context()) as executor:
+        compact = executor.map(
+            _parse_symbols_compact,
+            paths,
+            rel_paths,
+            [pkg_import_name] * len(files),
+            [file_header] * len(files),
+            chunksize=chunksize,
+        )
+        return [
+            parsed_file_from_dict(data, path, rel_path, pkg_import_name)
+            for data, path, rel_path in zip(compact, paths, rel_paths, strict=True)
+        ]
+
+
 def parse_code_symbols(
     parsed_files: list[PkgSrcFile | PkgTestFile],
     pkg_import_name: str,
@@ -196,4 +280,5 @@ def parse_code_symbols(
 __all__ = [
     "parse_code_symbols",
     "parse_symbols",
+    "parse_symbols_many",
 ]
@@ -10,7 +10,6 @@ from pathlib import Path
 from model_lib import Entity
 from zero_3rdparty.sections import slug, wrap_section
 
-from pkg_ext._internal.changelog import actions as changelog_actions_mod
 from pkg_ext._internal.changelog.actions import ChangelogAction
 from pkg_ext._internal.config import (
     PKG_EXT_TOOL_NAME,
@@ -24,10 +23,7 @@ from pkg_ext._internal.generation.docs_render import (
     render_inline_symbol,
     render_symbol_page,
 )
-from pkg_ext._internal.generation.docs_version import (
-    MEANINGFUL_CHANGE_ACTIONS,
-    build_symbol_changes,
-)
+from pkg_ext._internal.generation.docs_version import ChangelogIndex
 from pkg_ext._internal.models.api_dump import ClassDump, GroupDump, PublicApiDump, SymbolDump
 
 logger = logging.getLogger(__name__)
@@ -71,14 +67,9 @@ def has_env_vars(symbol: SymbolDump) -> bool:
 def build_symbol_context(
     symbol: SymbolDump,
     group_name: str,
-    changelog_actions: list[ChangelogAction],
+    changelog_actions: ChangelogIndex | Sequence[ChangelogAction],
 ) -> SymbolContext:
-    has_changes = any(
-        action.name == symbol.name
-        and isinstance(action, MEANINGFUL_CHANGE_ACTIONS)
-        and ((ag := changelog_actions_mod.action_group(action)) is None or ag == group_name)
-        for action in changelog_actions
-    )
+    has_changes = ChangelogIndex.ensure(changelog_actions).has_meaningful_changes(symbol.name, group_name)
     is_primary = symbol.name.lower() == group_name.lower()
     return SymbolContext(
         symbol=symbol,
@@ -118,7 +109,7 @@ def render_group_index(
     group: GroupDump,
     contexts: list[SymbolContext],
     group_config: GroupConfig,
-    changelog_actions: Sequence[ChangelogAction] | None = None,
+    changelog_actions: ChangelogIndex | Sequence[ChangelogAction] | None = None,
     *,
     docs_dir: Path | None = None,
     pkg_src_dir: Path | None = None,
@@ -142,15 +133,15 @@ def render_group_index(
 
     examples_set = set(group_config.examples_include)
     inline_sections = []
-    changelog_actions_list = list(changelog_actions) if changelog_actions else []
+    changelog = ChangelogIndex.ensure(changelog_actions)
     for ctx in sorted_contexts:
         if not ctx.needs_own_page:
             section_id = f"{slug(ctx.symbol.name)}_def"
-            symbol_changes = build_symbol_changes(ctx.symbol.name, changelog_actions_list, ctx.group_name)
+            symbol_changes = changelog.symbol_changes(ctx.symbol.name, ctx.group_name)
             example_link = _build_example_link(ctx.symbol.name, group.name, examples_set, examples_dir, "../examples/")
             inline_content = render_inline_symbol(
                 ctx,
-                changelog_actions,
+                changelog,
                 symbol_changes,
                 symbol_doc_path=index_path,
                 pkg_src_dir=pkg_src_dir,
@@ -197,18 +188,19 @@ def generate_docs(
     pkg_import_name = api_dump.pkg_import_name
 
     examples_dir = docs_dir / "examples" if docs_dir else None
+    changelog = ChangelogIndex.build(changelog_actions)
 
     for group in api_dump.groups:
         dir_name = group_dir_name(group)
         group_config = config.groups.get(group.name, GroupConfig())
         examples_set = set(group_config.examples_include)
-        contexts = [build_symbol_context(s, group.name, changelog_actions) for s in group.symbols]
+        contexts = [build_symbol_context(s, group.name, changelog) for s in group.symbols]
         index_path = f"{dir_name}/index.md"
         path_contents[index_path] = render_group_index(
             group,
             contexts,
             group_config,
-            changelog_actions,
+            changelog,
             docs_dir=docs_dir,
             pkg_src_dir=pkg_src_dir,
             pkg_import_name=pkg_import_name,
@@ -219,7 +211,7 @@ def generate_docs(
                 symbol_path = f"{dir_name}/{ctx.page_filename}"
                 if docs_dir and pkg_src_dir:
                     symbol_doc_path = docs_dir / symbol_path
-                    symbol_changes = build_symbol_changes(ctx.symbol.name, changelog_actions, ctx.group_name)
+                    symbol_changes = changelog.symbol_changes(ctx.symbol.name, ctx.group_name)
                     example_link = _build_example_link(
                         ctx.symbol.name, group.name, examples_set, examples_dir, "../examples/"
                     )
@@ -230,7 +222,7 @@ def generate_docs(
                         pkg_src_dir,
                         pkg_import_name,
                         changes=symbol_changes,
-                        changelog_actions=changelog_actions,
+                        changelog_actions=changelog,
                         has_env_vars_fn=has_env_vars,
                         example_link=example_link,
                     )
@@ -12,12 +12,7 @@ from zero_3rdparty.sections import slug, wrap_section
 from pkg_ext._internal.changelog.actions import ChangelogAction
 from pkg_ext._internal.config import PKG_EXT_TOOL_NAME, Stability
 from pkg_ext._internal.generation.docs_constants import MD_CONFIG
-from pkg_ext._internal.generation.docs_version import (
-    SymbolChange,
-    get_field_since_version,
-    get_symbol_since_version,
-    get_symbol_stability,
-)
+from pkg_ext._internal.generation.docs_version import ChangelogIndex, SymbolChange
 from pkg_ext._internal.models.api_dump import (
     ClassDump,
     ClassFieldInfo,
@@ -253,7 +248,7 @@ def render_field_table(
 def _build_field_versions(
     symbol_name: str,
     fields: list[ClassFieldInfo] | None,
-    changelog_actions: Sequence[ChangelogAction],
+    changelog: ChangelogIndex,
     group_name: str,
 ) -> dict[str, str]:
     if not fields:
@@ -261,7 +256,7 @@ def _build_field_versions(
     return {
         f.name: v
         for f in fields
-        if not f.is_computed and (v := get_field_since_version(symbol_name, f.name, changelog_actions, group_name))
+        if not f.is_computed and (v := changelog.field_since_version(symbol_name, f.name, group_name))
     }
 
 
@@ -272,9 +267,9 @@ def render_since_badge(version: str | None) -> str:
 def render_stability_badge(
     symbol_name: str,
     group_name: str,
-    changelog_actions: Sequence[ChangelogAction],
+    changelog_actions: ChangelogIndex | Sequence[ChangelogAction],
 ) -> str:
-    stability = get_symbol_stability(symbol_name, group_name, changelog_actions)
+    stability = ChangelogIndex.ensure(changelog_actions).symbol_stability_level(symbol_name, group_name)
     if stability == Stability.experimental:
         return "> **Experimental**"
     if stability == Stability.deprecated:
@@ -297,14 +292,12 @@ def calculate_source_link(
     return str(rel_path)
 
 
-def _render_symbol_type_table(
-    symbol: SymbolDump, changelog_actions: Sequence[ChangelogAction], group_name: str
-) -> str | None:
+def _render_symbol_type_table(symbol: SymbolDump, changelog: ChangelogIndex, group_name: str) -> str | None:
     if isinstance(symbol, CLICommandDump) and symbol.cli_params:
         if table := render_cli_params_table(symbol.cli_params):
             return "\n".join(["**CLI Options:**", "", table])
     if isinstance(symbol, ClassDump) and symbol.fields:
-        field_versions = _build_field_versions(symbol.name, symbol.fields, changelog_actions, group_name)
+        field_versions = _build_field_versions(symbol.name, symbol.fields, changelog, group_name)
         if should_show_field_table(symbol.fields, field_versions):
             return render_field_table(symbol.fields, field_versions)
     return None
@@ -317,7 +310,7 @@ def _format_example_link(example_link: tuple[str, str]) -> str:
 
 def render_inline_symbol(
     ctx: SymbolContext,
-    changelog_actions: Sequence[ChangelogAction] | None = None,
+    changelog_actions: ChangelogIndex | Sequence[ChangelogAction] | None = None,
     changes: list[SymbolChange] | None = None,
     *,
     symbol_doc_path: Path | None = None,
@@ -326,9 +319,9 @@ def render_inline_symbol(
     example_link: tuple[str, str] | None = None,
 ) -> str:
     symbol = ctx.symbol
-    changelog_actions = changelog_actions or []
+    changelog = ChangelogIndex.ensure(changelog_actions)
 
-    since_badge = render_since_badge(get_symbol_since_version(symbol.name, changelog_actions, ctx.group_name))
+    since_badge = render_since_badge(changelog.symbol_since_version(symbol.name, ctx.group_name))
     anchor_id = f"{slug(symbol.name)}_def"
     lines = [f'<a id="{anchor_id}"></a>\n\n### {symbol.type.value}: `{symbol.name}`']
     if symbol_doc_path and pkg_src_dir and pkg_import_name:
@@ -349,7 +342,7 @@ def render_inline_symbol(
     docstring = format_docstring(symbol.docstring)
     if docstring:
         lines.extend(["", docstring])
-    if type_table := _render_symbol_type_table(symbol, changelog_actions, ctx.group_name):
+    if type_table := _render_symbol_type_table(symbol, changelog, ctx.group_name):
         lines.extend(["", type_table])
     if changes:
         lines.extend(["", _render_changes_content(changes)])
@@ -361,12 +354,12 @@ def _render_symbol_main_section(
     symbol: SymbolDump,
     group: GroupDump,
     source_link: str,
-    changelog_actions: Sequence[ChangelogAction],
+    changelog: ChangelogIndex,
     example_link: tuple[str, str] | None = None,
 ) -> str:
     section_id = f"{slug(symbol.name)}_def"
-    stability = render_stability_badge(symbol.name, group.name, changelog_actions)
-    since_badge = render_since_badge(get_symbol_since_version(symbol.name, changelog_actions, group.name))
+    stability = render_stability_badge(symbol.name, group.name, changelog)
+    since_badge = render_since_badge(changelog.symbol_since_version(symbol.name, group.name))
     docstring = format_docstring(symbol.docstring)
 
     lines = [f"## {symbol.type.value}: {symbol.name}", f"- [source]({source_link})"]
@@ -389,13 +382,13 @@ def render_symbol_page(
     pkg_src_dir: Path,
     pkg_import_name: str,
     changes: list[SymbolChange] | None = None,
-    changelog_actions: Sequence[ChangelogAction] | None = None,
+    changelog_actions: ChangelogIndex | Sequence[ChangelogAction] | None = None,
     *,
     has_env_vars_fn: Callable[[ClassDump], bool] | None = None,
     example_link: tuple[str, str] | None = None,
 ) -> str:
     symbol = ctx.symbol
-    changelog_actions = changelog_actions or []
+    changelog = ChangelogIndex.ensure(changelog_actions)
 
     source_link = calculate_source_link(
         symbol_doc_path,
@@ -404,7 +397,7 @@ def render_symbol_page(
         pkg_import_name,
         symbol.line_number,
     )
-    main_content = _render_symbol_main_section(symbol, group, source_link, changelog_actions, example_link)
+    main_content = _render_symbol_main_section(symbol, group, source_link, changelog, example_link)
     parts = [f"# {symbol.name}", "", main_content]
 
     if has_env_vars_fn and isinstance(symbol, ClassDump) and has_env_vars_fn(symbol):
@@ -416,7 +409,7 @@ def render_symbol_page(
             parts.extend(["", "### CLI Options", "", table])
 
     if isinstance(symbol, ClassDump) and symbol.fields:
-        field_versions = _build_field_versions(symbol.name, symbol.fields, changelog_actions, group.name)
+        field_versions = _build_field_versions(symbol.name, symbol.fields, changelog, group.name)
         if should_show_field_table(symbol.fields, field_versions):
             if table := render_field_table(symbol.fields, field_versions):
                 parts.extend(["", "### Fields", "", table])
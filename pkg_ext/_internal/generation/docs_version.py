@@ -1,6 +1,11 @@
 """Version tracking and changelog integration for docs generation."""
 
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import defaultdict
 from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from model_lib import Event, fields
@@ -38,70 +43,6 @@ class SymbolChange(Event):
     ts: fields.UtcDatetime
 
 
-def find_release_version(ts: datetime, changelog_actions: Sequence[ChangelogAction]) -> str | None:
-    for action in sorted(changelog_actions):
-        if isinstance(action, ReleaseAction) and action.ts > ts:
-            return action.name
-    return None
-
-
-def get_symbol_stability(symbol_name: str, group_name: str, changelog_actions: Sequence[ChangelogAction]) -> Stability:
-    last_stability: Stability = Stability.ga
-    for action in sorted(changelog_actions):
-        if isinstance(action, ExperimentalAction):
-            if _matches_symbol_or_group(action, symbol_name, group_name):
-                last_stability = Stability.experimental
-        elif isinstance(action, GAAction):
-            if _matches_symbol_or_group(action, symbol_name, group_name):
-                last_stability = Stability.ga
-        elif isinstance(action, DeprecatedAction):
-            if _matches_symbol_or_group(action, symbol_name, group_name):
-                last_stability = Stability.deprecated
-    return last_stability
-
-
-def _matches_symbol_or_group(
-    action: ExperimentalAction | GAAction | DeprecatedAction,
-    symbol_name: str,
-    group_name: str,
-) -> bool:
-    if action.target == StabilityTarget.group:
-        return action.name == group_name
-    if action.target == StabilityTarget.symbol:
-        return action.name == symbol_name and action.group == group_name
-    return False
-
-
-def get_symbol_since_version(
-    symbol_name: str, changelog_actions: Sequence[ChangelogAction], group_name: str
-) -> str | None:
-    for action in sorted(changelog_actions):
-        if isinstance(action, MakePublicAction) and action.name == symbol_name and action.group == group_name:
-            if version := find_release_version(action.ts, changelog_actions):
-                return version
-            return UNRELEASED_VERSION
-    return None
-
-
-def get_field_since_version(
-    symbol_name: str,
-    field_name: str,
-    changelog_actions: Sequence[ChangelogAction],
-    group_name: str,
-) -> str | None:
-    for action in sorted(changelog_actions):
-        if (
-            isinstance(action, AdditionalChangeAction)
-            and action.name == symbol_name
-            and action.field_name == field_name
-            and action.group == group_name
-        ):
-            if version := find_release_version(action.ts, changelog_actions):
-                return version
-            return UNRELEASED_VERSION
-    return get_symbol_since_version(symbol_name, changelog_actions, group_name)
-
-
 def _action_description(action: ChangelogAction) -> str:
     match action:
         case MakePublicAction():
@@ -121,21 +62,135 @@ def _action_description(action: ChangelogAction) -> str:
     return ""
 
 
+def _stability(action: ExperimentalAction | GAAction | DeprecatedAction) -> Stability:
+    match action:
+        case ExperimentalAction():
+            return Stability.experimental
+        case DeprecatedAction():
+            return Stability.deprecated
+    return Stability.ga
+
+
+@dataclass
+class ChangelogIndex:
+    """Changelog lookups for docs generation, build once per run instead of scanning all actions per symbol.
+
+    Every bucket keeps the chronological order of `sorted(changelog_actions)`.
+    """
+
+    release_ts: list[datetime] = field(default_factory=list)
+    release_names: list[str] = field(default_factory=list)
+    make_public: dict[tuple[str, str], list[MakePublicAction]] = field(default_factory=dict)
+    field_changes: dict[tuple[str, str, str | None], list[AdditionalChangeAction]] = field(default_factory=dict)
+    group_stability: dict[str, tuple[int, Stability]] = field(default_factory=dict)
+    symbol_stability: dict[tuple[str, str], tuple[int, Stability]] = field(default_factory=dict)
+    symbol_actions: dict[tuple[str | None, str], list[tuple[int, ChangelogAction]]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, changelog_actions: Sequence[ChangelogAction]) -> ChangelogIndex:
+        index = cls()
+        make_public: defaultdict[tuple[str, str], list[MakePublicAction]] = defaultdict(list)
+        field_changes: defaultdict[tuple[str, str, str | None], list[AdditionalChangeAction]] = defaultdict(list)
+        symbol_actions: defaultdict[tuple[str | None, str], list[tuple[int, ChangelogAction]]] = defaultdict(list)
+        for position, action in enumerate(sorted(changelog_actions)):
+            if isinstance(action, ReleaseAction):
+                index.release_ts.append(action.ts)
+                index.release_names.append(action.name)
+                continue
+            symbol_actions[(changelog_actions_mod.action_group(action), action.name)].append((position, action))
+            match action:
+                case MakePublicAction():
+                    make_public[(action.group, action.name)].append(action)
+                case AdditionalChangeAction():
+                    field_changes[(action.group, action.name, action.field_name)].append(action)
+                case ExperimentalAction() | GAAction() | DeprecatedAction():
+                    if action.target == StabilityTarget.group:
+                        index.group_stability[action.name] = (position, _stability(action))
+                    elif action.target == StabilityTarget.symbol:
+                        index.symbol_stability[(action.group or "", action.name)] = (position, _stability(action))
+        index.make_public = dict(make_public)
+        index.field_changes = dict(field_changes)
+        index.symbol_actions = dict(symbol_actions)
+        return index
+
+    @classmethod
+    def ensure(cls, changelog: ChangelogIndex | Sequence[ChangelogAction] | None) -> ChangelogIndex:
+        if isinstance(changelog, ChangelogIndex):
+            return changelog
+        return cls.build(changelog or [])
+
+    def release_version(self, ts: datetime) -> str | None:
+        """First release after `ts`."""
+        position = bisect_right(self.release_ts, ts)
+        return self.release_names[position] if position < len(self.release_names) else None
+
+    def symbol_stability_level(self, symbol_name: str, group_name: str) -> Stability:
+        """The latest stability action targeting the symbol or its group wins."""
+        candidates = [
+            found
+            for found in (self.group_stability.get(group_name), self.symbol_stability.get((group_name, symbol_name)))
+            if found
+        ]
+        return max(candidates)[1] if candidates else Stability.ga
+
+    def symbol_since_version(self, symbol_name: str, group_name: str) -> str | None:
+        if actions := self.make_public.get((group_name, symbol_name)):
+            return self.release_version(actions[0].ts) or UNRELEASED_VERSION
+        return None
+
+    def field_since_version(self, symbol_name: str, field_name: str, group_name: str) -> str | None:
+        if actions := self.field_changes.get((group_name, symbol_name, field_name)):
+            return self.release_version(actions[0].ts) or UNRELEASED_VERSION
+        return self.symbol_since_version(symbol_name, group_name)
+
+    def _symbol_actions(self, symbol_name: str, group_name: str) -> list[ChangelogAction]:
+        """Actions for the symbol in the group and actions without a group."""
+        matches = self.symbol_actions.get((group_name, symbol_name), []) + self.symbol_actions.get(
+            (None, symbol_name), []
+        )
+        return [action for _, action in sorted(matches, key=lambda pair: pair[0])]
+
+    def has_meaningful_changes(self, symbol_name: str, group_name: str) -> bool:
+        return any(
+            isinstance(action, MEANINGFUL_CHANGE_ACTIONS) for action in self._symbol_actions(symbol_name, group_name)
+        )
+
+    def symbol_changes(self, symbol_name: str, group_name: str) -> list[SymbolChange]:
+        changes: list[SymbolChange] = []
+        for action in self._symbol_actions(symbol_name, group_name):
+            version = self.release_version(action.ts) or UNRELEASED_VERSION
+            if isinstance(action, MakePublicAction):
+                changes.append(SymbolChange(version=version, description="Made public", ts=action.ts))
+            elif isinstance(action, MEANINGFUL_CHANGE_ACTIONS):
+                if desc := _action_description(action):
+                    changes.append(SymbolChange(version=version, description=desc, ts=action.ts))
+        return sorted(changes, key=lambda c: (c.version == UNRELEASED_VERSION, c.ts), reverse=True)
+
+
+def find_release_version(ts: datetime, changelog_actions: Sequence[ChangelogAction]) -> str | None:
+    return ChangelogIndex.build(changelog_actions).release_version(ts)
+
+
+def get_symbol_stability(symbol_name: str, group_name: str, changelog_actions: Sequence[ChangelogAction]) -> Stability:
+    return ChangelogIndex.build(changelog_actions).symbol_stability_level(symbol_name, group_name)
+
+
+def get_symbol_since_version(
+    symbol_name: str, changelog_actions: Sequence[ChangelogAction], group_name: str
+) -> str | None:
+    return ChangelogIndex.build(changelog_actions).symbol_since_version(symbol_name, group_name)
+
+
+def get_field_since_version(
+    symbol_name: str,
+    field_name: str,
+    changelog_actions: Sequence[ChangelogAction],
+    group_name: str,
+) -> str | None:
+    return ChangelogIndex.build(changelog_actions).field_since_version(symbol_name, field_name, group_name)
+
+
 def build_symbol_changes(
     symbol_name: str, changelog_actions: Sequence[ChangelogAction], group_name: str
 ) -> list[SymbolChange]:
-    changes: list[SymbolChange] = []
-    for action in sorted(changelog_actions):
-        if isinstance(action, ReleaseAction):
-            continue
-        if action.name != symbol_name:
-            continue
-        if (ag := changelog_actions_mod.action_group(action)) and ag != group_name:
-            continue
-        version = find_release_version(action.ts, changelog_actions) or UNRELEASED_VERSION
-        if isinstance(action, MakePublicAction):
-            changes.append(SymbolChange(version=version, description="Made public", ts=action.ts))
-        elif isinstance(action, MEANINGFUL_CHANGE_ACTIONS):
-            if desc := _action_description(action):
-                changes.append(SymbolChange(version=version, description=desc, ts=action.ts))
-    return sorted(changes, key=lambda c: (c.version == UNRELEASED_VERSION, c.ts), reverse=True)
+    return ChangelogIndex.build(changelog_actions).symbol_changes(symbol_name, group_name)
@@ -14,6 +14,7 @@ from pkg_ext._internal.changelog.actions import (
 from pkg_ext._internal.config import Stability
 from pkg_ext._internal.generation.docs_version import (
     UNRELEASED_VERSION,
+    ChangelogIndex,
     build_symbol_changes,
     find_release_version,
     get_field_since_version,
@@ -198,3 +199,31 @@ def test_get_symbol_stability_from_actions():
         DeprecatedAction(name="f", target=StabilityTarget.symbol, group="g"),
     ]
     assert get_symbol_stability("f", "g", actions) == Stability.deprecated
+
+
+def test_changelog_index_lookups():
+    def ts(day: int) -> datetime:
+        return datetime(2025, 1, day, tzinfo=UTC)
+
+    common = {"author": "test"}
+    actions = [
+        ReleaseAction(name="1.1.0", old_version="1.0.0", ts=ts(20), **common),
+        MakePublicAction(name="f", group="g", full_path="mod.f", ts=ts(1), **common),
+        ReleaseAction(name="1.0.0", old_version="0.0.0", ts=ts(10), **common),
+        ExperimentalAction(name="f", target=StabilityTarget.symbol, group="g", ts=ts(2), **common),
+        GAAction(name="g", target=StabilityTarget.group, ts=ts(3), **common),
+        AdditionalChangeAction(name="f", group="g", details="new field", field_name="x", ts=ts(15), **common),
+        FixAction(name="f", group="other", short_sha="abc", message="fix f", ts=ts(25), **common),
+    ]
+    index = ChangelogIndex.build(actions)
+    assert index.release_version(ts(10)) == "1.1.0"
+    assert index.release_version(ts(21)) is None
+    assert index.symbol_stability_level("f", "g") == Stability.ga
+    assert index.symbol_since_version("f", "g") == "1.0.0"
+    assert index.field_since_version("f", "x", "g") == "1.1.0"
+    assert index.field_since_version("f", "y", "g") == "1.0.0"
+    assert index.has_meaningful_changes("f", "g")
+    assert index.has_meaningful_changes("f", "other")
+    assert [c.version for c in index.symbol_changes("f", "g")] == ["1.1.0", "1.0.0"]
+    assert index.symbol_changes("f", "g") == build_symbol_changes("f", actions, "g")
+    assert ChangelogIndex.ensure(index) is index
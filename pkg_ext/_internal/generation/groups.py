@@ -62,8 +62,10 @@ def write_group(
     return path
 
 
-def write_groups(ctx: pkg_ctx) -> list[Path]:
+def write_groups(ctx: pkg_ctx, group_names: set[str] | None = None) -> list[Path]:
+    """`group_names` limits the written modules, None writes all groups."""
     return [
         write_group(group, ctx.settings, ctx.code_state, ctx.tool_state)
         for group in ctx.tool_state.groups.groups_no_root
+        if group_names is None or group.name in group_names
     ]
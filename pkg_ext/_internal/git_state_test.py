@@ -1,14 +1,27 @@
+import logging
 import os
+import subprocess
+import time
 from datetime import timedelta
+from pathlib import Path
 
 import pytest
-from git import Repo
+from git import Actor, GitCommandError, Repo
 from zero_3rdparty.datetime_utils import utc_now
 
+from pkg_ext._internal.git_usage import commit_store
+from pkg_ext._internal.git_usage.blobs import GitBlobReader
+from pkg_ext._internal.git_usage.commit_store import COMMIT_STORE_FILENAME, CommitStore
+from pkg_ext._internal.git_usage.log import git_patch_ids
+from pkg_ext._internal.git_usage.ref_index import GitRefIndex
 from pkg_ext._internal.git_usage.state import (
+    GitChanges,
     GitChangesInput,
     GitCommit,
     GitSince,
+    _file_content,
+    _last_merge_pr_repo,
+    _parse_changes,
     _pr_number_from_message,
     find_git_changes,
     last_merge_pr,
@@ -17,6 +30,9 @@ from pkg_ext._internal.git_usage.state import (
 )
 from pkg_ext._internal.git_usage.url import read_remote_url
 
+logger = logging.getLogger(__name__)
+_AUTHOR = Actor("test author", "test@example.com")
+
 
 @pytest.mark.skipif(os.environ.get("MANUAL", "") == "", reason="needs os.environ[MANUAL]")
 def test_solve_since_sha(repo_path):
@@ -124,3 +140,242 @@ def test_last_merge_pr():
 
 def test_read_remote_url(repo_path):
     assert read_remote_url(repo_path) == "https://github.com/EspenAlbert/pkg-ext"
+
+
+def _parse_changes_per_commit_stats(repo: Repo, start_sha: str, head_sha: str) -> list[GitCommit]:
+    """Previous implementation, one `git diff --numstat` per commit."""
+    commits = []
+    for commit in repo.iter_commits(rev=head_sha):
+        if commit.hexsha.startswith(start_sha):
+            break
+        commits.append(
+            GitCommit(
+                author=commit.author.name or "",
+                message=str(commit.message.strip()),
+                ts=commit.committed_datetime,  # type: ignore
+                sha=commit.hexsha,
+                file_changes={str(file) for file in commit.stats.files},
+            )
+        )
+    return commits
+
+
+def _commit(repo: Repo, files: dict[str, str], message: str) -> str:
+    root = Path(repo.working_dir)
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    repo.git.add(A=True)
+    return repo.index.commit(message, author=_AUTHOR, committer=_AUTHOR).hexsha
+
+
+def test_parse_changes_matches_per_commit_stats(tmp_path):
+    repo = Repo.init(tmp_path, initial_branch="main")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", _AUTHOR.name)
+        config.set_value("user", "email", _AUTHOR.email)
+    start_sha = _commit(repo, {"a.py": "a = 1"}, "initial")
+    _commit(repo, {"a.py": "a = 2", "dir/with space.py": "b = 1"}, "feat: two files\n\nwith a body\n")
+    repo.git.mv("a.py", "renamed.py")
+    _commit(repo, {}, "refactor: rename")
+    repo.git.checkout("-b", "feature")
+    _commit(repo, {"feature.py": "f = 1"}, "feat: on branch")
+    repo.git.checkout("main")
+    _commit(repo, {"main.py": "m = 1"}, "fix: on main")
+    repo.git.merge("feature", "--no-ff", "-m", "Merge pull request #3 from feature")
+    head_sha = repo.head.commit.hexsha
+
+    commits, files_changed = _parse_changes(repo, start_sha, head_sha)
+    assert commits == _parse_changes_per_commit_stats(repo, start_sha, head_sha)
+    assert files_changed == {"a.py", "dir/with space.py", "renamed.py", "feature.py", "main.py"}
+    assert commits[0].file_changes == {"feature.py"}  # merge commit, diff against first parent
+
+
+def test_git_patch_ids_survive_cherry_pick(tmp_path):
+    repo = Repo.init(tmp_path, initial_branch="main")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", _AUTHOR.name)
+        config.set_value("user", "email", _AUTHOR.email)
+    _commit(repo, {"a.py": "a = 1\n"}, "initial")
+    repo.git.checkout("-b", "feature")
+    old_sha = _commit(repo, {"a.py": "a = 2\n"}, "fix: change a")
+    repo.git.checkout("main")
+    _commit(repo, {"b.py": "b = 1\n"}, "feat: add b")
+    repo.git.cherry_pick(old_sha)
+    new_sha = repo.head.commit.hexsha
+    patch_ids = git_patch_ids(tmp_path, [old_sha[:6], new_sha[:6], "0000ff"])
+    assert patch_ids.keys() == {old_sha[:6], new_sha[:6]}
+    assert patch_ids[old_sha[:6]] == patch_ids[new_sha[:6]]
+    assert git_patch_ids(tmp_path, []) == {}
+
+
+def test_commit_store_reads_only_unseen_commits(tmp_path, monkeypatch):
+    repo_path = tmp_path / "repo"
+    repo = Repo.init(repo_path, initial_branch="main")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", _AUTHOR.name)
+        config.set_value("user", "email", _AUTHOR.email)
+    cache_dir = tmp_path / "cache"
+    start_sha = _commit(repo, {"a.py": "a = 1\n"}, "initial")
+    repo.git.checkout("-b", "feature")
+    old_sha = _commit(repo, {"a.py": "a = 2\n"}, "fix: change a")
+    repo.git.checkout("main")
+    b_sha = _commit(repo, {"b.py": "b = 1\n"}, "feat: add b\n\nwith a body\n")
+    repo.git.merge("feature", "--no-ff", "-m", "Merge pull request #3 from feature")
+    head_sha = repo.head.commit.hexsha
+
+    store = CommitStore.load(cache_dir)
+    assert _parse_changes(repo, start_sha, head_sha, store) == _parse_changes(repo, start_sha, head_sha)
+    store.save(repo_path)
+
+    read: list[list[str]] = []
+    real_iter = commit_store.iter_git_log_commits
+    monkeypatch.setattr(
+        commit_store, "iter_git_log_commits", lambda repo, shas: read.append(shas) or real_iter(repo, shas)
+    )
+    new_sha = _commit(repo, {"c.py": "c = 1\n"}, "feat: add c")
+    store = CommitStore.load(cache_dir)
+    commits, files_changed = _parse_changes(repo, start_sha, new_sha, store)
+    assert read == [[new_sha]]
+    assert (commits, files_changed) == _parse_changes(repo, start_sha, new_sha)
+
+    expected = git_patch_ids(repo_path, [old_sha[:6]])
+    assert store.read_patch_ids(repo_path, [old_sha[:6], "0000ff"]) == expected
+    store.save(repo_path)
+    monkeypatch.setattr(commit_store, "git_patch_ids", lambda *_: pytest.fail("patch-id must come from the store"))
+    assert CommitStore.load(cache_dir).read_patch_ids(repo_path, [old_sha[:6]]) == expected
+
+    with (cache_dir / COMMIT_STORE_FILENAME).open("a") as f:
+        f.write('{"sha": "truncated by a crash')
+    repo.git.branch("-D", "feature")
+    repo.git.reset("--hard", b_sha)
+    store = CommitStore.load(cache_dir)
+    assert len(store.entries) == 4
+    store.compact(repo_path, utc_now())
+    assert len(store.entries) == 4  # unreachable but recent, a rebase may still need their patch-ids
+    store.compact(repo_path, utc_now() + commit_store.UNREACHABLE_GRACE * 2)
+    assert set(store.entries) == {b_sha}
+    assert CommitStore.load(cache_dir).entries.keys() == {b_sha}
+
+
+def test_ref_index_matches_describe_and_history_walk(tmp_path, monkeypatch):
+    repo = Repo.init(tmp_path / "repo", initial_branch="main")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", _AUTHOR.name)
+        config.set_value("user", "email", _AUTHOR.email)
+    cache_dir = tmp_path / "cache"
+
+    def describe() -> str:
+        """`_describe_last_tag` without `run_and_wait`, its thread pool would outlive the test."""
+        try:
+            return repo.commit(repo.git.describe("--tags", "--abbrev=0")).hexsha
+        except GitCommandError:
+            return root_sha
+
+    def check() -> GitRefIndex:
+        index = GitRefIndex.load(repo, cache_dir)
+        head_sha = repo.head.commit.hexsha
+        assert index.since_tag_sha(repo, head_sha, describe) == describe()
+        assert index.last_merge_pr(repo, head_sha, _pr_number_from_message) == _last_merge_pr_repo(repo, head_sha)
+        index.save()
+        return index
+
+    root_sha = _commit(repo, {"a.py": "a = 1"}, "initial")
+    assert check().since_tag_by_head[root_sha] == root_sha  # no tags, falls back to the first commit
+    _commit(repo, {"a.py": "a = 2"}, "fix: squashed (#3)")
+    repo.create_tag("v0.1.0", message="annotated")
+    check()
+    for i in range(3):
+        _commit(repo, {"a.py": f"a = {i + 3}"}, f"feat: change {i}")
+        check()
+    repo.create_tag("v0.2.0")
+    check()
+    repo.git.checkout("-b", "feature")
+    _commit(repo, {"b.py": "b = 1"}, "feat: on branch")
+    repo.git.checkout("main")
+    repo.git.merge("feature", "--no-ff", "-m", "Merge pull request #5 from feature")
+    check()  # merge commit before the tag, resolved by `git describe`
+
+    monkeypatch.setattr(repo, "iter_commits", lambda **_: pytest.fail("cached HEAD must not walk history"))
+    index = GitRefIndex.load(repo, cache_dir)
+    head_sha = repo.head.commit.hexsha
+    assert index.last_merge_pr(repo, head_sha, _pr_number_from_message) == 5
+    assert index.since_tag_sha(repo, head_sha, lambda: pytest.fail("cached")) == repo.commit("v0.2.0").hexsha
+
+
+def test_old_version_served_by_blob_reader(tmp_path):
+    repo = Repo.init(tmp_path, initial_branch="main")
+    start_sha = _commit(repo, {"a.py": "a = 1\n", "b.py": "b = 1", "pkg/c.py": "c = 1\n\n"}, "initial")
+    _commit(repo, {"a.py": "a = 2\n", "new.py": "n = 1"}, "change")
+    changes = GitChanges(
+        commits=[],
+        files_changed={"a.py", "b.py", "pkg/c.py", "new.py", "pkg"},
+        git=repo.git,
+        start_sha=start_sha,
+        end_sha=repo.head.commit.hexsha,
+    )
+    for rel_path in ["a.py", "b.py", "pkg/c.py", "new.py"]:
+        assert changes.old_version(rel_path) == _file_content(repo.git, start_sha, rel_path), rel_path
+    assert changes.old_version("new.py") == ""  # missing in start_sha
+    assert changes.old_version("pkg") == ""  # not a blob, submodules resolve to a commit
+    reads = changes.blob_reader.process_reads
+    assert changes.old_version("a.py") == "a = 1"
+    assert changes.blob_reader.process_reads == reads  # served from the LRU
+
+
+def test_blob_reader_lru_and_unknown_revision(tmp_path):
+    repo = Repo.init(tmp_path, initial_branch="main")
+    sha = _commit(repo, {"a.py": "a", "b.py": "b"}, "initial")
+    reader = GitBlobReader(tmp_path, fallback=lambda rev, path: _file_content(repo.git, rev, path), cache_size=1)
+    assert reader.read(sha, "a.py") == "a"
+    assert reader.read(sha, "b.py") == "b"
+    reads = reader.process_reads
+    assert reader.read(sha, "a.py") == "a"  # evicted by b.py
+    assert reader.process_reads == reads + 1
+    with pytest.raises(GitCommandError):
+        reader.read("0" * 40, "a.py")
+    reader.close()
+
+
+def _fast_import_history(repo_path: Path, commit_count: int) -> None:
+    lines = []
+    for i in range(1, commit_count + 1):
+        content = f"value = {i}\n"
+        message = f"feat: change {i}\n"
+        lines += [
+            "commit refs/heads/main",
+            f"mark :{i}",
+            f"committer test <test@example.com> {1_700_000_000 + i} +0000",
+            f"data {len(message)}",
+            message.rstrip("\n"),
+        ]
+        if i > 1:
+            lines.append(f"from :{i - 1}")
+        lines += [
+            f"M 644 inline module_{i % 50}.py",
+            f"data {len(content)}",
+            content,
+        ]
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=repo_path, input="\n".join(lines).encode(), check=True)
+    subprocess.run(["git", "reset", "--hard", "--quiet", "main"], cwd=repo_path, check=True)
+
+
+@pytest.mark.skipif(os.environ.get("MANUAL", "") == "", reason="needs os.environ[MANUAL]")
+def test_parse_changes_benchmark_1000_commits(tmp_path):
+    repo = Repo.init(tmp_path, initial_branch="main")
+    _fast_import_history(tmp_path, 1001)
+    start_sha = repo.commit("main~1000").hexsha
+    head_sha = repo.head.commit.hexsha
+
+    start = time.perf_counter()
+    commits, _ = _parse_changes(repo, start_sha, head_sha)
+    streamed = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = _parse_changes_per_commit_stats(repo, start_sha, head_sha)
+    per_commit = time.perf_counter() - start
+
+    assert len(commits) == 1000
+    assert commits == expected
+    logger.info(f"1000 commits: git log stream {streamed:.2f}s, per commit stats {per_commit:.2f}s")
+    assert streamed < per_commit
@@ -1,6 +1,15 @@
 # Git operations domain
 
 from .actions import git_commit, git_show_file
+from .log import GitLogEntry, git_patch_ids, iter_git_log
+from .pr_info import (
+    EnvPRInfoProvider,
+    FilePRInfoProvider,
+    GhPRInfoProvider,
+    PRInfoProvider,
+    StaticPRInfoProvider,
+    set_pr_info_providers,
+)
 from .state import (
     GitChanges,
     GitChangesInput,
@@ -11,10 +20,24 @@ from .state import (
     head_merge_pr,
 )
 from .url import normalize_repo_url, read_remote_url, remove_credentials
+from .worktree import git_changed_paths_since, git_dirty_paths, git_head_sha, git_tracked_paths
 
 __all__ = [
     "git_commit",
     "git_show_file",
+    "git_changed_paths_since",
+    "git_dirty_paths",
+    "git_head_sha",
+    "git_tracked_paths",
+    "GitLogEntry",
+    "git_patch_ids",
+    "iter_git_log",
+    "EnvPRInfoProvider",
+    "FilePRInfoProvider",
+    "GhPRInfoProvider",
+    "PRInfoProvider",
+    "StaticPRInfoProvider",
+    "set_pr_info_providers",
     "GitChanges",
     "GitChangesInput",
     "GitSince",
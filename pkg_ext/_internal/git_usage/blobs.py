@@ -0,0 +1,121 @@
+"""Long-lived `git cat-file --batch` reader for old file versions."""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import IO, Callable
+
+from git import GitCommandError
+
+DEFAULT_BLOB_CACHE_SIZE = 256
+
+
+def _stop_process(proc: subprocess.Popen) -> None:
+    if proc.poll() is None:
+        if proc.stdin:
+            proc.stdin.close()
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    if proc.stdout:
+        proc.stdout.close()
+
+
+def _read_exact(stream: IO[bytes], size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise EOFError(f"git cat-file closed the pipe after {len(data)}/{size} bytes")
+    return data
+
+
+class GitBlobReader:
+    """Serves `<rev>:<path>` lookups over one `git cat-file --batch` pipe with an LRU of recent blobs.
+
+    Missing files and non-blob entries (submodules) read as "", like `git show` in `_file_content`.
+    Thread safe, the pipe is a request/response protocol so lookups are serialized.
+    """
+
+    def __init__(
+        self,
+        repo_path: Path,
+        fallback: Callable[[str, str], str],
+        cache_size: int = DEFAULT_BLOB_CACHE_SIZE,
+    ):
+        self.repo_path = repo_path
+        self.cache_size = cache_size
+        self.fallback = fallback
+        self._cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+        self._known_revs: set[str] = set()
+        self.process_reads = 0
+
+    def _process(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            weakref.finalize(self, _stop_process, self._proc)
+        return self._proc
+
+    def _request(self, spec: str) -> tuple[str, bytes] | None:
+        """Returns (object type, content), None when the object is missing."""
+        proc = self._process()
+        assert proc.stdin and proc.stdout
+        proc.stdin.write(f"{spec}\n".encode())
+        proc.stdin.flush()
+        header = proc.stdout.readline().decode().rstrip("\n")
+        self.process_reads += 1
+        parts = header.split(" ")
+        if len(parts) != 3:  # "<object> missing" or "<object> ambiguous"
+            return None
+        _, object_type, size = parts
+        content = _read_exact(proc.stdout, int(size))
+        _read_exact(proc.stdout, 1)  # trailing newline after the content
+        return object_type, content
+
+    def _ensure_rev(self, rev: str) -> None:
+        """An unknown revision is an error, same as for `git show`."""
+        if rev in self._known_revs:
+            return
+        if self._request(rev) is None:
+            raise GitCommandError(["git", "cat-file", "--batch"], 128, f"fatal: bad revision '{rev}'")
+        self._known_revs.add(rev)
+
+    def _read_blob(self, rev: str, path: str) -> str:
+        if "\n" in path:
+            return self.fallback(rev, path)  # cannot be expressed on the batch protocol
+        self._ensure_rev(rev)
+        response = self._request(f"{rev}:{path}")
+        if response is None or response[0] != "blob":  # missing file or submodule
+            return ""
+        text = response[1].decode(errors="replace")
+        return text.removesuffix("\n")  # `git show` output is stripped of its final newline
+
+    def read(self, rev: str, path: str) -> str:
+        key = (rev, path)
+        with self._lock:
+            if (content := self._cache.get(key)) is not None:
+                self._cache.move_to_end(key)
+                return content
+            content = self._read_blob(rev, path)
+            self._cache[key] = content
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return content
+
+    def close(self) -> None:
+        with self._lock:
+            if self._proc is not None:
+                _stop_process(self._proc)
+                self._proc = None
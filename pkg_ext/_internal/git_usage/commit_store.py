@@ -0,0 +1,167 @@
+"""Commit metadata and patch-ids kept across runs, so git only reads commits it has never seen.
+
+Stored in `commits.jsonl` in the cache dir, one JSON object per line keyed by the full sha. New commits are
+appended, a later line for the same sha adds fields (the patch-id is only computed when a rebase needs it).
+Unreadable lines, e.g. from an interrupted append, are skipped. Commits are immutable, so an entry never goes
+stale, it only stops being useful once the commit is gone. When the file grows past `COMMIT_STORE_MAX_LINES` it is
+rewritten without the commits that are no longer reachable from any ref and older than `UNREACHABLE_GRACE`
+(rebased commits stay around for a while, their patch-id is what finds the new sha).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Self
+
+from git import Repo
+
+from pkg_ext._internal.disk_cache import atomic_write_bytes, ensure_cache_dir
+from pkg_ext._internal.git_usage.log import GitLogEntry, git_patch_ids, iter_git_log_commits
+
+logger = logging.getLogger(__name__)
+COMMIT_STORE_FILENAME = "commits.jsonl"
+COMMIT_STORE_MAX_LINES = 20_000
+UNREACHABLE_GRACE = timedelta(days=90)
+
+
+def _entry_line(entry: GitLogEntry) -> dict[str, Any]:
+    return {
+        "sha": entry.sha,
+        "author": entry.author,
+        "committed_at": entry.committed_at.isoformat(),
+        "message": entry.message,
+        "files": sorted(entry.files),
+    }
+
+
+def _parse_entry(raw: dict[str, Any]) -> GitLogEntry | None:
+    try:
+        return GitLogEntry(
+            sha=raw["sha"],
+            author=raw["author"],
+            committed_at=datetime.fromisoformat(raw["committed_at"]),
+            message=raw["message"],
+            files=frozenset(raw["files"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _reachable_shas(repo_path: Path) -> set[str]:
+    result = subprocess.run(["git", "rev-list", "--all"], cwd=repo_path, capture_output=True, text=True, check=False)
+    return set(result.stdout.split())
+
+
+@dataclass
+class CommitStore:
+    path: Path
+    entries: dict[str, GitLogEntry] = field(default_factory=dict)
+    patch_ids: dict[str, str] = field(default_factory=dict)
+    line_count: int = 0
+    _pending: list[dict[str, Any]] = field(default_factory=list, init=False, repr=False)
+
+    @classmethod
+    def load(cls, cache_dir: Path) -> Self:
+        store = cls(path=cache_dir / COMMIT_STORE_FILENAME)
+        try:
+            lines = store.path.read_bytes().splitlines()
+        except FileNotFoundError:
+            return store
+        except OSError as e:
+            logger.warning(f"ignoring unreadable commit store {store.path}: {e!r}")
+            return store
+        for line in lines:
+            try:
+                raw = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(raw, dict) or not isinstance(sha := raw.get("sha"), str):
+                continue
+            store.line_count += 1
+            if "message" in raw and (entry := _parse_entry(raw)):
+                store.entries[sha] = entry
+            if isinstance(patch_id := raw.get("patch_id"), str):
+                store.patch_ids[sha] = patch_id
+        return store
+
+    def add(self, entry: GitLogEntry) -> None:
+        if entry.sha not in self.entries:
+            self.entries[entry.sha] = entry
+            self._pending.append(_entry_line(entry))
+
+    def read_commits(self, repo: Repo, shas: list[str]) -> list[GitLogEntry]:
+        """Entries for full `shas` in the given order, only the unseen ones are read from git."""
+        if missing := [sha for sha in shas if sha not in self.entries]:
+            for entry in iter_git_log_commits(repo, missing):
+                self.add(entry)
+            logger.debug(f"commit store: {len(shas) - len(missing)} cached, {len(missing)} read from git")
+        return [self.entries[sha] for sha in shas]
+
+    def _full_shas(self, revs: Iterable[str]) -> dict[str, str]:
+        """rev -> full sha for revs that are a unique prefix of a stored commit, ambiguous ones are left to git."""
+        wanted = set(revs)
+        full_shas: dict[str, str] = {}
+        for length in {len(rev) for rev in wanted}:
+            by_prefix: dict[str, str | None] = {}
+            for sha in self.entries:
+                prefix = sha[:length]
+                by_prefix[prefix] = None if prefix in by_prefix else sha
+            full_shas |= {rev: sha for rev in wanted if len(rev) == length and (sha := by_prefix.get(rev))}
+        return full_shas
+
+    def read_patch_ids(self, repo_path: Path, revs: list[str]) -> dict[str, str]:
+        """Same contract as `git_patch_ids`, ids of stored commits are computed once and kept."""
+        full_shas = self._full_shas(revs)
+        to_compute = [rev for rev in revs if full_shas.get(rev) not in self.patch_ids]
+        computed = git_patch_ids(repo_path, to_compute) if to_compute else {}
+        for rev, patch_id in computed.items():
+            if (sha := full_shas.get(rev)) and sha not in self.patch_ids:
+                self.patch_ids[sha] = patch_id
+                self._pending.append({"sha": sha, "patch_id": patch_id})
+        cached = {rev: self.patch_ids[sha] for rev, sha in full_shas.items() if sha in self.patch_ids}
+        return cached | computed
+
+    def save(self, repo_path: Path) -> None:
+        if not self._pending:
+            return
+        ensure_cache_dir(self.path.parent)
+        self.line_count += len(self._pending)
+        if self.line_count > COMMIT_STORE_MAX_LINES:
+            self.compact(repo_path, datetime.now(UTC))
+            return
+        content = "".join(json.dumps(line, separators=(",", ":")) + "\n" for line in self._pending)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(content)
+        self._pending.clear()
+
+    def compact(self, repo_path: Path, now: datetime) -> None:
+        """Rewrites the file with one line per kept commit, evicting old unreachable commits first.
+
+        Should the reachable commits alone still exceed the limit, only the most recently committed are kept.
+        """
+        reachable = _reachable_shas(repo_path)
+        kept = [
+            entry
+            for sha, entry in self.entries.items()
+            if sha in reachable or now - entry.committed_at <= UNREACHABLE_GRACE
+        ]
+        kept.sort(key=lambda entry: entry.committed_at, reverse=True)
+        kept = kept[: COMMIT_STORE_MAX_LINES // 2]  # room to append before the next rewrite
+        logger.info(f"commit store: compacted {len(self.entries)} commits to {len(kept)}")
+        self.entries = {entry.sha: entry for entry in kept}
+        self.patch_ids = {sha: patch_id for sha, patch_id in self.patch_ids.items() if sha in self.entries}
+        lines = []
+        for entry in kept:
+            line = _entry_line(entry)
+            if patch_id := self.patch_ids.get(entry.sha):
+                line["patch_id"] = patch_id
+            lines.append(json.dumps(line, separators=(",", ":")) + "\n")
+        atomic_write_bytes(self.path, "".join(lines).encode("utf-8"))
+        self.line_count = len(lines)
+        self._pending.clear()
@@ -0,0 +1,169 @@
+"""Streamed `git log` reader: commit metadata and changed files from a single git process."""
+
+from __future__ import annotations
+
+import codecs
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+from git import GitCommandError, Repo
+
+_RECORD_SEP = "\x1e"
+_FIELD_SEP = "\x1f"
+_LOG_FORMAT = "%x1e%H%x1f%an%x1f%cI%x1f%B%x1f"
+_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class GitLogEntry:
+    sha: str
+    author: str
+    committed_at: datetime
+    message: str
+    files: frozenset[str]
+
+
+def _parse_record(record: str) -> GitLogEntry:
+    sha, author, committed_at, message, files_part = record.split(_FIELD_SEP, 4)
+    # -z terminates the header with NUL, --name-only then prints a newline and NUL terminated paths
+    files_part = files_part.removeprefix("\0").removeprefix("\n")
+    return GitLogEntry(
+        sha=sha,
+        author=author,
+        committed_at=datetime.fromisoformat(committed_at),
+        message=message,
+        files=frozenset(path for path in files_part.split("\0") if path),
+    )
+
+
+def _log_command(*revs: str) -> list[str]:
+    return [
+        "git",
+        "log",
+        "-z",
+        "--name-only",
+        "--no-renames",  # same file list as `Commit.stats`
+        "--diff-merges=first-parent",
+        f"--format={_LOG_FORMAT}",
+        *revs,
+        "--",
+    ]
+
+
+def _stream_log(repo: Repo, command: list[str], stdin: bytes | None = None) -> Iterator[GitLogEntry]:
+    proc = subprocess.Popen(
+        command,
+        cwd=repo.working_dir,
+        stdin=subprocess.PIPE if stdin is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert proc.stdout is not None
+    if stdin is not None:
+        assert proc.stdin is not None
+        proc.stdin.write(stdin)  # `--stdin` reads every rev before writing any output
+        proc.stdin.close()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    finished = False
+    try:
+        pending = ""
+        while chunk := proc.stdout.read1(_CHUNK_SIZE):
+            pending += decoder.decode(chunk)
+            *records, pending = pending.split(_RECORD_SEP)
+            for record in records:
+                if record:
+                    yield _parse_record(record)
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield _parse_record(pending)
+        finished = True
+    finally:
+        if not finished:
+            proc.kill()
+        proc.stdout.close()
+        stderr = proc.stderr.read() if proc.stderr else b""
+        returncode = proc.wait()
+    if returncode != 0 and finished:
+        raise GitCommandError(command, returncode, stderr)
+
+
+def iter_git_log(repo: Repo, rev: str) -> Iterator[GitLogEntry]:
+    """Yields commits reachable from `rev` in `git rev-list` order, parsed while git is still writing.
+
+    Stopping the iteration early terminates the git process.
+    """
+    return _stream_log(repo, _log_command(rev))
+
+
+def iter_git_log_commits(repo: Repo, shas: list[str]) -> Iterator[GitLogEntry]:
+    """Same entries as `iter_git_log` for exactly `shas`, in the given order."""
+    if not shas:
+        return iter(())
+    command = _log_command("--no-walk=unsorted", "--stdin")
+    return _stream_log(repo, command, "\n".join(shas).encode() + b"\n")
+
+
+def iter_rev_list(repo: Repo, rev: str) -> Iterator[str]:
+    """Full shas reachable from `rev` in `git rev-list` order without reading any diffs."""
+    command = ["git", "rev-list", rev, "--"]
+    proc = subprocess.Popen(command, cwd=repo.working_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert proc.stdout is not None
+    finished = False
+    try:
+        for line in proc.stdout:
+            yield line.decode().strip()
+        finished = True
+    finally:
+        if not finished:
+            proc.kill()
+        proc.stdout.close()
+        stderr = proc.stderr.read() if proc.stderr else b""
+        returncode = proc.wait()
+    if returncode != 0 and finished:
+        raise GitCommandError(command, returncode, stderr)
+
+
+def git_patch_ids(repo_path: Path, revs: list[str]) -> dict[str, str]:
+    """`git patch-id --stable` of each rev, revs that are missing, ambiguous or without a diff are left out.
+
+    Three git processes in total regardless of the number of revs.
+    """
+    if not revs:
+        return {}
+    check = subprocess.run(
+        ["git", "cat-file", "--batch-check=%(objectname) %(objecttype)"],
+        cwd=repo_path,
+        input="\n".join(revs) + "\n",
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    full_shas: dict[str, str] = {}
+    for rev, line in zip(revs, check.stdout.splitlines()):
+        full_sha, _, object_type = line.partition(" ")
+        if object_type == "commit":
+            full_shas[rev] = full_sha
+    if not full_shas:
+        return {}
+    diff = subprocess.run(
+        ["git", "diff-tree", "--stdin", "-p", "--no-color"],
+        cwd=repo_path,
+        input="\n".join(full_shas.values()).encode() + b"\n",
+        capture_output=True,
+        check=False,
+    )
+    patch_ids = subprocess.run(
+        ["git", "patch-id", "--stable"],
+        cwd=repo_path,
+        input=diff.stdout,
+        capture_output=True,
+        check=False,
+    )
+    by_full_sha: dict[str, str] = {}
+    for line in patch_ids.stdout.decode().splitlines():
+        patch_id, _, full_sha = line.partition(" ")
+        by_full_sha[full_sha] = patch_id
+    return {rev: by_full_sha[full_sha] for rev, full_sha in full_shas.items() if full_sha in by_full_sha}
@@ -0,0 +1,182 @@
+"""Pull request info of the current branch, resolved through pluggable providers.
+
+Providers are asked in order and the first answer wins: `PKG_EXT_PR_INFO` (the `gh pr view` JSON, for CI),
+`PKG_EXT_PR_INFO_FILE` (path to the same JSON) and `gh pr view`. An empty JSON object means "no PR".
+Answers of cacheable providers (`gh`) are stored in `pr_info.json` next to the user config, keyed by
+(repo, branch, HEAD sha), so only the first process after a commit pays for the network round-trip.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, ClassVar, Protocol
+
+from ask_shell._internal._run import run_and_wait
+from git import InvalidGitRepositoryError, NoSuchPathError, Repo
+
+from pkg_ext._internal.disk_cache import read_json_cache, write_json_cache
+
+logger = logging.getLogger(__name__)
+PR_INFO_ENV_VAR = "PKG_EXT_PR_INFO"
+PR_INFO_FILE_ENV_VAR = "PKG_EXT_PR_INFO_FILE"
+PR_INFO_CACHE_FILENAME = "pr_info.json"
+PR_INFO_CACHE_TTL = timedelta(minutes=30)
+NO_PR_CACHE_TTL = timedelta(minutes=2)  # short, a PR opened for the current commit must block `--push` soon
+
+
+class PRInfoProvider(Protocol):
+    cacheable: ClassVar[bool]
+
+    def find(self, repo_path: Path) -> dict[str, Any] | None:
+        """None when the provider has no answer, `{}` when there is no PR."""
+        ...
+
+
+def _parse_raw(content: str, source: str) -> dict[str, Any] | None:
+    try:
+        raw = json.loads(content)
+    except ValueError as e:
+        logger.warning(f"ignoring invalid PR info from {source}: {e!r}")
+        return None
+    if not isinstance(raw, dict):
+        logger.warning(f"ignoring PR info from {source}, expected a JSON object")
+        return None
+    return raw
+
+
+@dataclass
+class EnvPRInfoProvider:
+    env_var: str = PR_INFO_ENV_VAR
+    cacheable: ClassVar[bool] = False
+
+    def find(self, repo_path: Path) -> dict[str, Any] | None:
+        if content := os.environ.get(self.env_var, "").strip():
+            return _parse_raw(content, self.env_var)
+        return None
+
+
+@dataclass
+class FilePRInfoProvider:
+    env_var: str = PR_INFO_FILE_ENV_VAR
+    cacheable: ClassVar[bool] = False
+
+    def find(self, repo_path: Path) -> dict[str, Any] | None:
+        if not (path_str := os.environ.get(self.env_var, "")):
+            return None
+        path = Path(path_str)
+        if not path.exists():
+            logger.warning(f"{self.env_var}={path_str} doesn't exist")
+            return None
+        return _parse_raw(path.read_text(), str(path))
+
+
+@dataclass
+class GhPRInfoProvider:
+    cacheable: ClassVar[bool] = True
+
+    def find(self, repo_path: Path) -> dict[str, Any] | None:
+        result = run_and_wait(
+            "gh pr view --json baseRefName,url,baseRefOid",
+            cwd=repo_path,
+            allow_non_zero_exit=True,
+        )
+        if not result.clean_complete:
+            return {}
+        return result.parse_output(dict)
+
+
+@dataclass
+class StaticPRInfoProvider:
+    """Fixed answer without git or network access, for tests and scripted runs."""
+
+    raw: dict[str, Any] = field(default_factory=dict)
+    cacheable: ClassVar[bool] = False
+
+    def find(self, repo_path: Path) -> dict[str, Any] | None:
+        return self.raw
+
+
+def default_pr_info_providers() -> list[PRInfoProvider]:
+    return [EnvPRInfoProvider(), FilePRInfoProvider(), GhPRInfoProvider()]
+
+
+_providers: list[PRInfoProvider] = default_pr_info_providers()
+
+
+def set_pr_info_providers(providers: Sequence[PRInfoProvider] | None) -> None:
+    """None restores the defaults, the per process memo is cleared either way."""
+    global _providers
+    _providers = list(providers) if providers is not None else default_pr_info_providers()
+    find_pr_info_raw.cache_clear()
+
+
+def pr_info_cache_key(repo_path: Path) -> str | None:
+    """None outside a repo or before the first commit, nothing is cached then."""
+    try:
+        repo = Repo(repo_path)
+        head_sha = repo.head.commit.hexsha
+    except (InvalidGitRepositoryError, NoSuchPathError, ValueError):
+        return None
+    branch = "" if repo.head.is_detached else repo.active_branch.name
+    return f"{Path(repo.working_dir).resolve()}|{branch}|{head_sha}"
+
+
+def _pr_info_cache_path() -> Path:
+    from pkg_ext._internal.config import user_config_dir  # config imports the changelog actions
+
+    return user_config_dir() / PR_INFO_CACHE_FILENAME
+
+
+def _is_fresh(entry: Any, now: datetime) -> bool:
+    if not isinstance(entry, dict) or not isinstance(entry.get("raw"), dict):
+        return False
+    try:
+        resolved_at = datetime.fromisoformat(entry["resolved_at"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    ttl = PR_INFO_CACHE_TTL if entry["raw"] else NO_PR_CACHE_TTL
+    return now - resolved_at <= ttl
+
+
+def read_cached_pr_info(cache_path: Path, key: str, now: datetime) -> dict[str, Any] | None:
+    raw = read_json_cache(cache_path)
+    entry = raw.get(key) if isinstance(raw, dict) else None
+    return entry["raw"] if _is_fresh(entry, now) else None
+
+
+def write_cached_pr_info(cache_path: Path, key: str, pr_info: dict[str, Any], now: datetime) -> None:
+    """Expired entries are dropped on write, the file only holds recent commits."""
+    raw = read_json_cache(cache_path)
+    entries = {k: v for k, v in raw.items() if _is_fresh(v, now)} if isinstance(raw, dict) else {}
+    entries[key] = {"raw": pr_info, "resolved_at": now.isoformat()}
+    try:
+        write_json_cache(cache_path, entries)
+    except OSError as e:
+        logger.debug(f"unable to write PR info cache {cache_path}: {e!r}")
+
+
+@lru_cache(maxsize=4)
+def find_pr_info_raw(repo_path: Path) -> dict[str, Any]:
+    now = datetime.now(UTC)
+    cache_path: Path | None = None
+    key: str | None = None
+    for provider in _providers:
+        if provider.cacheable and cache_path is None:
+            cache_path = _pr_info_cache_path()
+            key = pr_info_cache_key(repo_path)
+            if key and (cached := read_cached_pr_info(cache_path, key, now)) is not None:
+                return cached
+        raw = provider.find(repo_path)
+        if raw is None:
+            continue
+        if provider.cacheable and cache_path and key:
+            write_cached_pr_info(cache_path, key, raw, now)
+        return raw
+    return {}
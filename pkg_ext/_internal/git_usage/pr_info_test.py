@@ -0,0 +1,100 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, ClassVar
+
+import pytest
+from git import Actor, Repo
+
+from pkg_ext._internal.git_usage import pr_info
+from pkg_ext._internal.git_usage.pr_info import (
+    NO_PR_CACHE_TTL,
+    PR_INFO_ENV_VAR,
+    PR_INFO_FILE_ENV_VAR,
+    EnvPRInfoProvider,
+    FilePRInfoProvider,
+    StaticPRInfoProvider,
+    find_pr_info_raw,
+    pr_info_cache_key,
+    read_cached_pr_info,
+    set_pr_info_providers,
+    write_cached_pr_info,
+)
+from pkg_ext._internal.git_usage.state import find_pr_info_or_none
+
+_AUTHOR = Actor("test author", "test@example.com")
+_RAW = {"baseRefName": "main", "baseRefOid": "abc123", "url": "https://github.com/o/r/pull/7"}
+
+
+@dataclass
+class CountingProvider:
+    raw: dict[str, Any]
+    calls: list[Path] = field(default_factory=list)
+    cacheable: ClassVar[bool] = True
+
+    def find(self, repo_path: Path) -> dict[str, Any] | None:
+        self.calls.append(repo_path)
+        return self.raw
+
+
+@pytest.fixture()
+def repo(tmp_path: Path, monkeypatch) -> Repo:
+    monkeypatch.setattr(pr_info, "_pr_info_cache_path", lambda: tmp_path / "cache" / "pr_info.json")
+    repo = Repo.init(tmp_path / "repo", initial_branch="feature")
+    repo.index.commit("initial", author=_AUTHOR, committer=_AUTHOR)
+    yield repo
+    set_pr_info_providers(None)
+
+
+def test_cacheable_provider_is_asked_once_per_head(repo: Repo):
+    repo_path = Path(repo.working_dir)
+    provider = CountingProvider(_RAW)
+    set_pr_info_providers([provider])
+    assert find_pr_info_raw(repo_path) == _RAW
+    find_pr_info_raw.cache_clear()  # a new process
+    pr = find_pr_info_or_none(repo_path)
+    assert pr is not None
+    assert pr.pr_number == 7
+    assert len(provider.calls) == 1
+
+    repo.index.commit("second", author=_AUTHOR, committer=_AUTHOR)
+    find_pr_info_raw.cache_clear()
+    assert find_pr_info_raw(repo_path) == _RAW
+    assert len(provider.calls) == 2
+
+
+def test_env_and_file_providers_skip_the_cache(repo: Repo, monkeypatch, tmp_path: Path):
+    repo_path = Path(repo.working_dir)
+    gh = CountingProvider({})
+    set_pr_info_providers([EnvPRInfoProvider(), FilePRInfoProvider(), gh])
+    monkeypatch.setenv(PR_INFO_ENV_VAR, "{}")
+    assert find_pr_info_or_none(repo_path) is None
+
+    monkeypatch.delenv(PR_INFO_ENV_VAR)
+    info_path = tmp_path / "pr_info_ci.json"
+    info_path.write_text('{"baseRefName": "main", "baseRefOid": "abc123", "url": "https://github.com/o/r/pull/9"}')
+    monkeypatch.setenv(PR_INFO_FILE_ENV_VAR, str(info_path))
+    find_pr_info_raw.cache_clear()
+    pr = find_pr_info_or_none(repo_path)
+    assert pr is not None
+    assert pr.pr_number == 9
+    assert gh.calls == []
+    assert not (tmp_path / "cache" / "pr_info.json").exists()
+
+    set_pr_info_providers([StaticPRInfoProvider(_RAW)])
+    assert find_pr_info_raw(repo_path) == _RAW
+
+
+def test_no_pr_answers_expire_sooner(repo: Repo, tmp_path: Path):
+    cache_path = tmp_path / "pr_info.json"
+    key = pr_info_cache_key(Path(repo.working_dir))
+    assert key is not None
+    assert key.endswith(f"|feature|{repo.head.commit.hexsha}")
+    resolved_at = datetime.now(UTC) - NO_PR_CACHE_TTL * 2
+    write_cached_pr_info(cache_path, key, {}, resolved_at)
+    write_cached_pr_info(cache_path, "other", _RAW, resolved_at)
+    now = datetime.now(UTC)
+    assert read_cached_pr_info(cache_path, key, now) is None
+    assert read_cached_pr_info(cache_path, "other", now) == _RAW
+    assert read_cached_pr_info(cache_path, "other", now + timedelta(days=1)) is None
+    assert pr_info_cache_key(tmp_path / "not-a-repo") is None
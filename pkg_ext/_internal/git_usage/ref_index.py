@@ -0,0 +1,146 @@
+"""Cached answers to "last tag before HEAD" and "last merged PR before HEAD".
+
+Stored in `git_ref_index.json` in the cache dir. Results are kept per HEAD sha, so an unchanged HEAD needs no git
+process at all. A new HEAD walks its history only until it reaches a commit that was HEAD before, which inherits
+that result. Tag results are dropped when `packed-refs` or `refs/tags` change. Merge PR results never are, commit
+messages are immutable. Hitting a merge commit before a tag falls back to `git describe`, which picks between the
+parents by distance.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Self
+
+from git import Commit, Repo
+
+from pkg_ext._internal.disk_cache import ensure_cache_dir, read_json_cache, write_json_cache
+
+logger = logging.getLogger(__name__)
+GIT_REF_INDEX_FILENAME = "git_ref_index.json"
+MAX_INDEXED_HEADS = 64
+
+
+class MergeBeforeTagError(Exception):
+    pass
+
+
+def tags_fingerprint(repo: Repo) -> str:
+    """mtime_ns and size of `packed-refs` and everything below `refs/tags`, no git process needed."""
+    common_dir = Path(repo.common_dir)
+    parts = []
+    candidates = [common_dir / "packed-refs", common_dir / "refs" / "tags"]
+    tags_dir = candidates[1]
+    if tags_dir.is_dir():
+        candidates.extend(sorted(tags_dir.rglob("*")))
+    for path in candidates:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        parts.append(f"{path.relative_to(common_dir)}:{stat.st_mtime_ns}:{stat.st_size}")
+    return "|".join(parts)
+
+
+def _walk_until(
+    repo: Repo, head_sha: str, known: dict[str, Any], match: Callable[[Commit], Any | None]
+) -> tuple[Any | None, Commit | None]:
+    """(first non None `match(commit)` in `git rev-list` order, last commit walked).
+
+    A commit found in `known` answers for the rest of its history.
+    """
+    last: Commit | None = None
+    for commit in repo.iter_commits(rev=head_sha):
+        if commit.hexsha in known:
+            return known[commit.hexsha], commit
+        if (result := match(commit)) is not None:
+            return result, commit
+        last = commit
+    return None, last
+
+
+@dataclass
+class GitRefIndex:
+    path: Path
+    fingerprint: str
+    tag_commits: set[str] = field(default_factory=set)
+    since_tag_by_head: dict[str, str] = field(default_factory=dict)
+    merge_pr_by_head: dict[str, int | None] = field(default_factory=dict)
+    _changed: bool = field(default=False, init=False, repr=False)
+
+    @classmethod
+    def load(cls, repo: Repo, cache_dir: Path) -> Self:
+        path = cache_dir / GIT_REF_INDEX_FILENAME
+        fingerprint = tags_fingerprint(repo)
+        raw = read_json_cache(path)
+        if not isinstance(raw, dict):
+            raw = {}
+        merge_pr_by_head = raw.get("merge_pr_by_head") or {}
+        if raw.get("fingerprint") == fingerprint:
+            return cls(
+                path=path,
+                fingerprint=fingerprint,
+                tag_commits=set(raw.get("tag_commits") or []),
+                since_tag_by_head=raw.get("since_tag_by_head") or {},
+                merge_pr_by_head=merge_pr_by_head,
+            )
+        index = cls(path=path, fingerprint=fingerprint, merge_pr_by_head=merge_pr_by_head)
+        index.tag_commits = {tag.commit.hexsha for tag in repo.tags}
+        index._changed = True
+        return index
+
+    def save(self) -> None:
+        if not self._changed:
+            return
+        ensure_cache_dir(self.path.parent)
+        write_json_cache(
+            self.path,
+            {
+                "fingerprint": self.fingerprint,
+                "tag_commits": sorted(self.tag_commits),
+                "since_tag_by_head": self.since_tag_by_head,
+                "merge_pr_by_head": self.merge_pr_by_head,
+            },
+        )
+        self._changed = False
+
+    def _remember(self, by_head: dict[str, Any], head_sha: str, value: Any) -> None:
+        by_head[head_sha] = value
+        while len(by_head) > MAX_INDEXED_HEADS:
+            del by_head[next(iter(by_head))]
+        self._changed = True
+
+    def since_tag_sha(self, repo: Repo, head_sha: str, describe: Callable[[], str]) -> str:
+        """Commit of the last tag, the root commit when there are no tags (same fallback as before)."""
+        if (cached := self.since_tag_by_head.get(head_sha)) is not None:
+            return cached
+
+        def tagged(commit: Commit) -> str | None:
+            if commit.hexsha in self.tag_commits:
+                return commit.hexsha
+            if len(commit.parents) > 1:
+                raise MergeBeforeTagError
+            return None
+
+        try:
+            since_sha, last = _walk_until(repo, head_sha, self.since_tag_by_head, tagged)
+        except MergeBeforeTagError:
+            since_sha, last = describe(), None
+        if since_sha is None:
+            assert last is not None, f"no commits reachable from {head_sha}"
+            logger.warning("No git tags found, falling back to first commit")
+            since_sha = last.hexsha
+        self._remember(self.since_tag_by_head, head_sha, since_sha)
+        return since_sha
+
+    def last_merge_pr(self, repo: Repo, head_sha: str, pr_number: Callable[[str], int | None]) -> int | None:
+        if head_sha in self.merge_pr_by_head:
+            return self.merge_pr_by_head[head_sha]
+        pr, _ = _walk_until(
+            repo, head_sha, self.merge_pr_by_head, lambda commit: pr_number(str(commit.message.strip()))
+        )
+        self._remember(self.merge_pr_by_head, head_sha, pr)
+        return pr
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
-from functools import lru_cache, total_ordering
+from functools import partial, total_ordering
+from itertools import takewhile
 from pathlib import Path
-from typing import Any, ClassVar, Iterable, Self
+from typing import ClassVar, Iterable, Self
 
 from ask_shell._internal._run import run_and_wait
 from ask_shell.shell import ShellError
@@ -16,7 +17,13 @@ from model_lib import Entity, fields
 from pydantic import BaseModel, Field, model_validator
 
 from pkg_ext._internal.errors import RemoteURLNotFound
+from pkg_ext._internal.git_usage.blobs import GitBlobReader
+from pkg_ext._internal.git_usage.commit_store import CommitStore
+from pkg_ext._internal.git_usage.log import GitLogEntry, iter_git_log, iter_rev_list
+from pkg_ext._internal.git_usage.pr_info import find_pr_info_raw
+from pkg_ext._internal.git_usage.ref_index import GitRefIndex
 from pkg_ext._internal.git_usage.url import read_remote_url
+from pkg_ext._internal.task_graph import Task, run_task_graph
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +57,7 @@ class GitState:
 class GitChangesInput(BaseModel):
     repo_path: Path
     since: GitSince
+    cache_dir: Path | None = None
 
 
 @total_ordering
@@ -127,6 +135,8 @@ class GitChanges:
     pr_info: PRInfo | None = None
     last_merge_pr: int = DEFAULT_PR_NUMBER
     remote_url: str = ""
+    commit_store: CommitStore | None = field(default=None, repr=False, compare=False)
+    _blob_reader: GitBlobReader | None = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def empty(cls) -> Self:
@@ -160,7 +170,17 @@ class GitChanges:
     def old_version(self, rel_path_repo: str) -> str:
         assert self.has_change(rel_path_repo), f"file hasn't changed: {rel_path_repo}"
         assert self.git, "git repo must be set for reading the old version"
-        return _file_content(self.git, self.start_sha, rel_path_repo)
+        return self.blob_reader.read(self.start_sha, rel_path_repo)
+
+    @property
+    def blob_reader(self) -> GitBlobReader:
+        if self._blob_reader is None:
+            git = self.git
+            assert git, "git repo must be set for reading blobs"
+            self._blob_reader = GitBlobReader(
+                Path(git.working_dir), fallback=lambda rev, path: _file_content(git, rev, path)
+            )
+        return self._blob_reader
 
 
 def head_merge_pr(repo_path: Path) -> int:
@@ -207,16 +227,25 @@ def _first_commit(repo: Repo) -> Commit:
     return commits[0]
 
 
-def solve_since_sha(repo: Repo, repo_path: Path, since: GitSince, ref: str) -> Commit:
+def _describe_last_tag(repo: Repo, repo_path: Path) -> str:
+    try:
+        output = run_and_wait("git describe --tags --abbrev=0", cwd=repo_path).stdout_one_line
+        return repo.commit(output).hexsha
+    except ShellError as e:
+        if e.exit_code == 128:
+            logger.warning("No git tags found, falling back to first commit")
+            return _first_commit(repo).hexsha
+        raise
+
+
+def solve_since_sha(
+    repo: Repo, repo_path: Path, since: GitSince, ref: str, ref_index: GitRefIndex | None = None
+) -> Commit:
     if since == GitSince.LAST_GIT_TAG or since == GitSince.DEFAULT and not ref:
-        try:
-            output = run_and_wait("git describe --tags --abbrev=0", cwd=repo_path).stdout_one_line
-            return repo.commit(output)
-        except ShellError as e:
-            if e.exit_code == 128:
-                logger.warning("No git tags found, falling back to first commit")
-                return _first_commit(repo)
-            raise
+        if ref_index is None:
+            return repo.commit(_describe_last_tag(repo, repo_path))
+        head_sha = repo.head.commit.hexsha
+        return repo.commit(ref_index.since_tag_sha(repo, head_sha, lambda: _describe_last_tag(repo, repo_path)))
     elif since in {GitSince.PR_BASE_BRANCH, GitSince.DEFAULT}:
         return _merge_base(repo, ref)
     elif since == GitSince.NO_GIT_CHANGES:
@@ -225,34 +254,30 @@ def solve_since_sha(repo: Repo, repo_path: Path, since: GitSince, ref: str) -> C
         raise NotImplementedError
 
 
-@lru_cache(maxsize=4)
-def find_pr_info_raw(repo_path: Path) -> dict[str, Any]:
-    result = run_and_wait(
-        "gh pr view --json baseRefName,url,baseRefOid",
-        cwd=repo_path,
-        allow_non_zero_exit=True,
-    )
-    if not result.clean_complete:
-        return {}
-    return result.parse_output(dict)
+def _iter_log_entries(repo: Repo, start_sha: str, head_sha: str, store: CommitStore | None) -> Iterable[GitLogEntry]:
+    """Commits after `start_sha` up to `head_sha`, the store only needs `git rev-list` for commits it has seen."""
+    if store is None:
+        return takewhile(lambda entry: not entry.sha.startswith(start_sha), iter_git_log(repo, head_sha))
+    shas = list(takewhile(lambda sha: not sha.startswith(start_sha), iter_rev_list(repo, head_sha)))
+    return store.read_commits(repo, shas)
 
 
-def _parse_changes(repo: Repo, start_sha: str, head_sha: str) -> tuple[list[GitCommit], set[str]]:
+def _parse_changes(
+    repo: Repo, start_sha: str, head_sha: str, store: CommitStore | None = None
+) -> tuple[list[GitCommit], set[str]]:
     if head_sha.startswith(start_sha) or start_sha.startswith(head_sha):
         return [], set()
     commits: list[GitCommit] = []
     files_changed: set[str] = set()
-    for commit in repo.iter_commits(rev=head_sha):
-        if commit.hexsha.startswith(start_sha):
-            break
-        commit_files = {str(file) for file in commit.stats.files}
+    for entry in _iter_log_entries(repo, start_sha, head_sha, store):
+        commit_files = set(entry.files)
         files_changed |= commit_files
         commits.append(
             GitCommit(
-                author=commit.author.name or "",
-                message=str(commit.message.strip()),
-                ts=commit.committed_datetime,  # type: ignore
-                sha=commit.hexsha,
+                author=entry.author,
+                message=entry.message.strip(),
+                ts=entry.committed_at,  # type: ignore
+                sha=entry.sha,
                 file_changes=commit_files,
             )
         )
@@ -265,35 +290,75 @@ def find_pr_info_or_none(repo_path: Path) -> PRInfo | None:
         return PRInfo(**raw)
 
 
+def _read_remote_url_or_empty(repo_path: Path) -> str:
+    try:
+        return read_remote_url(repo_path)
+    except RemoteURLNotFound as e:
+        logger.warning(repr(e))
+        return ""
+
+
+def _find_history(
+    event: GitChangesInput,
+    head_sha: str,
+    ref_index: GitRefIndex | None,
+    store: CommitStore | None,
+    pr_info: PRInfo | None = None,
+) -> tuple[str, list[GitCommit], set[str]]:
+    repo = Repo(event.repo_path)  # not shared, the object database reader of a Repo isn't thread safe
+    try:
+        base_ref = pr_info.base_ref_oid if pr_info else ""
+        start_sha = solve_since_sha(repo, event.repo_path, event.since, base_ref, ref_index).hexsha
+    except _NoGitChangesError:
+        return "", [], set()
+    commits, files_changed = _parse_changes(repo, start_sha, head_sha, store)
+    return start_sha, commits, files_changed
+
+
+def _find_last_merge_pr(repo_path: Path, head_sha: str, ref_index: GitRefIndex | None) -> int | None:
+    repo = Repo(repo_path)
+    if ref_index:
+        return ref_index.last_merge_pr(repo, head_sha, _pr_number_from_message)
+    return _last_merge_pr_repo(repo, head_sha)
+
+
 def find_git_changes(event: GitChangesInput) -> GitChanges:
+    """`gh pr view`, the history walk and the remote lookup run concurrently.
+
+    The history only waits for the PR when its base is needed to find the start commit.
+    """
     repo_path = event.repo_path
-    pr_info = find_pr_info_or_none(repo_path)
     try:
         repo = Repo(repo_path)
         head_sha = repo.head.commit.hexsha
     except InvalidGitRepositoryError as e:
         logger.warning(f"not a git repo @ {repo_path}: {e!r}")
         return GitChanges.empty()
-    try:
-        start_commit = solve_since_sha(repo, event.repo_path, event.since, pr_info.base_ref_oid if pr_info else "")
-        start_sha = start_commit.hexsha
-        commits, files_changed = _parse_changes(repo, start_sha, head_sha)
-    except _NoGitChangesError:
-        commits = []
-        files_changed: set[str] = set()
-        start_sha = ""
-    try:
-        remote_url = read_remote_url(event.repo_path)
-    except RemoteURLNotFound as e:
-        logger.warning(repr(e))
-        remote_url = ""
+    ref_index = GitRefIndex.load(repo, event.cache_dir) if event.cache_dir else None
+    store = CommitStore.load(event.cache_dir) if event.cache_dir else None
+    history_deps = ("pr_info",) if event.since in {GitSince.PR_BASE_BRANCH, GitSince.DEFAULT} else ()
+    results = run_task_graph(
+        "git-changes",
+        [
+            Task("pr_info", partial(find_pr_info_or_none, repo_path)),
+            Task("remote_url", partial(_read_remote_url_or_empty, repo_path)),
+            Task("history", partial(_find_history, event, head_sha, ref_index, store), deps=history_deps),
+            Task("last_merge_pr", partial(_find_last_merge_pr, repo_path, head_sha, ref_index)),
+        ],
+    )
+    if ref_index:
+        ref_index.save()
+    if store:
+        store.save(repo_path)
+    start_sha, commits, files_changed = results["history"]
     return GitChanges(
         commits=sorted(commits),
         files_changed=files_changed,
         git=repo.git,
         start_sha=start_sha,
         end_sha=head_sha,
-        remote_url=remote_url,
-        pr_info=pr_info,
-        last_merge_pr=_last_merge_pr_repo(repo, head_sha) or GitChanges.DEFAULT_PR_NUMBER,
+        remote_url=results["remote_url"],
+        pr_info=results["pr_info"],
+        last_merge_pr=results["last_merge_pr"] or GitChanges.DEFAULT_PR_NUMBER,
+        commit_store=store,
     )
@@ -0,0 +1,73 @@
+"""Working tree queries used to find files changed since a commit."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo
+
+logger = logging.getLogger(__name__)
+
+
+def _open_repo(repo_path: Path) -> Repo | None:
+    try:
+        return Repo(repo_path)
+    except (InvalidGitRepositoryError, NoSuchPathError):
+        return None
+
+
+def git_head_sha(repo_path: Path) -> str | None:
+    """Full sha of HEAD, None outside a repo or before the first commit."""
+    if (repo := _open_repo(repo_path)) is None:
+        return None
+    try:
+        return repo.head.commit.hexsha
+    except ValueError:
+        return None
+
+
+def git_dirty_paths(repo_path: Path, pathspec: Path) -> set[str] | None:
+    """Modified, staged, deleted and untracked files under `pathspec`, relative to `repo_path`."""
+    if (repo := _open_repo(repo_path)) is None:
+        return None
+    try:
+        output = repo.git.status("--porcelain", "-z", "--untracked-files=all", "--", str(pathspec))
+    except GitCommandError as e:
+        logger.warning(f"git status failed: {e}")
+        return None
+    paths: set[str] = set()
+    entries = iter(output.split("\0"))
+    for entry in entries:
+        if not entry:
+            continue
+        status, path = entry[:2], entry[3:]
+        paths.add(path)
+        if "R" in status or "C" in status:
+            paths.add(next(entries, ""))  # -z prints the rename source as the next entry
+    paths.discard("")
+    return paths
+
+
+def git_tracked_paths(repo_path: Path, pathspec: Path) -> set[str] | None:
+    """Files under `pathspec` in the index, relative to `repo_path`."""
+    if (repo := _open_repo(repo_path)) is None:
+        return None
+    try:
+        output = repo.git.ls_files("-z", "--", str(pathspec))
+    except GitCommandError as e:
+        logger.warning(f"git ls-files failed: {e}")
+        return None
+    return {path for path in output.split("\0") if path}
+
+
+def git_changed_paths_since(repo_path: Path, sha: str, pathspec: Path) -> set[str] | None:
+    """Files under `pathspec` that differ between `sha` and the working tree, None when `sha` is unknown."""
+    if (repo := _open_repo(repo_path)) is None:
+        return None
+    try:
+        output = repo.git.diff("--name-only", "--no-renames", "-z", sha, "--", str(pathspec))
+    except GitCommandError as e:
+        logger.info(f"cannot diff against {sha}: {e.stderr.strip()}")
+        return None
+    return {path for path in output.split("\0") if path}
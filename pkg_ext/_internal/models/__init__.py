@@ -20,7 +20,7 @@ from .api_dump import (
 from .code_state import PkgCodeState
 from .groups import PublicGroup, PublicGroups
 from .py_files import PkgFileBase, PkgSrcFile, PkgTestFile
-from .py_symbols import RefSymbol, SymbolType
+from .py_symbols import CompactSymbol, RefSymbol, SymbolType
 from .ref_state import RefState, RefStateType, RefStateWithSymbol
 from .types import (
     PyIdentifier,
@@ -46,6 +46,7 @@ __all__ = [
     # Symbols
     "SymbolType",
     "RefSymbol",
+    "CompactSymbol",
     # Files
     "PkgFileBase",
     "PkgSrcFile",
@@ -118,6 +118,8 @@ class GlobalVarDump(SymbolDumpBase):
     value_repr: str | None = None
 
 
+STATIC_API_DUMP_ENGINE = "static"
+
 SymbolDump = Annotated[
     FunctionDump | CLICommandDump | ClassDump | ExceptionDump | TypeAliasDump | GlobalVarDump,
     Field(discriminator="type"),
@@ -140,6 +142,11 @@ class PublicApiDump(Entity):
     version: str
     groups: list[GroupDump] = Field(default_factory=list)
     dumped_at: datetime
+    engine: str | None = Field(
+        default=None,
+        description=f"`{STATIC_API_DUMP_ENGINE}` for `dump-api --static`, None for the runtime dump. "
+        "Dumps of different engines are not comparable.",
+    )
 
     def get_group(self, name: str) -> GroupDump:
         for g in self.groups:
@@ -4,11 +4,12 @@ from pydoc import locate
 from typing import Any, Iterable
 
 from model_lib import Entity
-from pydantic import model_validator
+from pydantic import PrivateAttr, model_validator
 from zero_3rdparty.object_name import as_name
 
 from pkg_ext._internal.errors import LocateError, RefSymbolNotInCodeError
 
+from .import_graph import dependency_order, resolve_import_edges
 from .py_files import PkgSrcFile, PkgTestFile
 from .py_symbols import RefSymbol
 from .ref_state import RefStateWithSymbol
@@ -20,36 +21,53 @@ class PkgCodeState(Entity):
     import_id_refs: dict[str, RefSymbol]
     files: list[PkgSrcFile | PkgTestFile]
 
-    def _add_transitive_dependencies(self) -> None:
-        while True:
-            new_dependencies = False
-            for file in self.files:
-                for other_file in self.files:
-                    if file == other_file or other_file in file.dependencies:
-                        continue
-                    if file._depend_from_import(other_file):
-                        file.dependencies.add(other_file)
-                        new_dependencies = True
-            if not new_dependencies:
-                break
+    _refs_by_local_id: dict[str, RefSymbol] = PrivateAttr(default_factory=dict)
+    _refs_by_name: dict[str, list[RefSymbol]] = PrivateAttr(default_factory=dict)
+    _symbol_file_position: dict[tuple[str, str], int] = PrivateAttr(default_factory=dict)
+    _rel_path_position: dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def _add_dependencies(self) -> None:
+        files = self.files
+        edges = resolve_import_edges(files)
+        for file, file_edges in zip(files, edges, strict=True):
+            file._dependencies = frozenset(files[i] for i in file_edges)
+        for order, i in enumerate(dependency_order(files, edges)):
+            files[i]._dependency_order = order
 
     @model_validator(mode="after")
     def validate_and_prepare(self):
         if not self.import_id_refs:
             raise ValueError("No code state found")
-        self._add_transitive_dependencies()
+        self._add_dependencies()
         self.files.sort()
+        self._build_indexes()
         return self
 
+    def _build_indexes(self) -> None:
+        """First match wins in all indexes, same as the linear scans they replace."""
+        refs_by_local_id: dict[str, RefSymbol] = {}
+        refs_by_name: dict[str, list[RefSymbol]] = {}
+        for ref in self.import_id_refs.values():
+            refs_by_local_id.setdefault(ref.local_id, ref)
+            refs_by_name.setdefault(ref.name, []).append(ref)
+        symbol_file_position: dict[tuple[str, str], int] = {}
+        rel_path_position: dict[str, int] = {}
+        for i, file in enumerate(self.files):
+            rel_path_position.setdefault(file.relative_path, i)
+            module_name = file.module_local_path
+            for symbol in file.compact_symbols:
+                symbol_file_position.setdefault((module_name, symbol.name), i)
+        self._refs_by_local_id = refs_by_local_id
+        self._refs_by_name = refs_by_name
+        self._symbol_file_position = symbol_file_position
+        self._rel_path_position = rel_path_position
+
     def ref_symbol(self, name_or_local_id: str) -> RefSymbol:
         if ref := self.import_id_refs.get(name_or_local_id):
             return ref
-        matches: list[RefSymbol] = []
-        for ref in self.import_id_refs.values():
-            if ref.local_id == name_or_local_id:
-                return ref
-            if ref.name == name_or_local_id:
-                matches.append(ref)
+        if ref := self._refs_by_local_id.get(name_or_local_id):
+            return ref
+        matches = self._refs_by_name.get(name_or_local_id, [])
         if len(matches) == 1:
             return matches[0]
         if matches:
@@ -79,13 +97,11 @@ class PkgCodeState(Entity):
 
     def sort_refs(self, refs: Iterable[SymbolRefId]) -> list[SymbolRefId]:
         def lookup_in_file(ref: SymbolRefId) -> tuple[int, str]:
-            module_name = ref_id_module(ref)
             ref_name = ref_id_name(ref)
-            for i, file in enumerate(self.files):
-                for symbol in file.iterate_ref_symbols():
-                    if symbol.name == ref_name and file.module_local_path == module_name:
-                        return i, ref_name
-            raise ValueError(f"ref not found in any file: {ref}")
+            position = self._symbol_file_position.get((ref_id_module(ref), ref_name))
+            if position is None:
+                raise ValueError(f"ref not found in any file: {ref}")
+            return position, ref_name
 
         return sorted(refs, key=lookup_in_file)
 
@@ -99,9 +115,9 @@ class PkgCodeState(Entity):
         """
 
         def key_in_files(rel_path: str) -> int:
-            for i, file in enumerate(self.files):
-                if file.relative_path == rel_path:
-                    return i
-            raise ValueError(f"rel_path not found in any file: {rel_path}")
+            position = self._rel_path_position.get(rel_path)
+            if position is None:
+                raise ValueError(f"rel_path not found in any file: {rel_path}")
+            return position
 
         return sorted(paths, key=key_in_files, reverse=reverse)
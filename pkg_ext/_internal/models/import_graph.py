@@ -0,0 +1,118 @@
+"""Module import graph between package files.
+
+Edges are resolved once through a `module_full_name -> file` index, import cycles are collapsed
+with Tarjan's SCC algorithm and the condensed graph is ordered with Kahn's algorithm.
+Ties (and members of the same cycle) are ordered by `relative_path`, so the order is deterministic.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Sequence
+
+from .py_files import PkgFileBase
+
+
+def _import_candidates(import_ref: str) -> list[str]:
+    """`a.b.c` -> [`a.b.c`, `a.b`, `a`], an import of `a.b.c` depends on whichever of them is a module."""
+    parts = import_ref.split(".")
+    return [".".join(parts[:end]) for end in range(len(parts), 0, -1)]
+
+
+def resolve_import_edges(files: Sequence[PkgFileBase]) -> list[set[int]]:
+    """Returns the indexes of the files each file imports from, self imports are skipped."""
+    module_index = {file.module_full_name: i for i, file in enumerate(files)}
+    edges: list[set[int]] = []
+    for i, file in enumerate(files):
+        file_edges: set[int] = set()
+        for import_ref in file.local_imports:
+            for candidate in _import_candidates(import_ref):
+                other = module_index.get(candidate)
+                if other is not None and other != i:
+                    file_edges.add(other)
+        edges.append(file_edges)
+    return edges
+
+
+def _pop_component(stack: list[int], on_stack: list[bool], root: int) -> list[int]:
+    component: list[int] = []
+    while True:
+        member = stack.pop()
+        on_stack[member] = False
+        component.append(member)
+        if member == root:
+            return component
+
+
+def strongly_connected_components(edges: Sequence[set[int]]) -> list[list[int]]:
+    """Iterative Tarjan, components are returned in reverse topological order (dependencies first)."""
+    index_counter = 0
+    indexes: list[int | None] = [None] * len(edges)
+    low_links = [0] * len(edges)
+    on_stack = [False] * len(edges)
+    stack: list[int] = []
+    components: list[list[int]] = []
+
+    for root in range(len(edges)):
+        if indexes[root] is not None:
+            continue
+        work: list[tuple[int, list[int]]] = [(root, sorted(edges[root]))]
+        indexes[root] = low_links[root] = index_counter
+        index_counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        while work:
+            node, pending = work[-1]
+            if pending:
+                child = pending.pop()
+                if indexes[child] is None:
+                    indexes[child] = low_links[child] = index_counter
+                    index_counter += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, sorted(edges[child])))
+                elif on_stack[child]:
+                    low_links[node] = min(low_links[node], indexes[child])  # type: ignore[arg-type]
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low_links[parent] = min(low_links[parent], low_links[node])
+            if low_links[node] == indexes[node]:
+                components.append(_pop_component(stack, on_stack, node))
+    return components
+
+
+def dependency_order(files: Sequence[PkgFileBase], edges: Sequence[set[int]]) -> list[int]:
+    """File indexes ordered so every file comes after the files it imports from (cycles are kept together)."""
+    components = strongly_connected_components(edges)
+    component_of = [0] * len(files)
+    for component_id, component in enumerate(components):
+        for member in component:
+            component_of[member] = component_id
+    sorted_members = [sorted(component, key=lambda i: files[i].relative_path) for component in components]
+
+    dependents: list[set[int]] = [set() for _ in components]
+    remaining_deps = [0] * len(components)
+    for node, node_edges in enumerate(edges):
+        for dep in node_edges:
+            source, target = component_of[dep], component_of[node]
+            if source != target and target not in dependents[source]:
+                dependents[source].add(target)
+                remaining_deps[target] += 1
+
+    ready = [
+        (files[members[0]].relative_path, component_id)
+        for component_id, members in enumerate(sorted_members)
+        if remaining_deps[component_id] == 0
+    ]
+    heapq.heapify(ready)
+    order: list[int] = []
+    while ready:
+        _, component_id = heapq.heappop(ready)
+        order.extend(sorted_members[component_id])
+        for dependent in dependents[component_id]:
+            remaining_deps[dependent] -= 1
+            if remaining_deps[dependent] == 0:
+                heapq.heappush(ready, (files[sorted_members[dependent][0]].relative_path, dependent))
+    return order
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-from contextlib import suppress
 from functools import total_ordering
 from pathlib import Path
 from typing import Iterable
 
 from model_lib import Entity
-from pydantic import Field, ValidationError, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 
-from .py_symbols import RefSymbol, SymbolType
+from .py_symbols import CompactSymbol, RefSymbol, SymbolType
 from .types import as_module_path, is_dunder_file, is_test_file
 
 
@@ -18,7 +17,13 @@ class PkgFileBase(Entity):
     relative_path: str
     pkg_import_name: str = Field(description="Name of the package")
     local_imports: set[str] = Field(default_factory=set)  # should be in the format of ref_id (see `ref_id` function)
-    dependencies: set[PkgFileBase] = Field(default_factory=set, description="Added by the PkgCodeState")
+    _dependencies: frozenset[PkgFileBase] = PrivateAttr(default=frozenset())  # set by the PkgCodeState
+    _dependency_order: int = PrivateAttr(default=0)
+
+    @property
+    def dependencies(self) -> frozenset[PkgFileBase]:
+        """Files this file imports from, added by the PkgCodeState."""
+        return self._dependencies
 
     @property
     def module_local_path(self) -> str:
@@ -35,25 +40,22 @@ class PkgFileBase(Entity):
             raise TypeError(f"Expected PkgFileBase, got {type(other)}")
         return other in self.dependencies
 
-    def _depend_from_import(self, other: PkgFileBase) -> bool:
-        other_import_name = other.module_full_name
-        other_import_ref = f"{other_import_name}."
-        return any(ref.startswith(other_import_ref) or ref == other_import_name for ref in self.local_imports)
+    @property
+    def compact_symbols(self) -> tuple[CompactSymbol, ...]:
+        return ()
 
     def iterate_ref_symbols(self) -> Iterable[RefSymbol]:
-        yield from []
+        for symbol in self.compact_symbols:
+            yield symbol.as_ref_symbol()
 
     def iterate_usage_ids(self) -> Iterable[str]:
         yield from self.local_imports
 
     def __lt__(self, other) -> bool:
+        """Dependency order precomputed by the PkgCodeState, `relative_path` as tie breaker."""
         if not isinstance(other, PkgFileBase):
             raise TypeError
-        if self.depends_on(other):
-            return False
-        if other.depends_on(self):
-            return True
-        return self.relative_path < other.relative_path
+        return (self._dependency_order, self.relative_path) < (other._dependency_order, other.relative_path)
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, PkgFileBase):
@@ -71,6 +73,9 @@ class PkgSrcFile(PkgFileBase):
     classes: list[str] = Field(default_factory=list)
     exceptions: list[str] = Field(default_factory=list)
 
+    # (name lists with their lengths, symbols), a single private attr as each access goes through pydantic
+    _compact: tuple[tuple[tuple[list[str], int], ...], tuple[CompactSymbol, ...]] | None = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def ensure_not_a_test(self):
         if is_test_file(self.path):
@@ -79,25 +84,32 @@ class PkgSrcFile(PkgFileBase):
             raise ValueError(f"File {self.path} is a dunder file, not a src file.")
         return self
 
-    def iterate_ref_symbols(self) -> Iterable[RefSymbol]:
-        def yield_safely(symbol_name: str, symbol_type: SymbolType):
-            with suppress(ValidationError):
-                yield RefSymbol(
-                    name=symbol_name,
-                    type=symbol_type,
-                    rel_path=self.relative_path,
-                )
-
-        for symbol_name in self.type_aliases:
-            yield from yield_safely(symbol_name, SymbolType.TYPE_ALIAS)
-        for symbol_name in self.global_vars:
-            yield from yield_safely(symbol_name, SymbolType.GLOBAL_VAR)
-        for symbol_name in self.functions:
-            yield from yield_safely(symbol_name, SymbolType.FUNCTION)
-        for symbol_name in self.classes:
-            yield from yield_safely(symbol_name, SymbolType.CLASS)
-        for symbol_name in self.exceptions:
-            yield from yield_safely(symbol_name, SymbolType.EXCEPTION)
+    @property
+    def compact_symbols(self) -> tuple[CompactSymbol, ...]:
+        """Symbol names are validated once per name lists, invalid names are skipped.
+
+        Rebuilt when a list is replaced (e.g., `model_copy(update=...)`, which copies the private attrs) or its length
+        changed. Comparing the same list objects is an identity check, the lists are only appended to by the parser.
+        """
+        by_type = (
+            (SymbolType.TYPE_ALIAS, self.type_aliases),
+            (SymbolType.GLOBAL_VAR, self.global_vars),
+            (SymbolType.FUNCTION, self.functions),
+            (SymbolType.CLASS, self.classes),
+            (SymbolType.EXCEPTION, self.exceptions),
+        )
+        source = tuple((names, len(names)) for _, names in by_type)
+        compact = self._compact
+        if compact is not None and compact[0] == source:
+            return compact[1]
+        symbols = tuple(
+            symbol
+            for symbol_type, names in by_type
+            for name in names
+            if (symbol := CompactSymbol.parse(name, symbol_type, self.relative_path))
+        )
+        self._compact = (source, symbols)
+        return symbols
 
 
 class PkgTestFile(PkgFileBase):
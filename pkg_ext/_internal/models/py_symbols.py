@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from dataclasses import dataclass
 from functools import total_ordering
 
 from model_lib import Entity
@@ -19,6 +21,43 @@ class SymbolType(StrEnum):
     UNKNOWN = "unknown"
 
 
+def symbol_name_error(name: str, type: SymbolType) -> str | None:
+    """Returns why `name` is not a valid public symbol of `type`, None when it is valid."""
+    if not name:
+        return "Symbol name cannot be empty"
+    if name[0] == "_":
+        return f"Symbol name {name} cannot start with '_', '_' is reserved for private symbols"
+    match type:
+        case SymbolType.GLOBAL_VAR if not name.isupper() or len(name) < 2:
+            return f"Global variable {name} should be in uppercase and longer than 1 character"
+        case SymbolType.EXCEPTION if not name.endswith("Error"):
+            return f"Exception {name} should end with 'Error'"
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class CompactSymbol:
+    """Parse time representation of a symbol, validated once and converted to a `RefSymbol` at the boundaries."""
+
+    name: str
+    type: SymbolType
+    rel_path: str
+
+    @classmethod
+    def parse(cls, name: str, type: SymbolType, rel_path: str) -> CompactSymbol | None:
+        """Returns None for names `RefSymbol` would reject."""
+        if symbol_name_error(name, type):
+            return None
+        return cls(sys.intern(name), type, sys.intern(rel_path))
+
+    @property
+    def local_id(self) -> SymbolRefId:
+        return ref_id(self.rel_path, self.name)
+
+    def as_ref_symbol(self) -> RefSymbol:
+        return RefSymbol.model_construct(name=self.name, type=self.type, rel_path=self.rel_path)
+
+
 @total_ordering
 class RefSymbol(Entity):
     name: str = Field(description="Symbol name")
@@ -39,13 +78,8 @@ class RefSymbol(Entity):
     @model_validator(mode="after")
     def ensure_valid_name(self):
         assert self.name, "Symbol name cannot be empty"
-        if self.name[0] == "_":
-            raise ValueError(f"Symbol name {self.name} cannot start with '_', '_' is reserved for private symbols")
-        match self.type:
-            case SymbolType.GLOBAL_VAR if not self.name.isupper() or len(self.name) < 2:
-                raise ValueError(f"Global variable {self.name} should be in uppercase and longer than 1 character")
-            case SymbolType.EXCEPTION if not self.name.endswith("Error"):
-                raise ValueError(f"Exception {self.name} should end with 'Error'")
+        if error := symbol_name_error(self.name, self.type):
+            raise ValueError(error)
         return self
 
     @property
@@ -1,3 +1,5 @@
+import logging
+import tracemalloc
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Callable
@@ -15,6 +17,7 @@ from pkg_ext._internal.changelog.actions import (
 from pkg_ext._internal.changelog.parser import parse_changelog
 from pkg_ext._internal.errors import RefSymbolNotInCodeError
 from pkg_ext._internal.models import (
+    CompactSymbol,
     PkgCodeState,
     PublicGroups,
     RefSymbol,
@@ -25,6 +28,8 @@ from pkg_ext._internal.models.ref_state import RefState, RefStateType
 from pkg_ext._internal.pkg_state import PkgExtState
 from pkg_ext._internal.settings import PkgSettings
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.fixture()
 def _public_groups(tmp_path) -> PublicGroups:
@@ -432,3 +437,116 @@ def test_removed_refs_detects_specific_deletion(tmp_path):
     group, ref_state = removed[0]
     assert group == "core"
     assert ref_state.name == "init_cmd"
+
+
+def _import_graph_code_state(imports: dict[str, list[str]]) -> PkgCodeState:
+    """`imports` maps a module name to the modules it imports a `func` from."""
+    files = [
+        PkgSrcFile(
+            path=Path(f"/tmp/pkg/{module}.py"),
+            relative_path=f"{module}.py",
+            pkg_import_name="pkg",
+            local_imports={f"pkg.{dep}.func" for dep in deps},
+            functions=["func"],
+        )
+        for module, deps in imports.items()
+    ]
+    import_id_refs = {f"pkg.{module}.func": _ref("func", module) for module in imports}
+    return PkgCodeState(pkg_import_name="pkg", import_id_refs=import_id_refs, files=files)
+
+
+def _file_order(code: PkgCodeState) -> list[str]:
+    return [file.module_local_path for file in code.files]
+
+
+def test_files_sorted_in_dependency_order():
+    code = _import_graph_code_state({"a": ["b"], "b": ["c"], "c": [], "d": [], "e": ["a"]})
+    assert _file_order(code) == ["c", "b", "a", "d", "e"]
+    a_file = code.files[2]
+    assert {file.module_local_path for file in a_file.dependencies} == {"b"}
+    assert code.sort_rel_paths_by_dependecy_order(["a.py", "c.py", "e.py"]) == ["e.py", "a.py", "c.py"]
+
+
+def test_files_sorted_with_import_cycles_is_deterministic():
+    imports = {"z": ["x"], "x": ["y"], "y": ["x", "base"], "base": [], "app": ["z", "y"]}
+    code = _import_graph_code_state(imports)
+    assert _file_order(code) == ["base", "x", "y", "z", "app"]
+    reversed_code = _import_graph_code_state(dict(reversed(imports.items())))
+    assert _file_order(reversed_code) == _file_order(code)
+    files = code.files
+    assert sorted(files[::-1]) == files
+    for i, file in enumerate(files):
+        assert all(file < later for later in files[i + 1 :])
+
+
+def test_file_depends_on_imported_module_itself():
+    code = _import_graph_code_state({"a": [], "b": []})
+    b_file = code.files[1]
+    b_file.local_imports = {"pkg.a"}  # from pkg import a
+    code = PkgCodeState(pkg_import_name="pkg", import_id_refs=code.import_id_refs, files=list(reversed(code.files)))
+    assert _file_order(code) == ["a", "b"]
+    assert code.files[1].depends_on(code.files[0])
+
+
+def test_sort_refs_uses_file_order_then_name():
+    code = _import_graph_code_state({"a": ["b"], "b": []})
+    code.files[0].functions.append("other")
+    code = PkgCodeState(pkg_import_name="pkg", import_id_refs=code.import_id_refs, files=code.files)
+    assert code.sort_refs(["a.func", "b.other", "b.func"]) == ["b.func", "b.other", "a.func"]
+    with pytest.raises(ValueError, match="ref not found"):
+        code.sort_refs(["a.missing"])
+    with pytest.raises(ValueError, match="rel_path not found"):
+        code.sort_rel_paths_by_dependecy_order(["missing.py"])
+
+
+def _synthetic_src_files(file_count: int, symbols_per_file: int) -> list[PkgSrcFile]:
+    return [
+        PkgSrcFile(
+            path=Path(f"/tmp/pkg/_internal/mod_{i}.py"),
+            relative_path=f"_internal/mod_{i}.py",
+            pkg_import_name="pkg",
+            functions=[f"func_{j}" for j in range(symbols_per_file // 2)],
+            classes=[f"Cls{j}" for j in range(symbols_per_file - symbols_per_file // 2)],
+        )
+        for i in range(file_count)
+    ]
+
+
+def _traced_peak(create: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        created = create()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert created
+    return peak
+
+
+def test_compact_symbols_memory_10k_symbols():
+    files = _synthetic_src_files(file_count=500, symbols_per_file=20)
+    compact = [symbol for file in files for symbol in file.compact_symbols]
+    assert len(compact) == 10_000
+    assert [symbol.as_ref_symbol() for symbol in compact[:3]] == [
+        RefSymbol(name=f"func_{j}", type=SymbolType.FUNCTION, rel_path="_internal/mod_0.py") for j in range(3)
+    ]
+    compact_peak = _traced_peak(
+        lambda: [CompactSymbol.parse(s.name, s.type, s.rel_path) for file in files for s in file.compact_symbols]
+    )
+    pydantic_peak = _traced_peak(
+        lambda: [
+            RefSymbol(name=s.name, type=s.type, rel_path=s.rel_path) for file in files for s in file.compact_symbols
+        ]
+    )
+    logger.info(f"10k symbols peak memory: compact={compact_peak:_} bytes, pydantic={pydantic_peak:_} bytes")
+    assert compact_peak * 3 < pydantic_peak
+
+
+def test_compact_symbols_follow_the_name_lists():
+    file = PkgSrcFile(path=Path("/tmp/pkg/a.py"), relative_path="a.py", pkg_import_name="pkg", functions=["f"])
+    assert [ref.name for ref in file.iterate_ref_symbols()] == ["f"]
+    file.functions.append("g")
+    assert [ref.name for ref in file.iterate_ref_symbols()] == ["f", "g"]
+    copied = file.model_copy(update={"functions": ["h"]})
+    assert [ref.name for ref in copied.iterate_ref_symbols()] == ["h"]
+    assert [ref.name for ref in file.iterate_ref_symbols()] == ["f", "g"]
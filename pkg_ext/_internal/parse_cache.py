@@ -0,0 +1,129 @@
+"""Persistent cache of `parse_symbols` results.
+
+Entries are keyed by the file's relative path and validated by (mtime_ns, size) first and
+the sha256 of the content second, so a `git checkout` that only touches mtimes is still a hit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Self
+
+from pkg_ext._internal.disk_cache import ensure_cache_dir, read_json_cache, write_json_cache
+from pkg_ext._internal.file_parser import ParsedFile, parsed_file_as_dict, parsed_file_from_dict
+
+CACHE_VERSION = 1
+PARSE_CACHE_FILENAME = "parse_symbols.json"
+
+
+def _content_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@dataclass
+class ParseCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.total if self.total else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.hits}/{self.total} hits ({self.hit_rate:.0%})"
+
+
+@dataclass
+class ParseCache:
+    path: Path
+    fingerprint: str
+    entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    stats: ParseCacheStats = field(default_factory=ParseCacheStats)
+    _changed: bool = False
+
+    @classmethod
+    def load(cls, cache_dir: Path, fingerprint: str) -> Self:
+        path = cache_dir / PARSE_CACHE_FILENAME
+        raw = read_json_cache(path)
+        if not isinstance(raw, dict) or raw.get("fingerprint") != fingerprint:
+            return cls(path=path, fingerprint=fingerprint)
+        return cls(path=path, fingerprint=fingerprint, entries=raw.get("entries", {}))
+
+    def parse(
+        self,
+        path: Path,
+        rel_path: str,
+        pkg_import_name: str,
+        parse_fn: Callable[[Path, str], ParsedFile | None],
+    ) -> ParsedFile | None:
+        return self.parse_many(
+            [(path, rel_path)],
+            pkg_import_name,
+            lambda files: [parse_fn(file_path, file_rel_path) for file_path, file_rel_path in files],
+        )[0]
+
+    def parse_many(
+        self,
+        files: list[tuple[Path, str]],
+        pkg_import_name: str,
+        parse_many_fn: Callable[[list[tuple[Path, str]]], list[ParsedFile | None]],
+    ) -> list[ParsedFile | None]:
+        """Resolve hits from the cache and parse all misses with a single `parse_many_fn` call."""
+        results: list[ParsedFile | None] = [None] * len(files)
+        misses: list[tuple[int, os.stat_result, str]] = []
+        for index, (path, rel_path) in enumerate(files):
+            stat = path.stat()
+            entry = self.entries.get(rel_path)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                self.stats.hits += 1
+                results[index] = parsed_file_from_dict(entry["parsed"], path, rel_path, pkg_import_name)
+                continue
+            digest = _content_hash(path)
+            if entry and entry["sha256"] == digest:
+                self.stats.hits += 1
+                entry["mtime_ns"] = stat.st_mtime_ns
+                entry["size"] = stat.st_size
+                self._changed = True
+                results[index] = parsed_file_from_dict(entry["parsed"], path, rel_path, pkg_import_name)
+                continue
+            misses.append((index, stat, digest))
+        if not misses:
+            return results
+        self.stats.misses += len(misses)
+        parsed_misses = parse_many_fn([files[index] for index, _, _ in misses])
+        for (index, stat, digest), parsed in zip(misses, parsed_misses, strict=True):
+            results[index] = parsed
+            self.entries[files[index][1]] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": digest,
+                "parsed": parsed_file_as_dict(parsed),
+            }
+        self._changed = True
+        return results
+
+    def prune(self, rel_paths: set[str]) -> None:
+        """Drop entries for files that no longer exist."""
+        if removed := self.entries.keys() - rel_paths:
+            for rel_path in removed:
+                del self.entries[rel_path]
+            self._changed = True
+
+    def save(self) -> None:
+        if not self._changed:
+            return
+        ensure_cache_dir(self.path.parent)
+        write_json_cache(self.path, {"fingerprint": self.fingerprint, "entries": self.entries})
+        self._changed = False
+
+
+def parse_cache_fingerprint(pkg_import_name: str, file_header: str) -> str:
+    """Any input that changes the result of `parse_symbols` for the same content must be part of the fingerprint."""
+    return hashlib.sha256(f"{CACHE_VERSION}:{pkg_import_name}:{file_header}".encode()).hexdigest()
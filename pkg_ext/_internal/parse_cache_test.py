@@ -0,0 +1,108 @@
+import os
+
+from pkg_ext._internal.cli.workflows import parse_pkg_code_state
+from pkg_ext._internal.disk_cache import read_json_cache
+from pkg_ext._internal.file_parser import (
+    PARALLEL_PARSE_MIN_FILES,
+    parse_symbols,
+    parsed_file_as_dict,
+    parsed_file_from_dict,
+)
+from pkg_ext._internal.models import PkgSrcFile, PkgTestFile
+from pkg_ext._internal.parse_cache import (
+    PARSE_CACHE_FILENAME,
+    ParseCache,
+    parse_cache_fingerprint,
+)
+from pkg_ext._internal.settings import PkgSettings
+
+_FINGERPRINT = parse_cache_fingerprint("my_pkg", "# Generated")
+
+
+def _parse(path, rel_path):
+    return parse_symbols(path, rel_path, "my_pkg")
+
+
+def test_parsed_file_roundtrip(tmp_path):
+    src_path = tmp_path / "mod.py"
+    src_path.write_text("from my_pkg.other import helper\n\ndef public(): ...\n\nclass MyError(Exception): ...\n")
+    test_path = tmp_path / "mod_test.py"
+    test_path.write_text("from my_pkg.mod import public\n")
+    for path in [src_path, test_path]:
+        parsed = _parse(path, path.name)
+        assert isinstance(parsed, PkgSrcFile | PkgTestFile)
+        loaded = parsed_file_from_dict(parsed_file_as_dict(parsed), path, path.name, "my_pkg")
+        assert loaded == parsed
+        assert loaded.model_dump() == parsed.model_dump()
+    assert parsed_file_from_dict(parsed_file_as_dict(None), src_path, "mod.py", "my_pkg") is None
+
+
+def test_parse_cache_hits_on_unchanged_and_touched_files(tmp_path):
+    path = tmp_path / "mod.py"
+    path.write_text("def public(): ...\n")
+    cache = ParseCache.load(tmp_path, _FINGERPRINT)
+    first = cache.parse(path, "mod.py", "my_pkg", _parse)
+    cache.save()
+    assert str(cache.stats) == "0/1 hits (0%)"
+
+    cache = ParseCache.load(tmp_path, _FINGERPRINT)
+    assert cache.parse(path, "mod.py", "my_pkg", _parse) == first
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000))
+    assert cache.parse(path, "mod.py", "my_pkg", _parse) == first
+    assert cache.stats.hits == 2
+
+    path.write_text("def public(): ...\ndef other(): ...\n")
+    changed = cache.parse(path, "mod.py", "my_pkg", _parse)
+    assert isinstance(changed, PkgSrcFile)
+    assert changed.functions == ["public", "other"]
+    assert cache.stats.misses == 1
+
+
+def test_parse_cache_fingerprint_change_invalidates(tmp_path):
+    path = tmp_path / "mod.py"
+    path.write_text("def public(): ...\n")
+    cache = ParseCache.load(tmp_path, _FINGERPRINT)
+    cache.parse(path, "mod.py", "my_pkg", _parse)
+    cache.save()
+    assert ParseCache.load(tmp_path, _FINGERPRINT).entries
+    assert not ParseCache.load(tmp_path, parse_cache_fingerprint("my_pkg", "# Other header")).entries
+
+
+def test_parse_pkg_code_state_uses_cache(settings: PkgSettings):
+    (settings.pkg_directory / "mod.py").write_text("def public(): ...\n")
+    (settings.pkg_directory / "removed.py").write_text("def gone(): ...\n")
+    first = parse_pkg_code_state(settings)
+    cache_path = settings.cache_dir / PARSE_CACHE_FILENAME
+    assert (settings.cache_dir / ".gitignore").exists()
+    assert set(read_json_cache(cache_path)["entries"]) == {"__init__.py", "mod.py", "removed.py"}
+
+    (settings.pkg_directory / "removed.py").unlink()
+    second = parse_pkg_code_state(settings)
+    assert set(second.import_id_refs) == set(first.import_id_refs) - {"my_pkg.removed.gone"}
+    assert set(read_json_cache(cache_path)["entries"]) == {"__init__.py", "mod.py"}
+
+
+def test_parse_pkg_code_state_no_cache(settings: PkgSettings):
+    (settings.pkg_directory / "mod.py").write_text("def public(): ...\n")
+    settings.use_cache = False
+    code_state = parse_pkg_code_state(settings)
+    assert "my_pkg.mod.public" in code_state.import_id_refs
+    assert not settings.cache_dir.exists()
+
+
+def test_parse_pkg_code_state_serial_and_parallel_are_identical(settings: PkgSettings):
+    settings.use_cache = False
+    for i in range(PARALLEL_PARSE_MIN_FILES + 8):
+        (settings.pkg_directory / f"mod_{i}.py").write_text(
+            f"from my_pkg.mod_{max(i - 1, 0)} import func_{max(i - 1, 0)}\n\n"
+            f"MAX_{i} = {i}\n\ndef func_{i}(): ...\n\nclass Cls{i}: ...\n\nclass Err{i}Error(Exception): ...\n"
+        )
+        (settings.pkg_directory / f"mod_{i}_test.py").write_text(f"from my_pkg.mod_{i} import Cls{i}\n")
+    settings.parse_workers = 1
+    serial = parse_pkg_code_state(settings)
+    settings.parse_workers = 4
+    parallel = parse_pkg_code_state(settings)
+    assert len(serial.import_id_refs) == 4 * (PARALLEL_PARSE_MIN_FILES + 8)
+    assert serial.import_id_refs == parallel.import_id_refs
+    assert [file.relative_path for file in serial.files] == [file.relative_path for file in parallel.files]
@@ -9,7 +9,6 @@ from pkg_ext._internal.changelog import (
     GroupModuleAction,
     KeepPrivateAction,
     MakePublicAction,
-    parse_changelog_actions,
 )
 from pkg_ext._internal.models import RefSymbol
 from pkg_ext._internal.reference_handling.added import get_or_prompt_group
@@ -31,7 +30,7 @@ def match_symbol_in_code(private: KeepPrivateAction, code_state: PkgCodeState) -
 
 
 def find_private_symbols(ctx: pkg_ctx) -> list[PromotableEntry]:
-    all_actions = parse_changelog_actions(ctx.settings.changelog_dir)
+    all_actions = (ctx.changelog_store or ctx.settings.changelog_store()).all()
 
     already_public = {action.name for action in all_actions if isinstance(action, MakePublicAction)}
     private_entries = [action for action in all_actions if isinstance(action, KeepPrivateAction)]
@@ -7,6 +7,7 @@ from pydantic_settings import BaseSettings
 from zero_3rdparty import file_utils
 
 from pkg_ext._internal.changelog.actions import BumpType
+from pkg_ext._internal.changelog.store import ChangelogStore
 from pkg_ext._internal.config import ProjectConfig, load_project_config, load_user_config
 from pkg_ext._internal.errors import RemoteURLNotFound
 from pkg_ext._internal.git_usage import read_remote_url
@@ -29,6 +30,7 @@ class PkgSettings(BaseSettings):
     INIT_FILENAME: ClassVar[str] = "__init__.py"
     WARNINGS_FILENAME: ClassVar[str] = "_warnings.py"
     DOCS_DIR_NAME: ClassVar[str] = "docs"
+    CACHE_DIR_NAME: ClassVar[str] = ".pkg-ext-cache"
 
     after_file_write_hooks: tuple[str, ...] | None = Field(default=None)
     changelog_cleanup_count: int = Field(
@@ -58,6 +60,19 @@ class PkgSettings(BaseSettings):
     max_bump_type: BumpType | None = None
     default_branch: str = ProjectConfig.DEFAULT_BRANCH
     repo_url: str = ""
+    use_cache: bool = Field(default=True, description="Reuse parse results of unchanged files across runs.")
+    incremental: bool = Field(
+        default=False,
+        description="Only re-parse files git reports as changed since the last snapshot, requires use_cache.",
+    )
+    verify_checkpoint: bool = Field(
+        default=False,
+        description="Replay all changelog actions and fail if the result differs from the changelog checkpoint.",
+    )
+    parse_workers: int = Field(
+        default=ProjectConfig.DEFAULT_PARSE_WORKERS,
+        description="Processes used to parse source files, 0 uses one per cpu and 1 parses serially.",
+    )
 
     def _with_dev_suffix(self, path: Path) -> Path:
         if self.dev_mode:
@@ -91,6 +106,19 @@ class PkgSettings(BaseSettings):
     def changelog_dir(self) -> DirectoryPath:
         return self.state_dir / self.CHANGELOG_DIR_NAME
 
+    @property
+    def cache_dir(self) -> Path:
+        return self.state_dir / self.CACHE_DIR_NAME
+
+    @property
+    def active_cache_dir(self) -> Path | None:
+        """None when caching is disabled (`--no-cache`)."""
+        return self.cache_dir if self.use_cache else None
+
+    def changelog_store(self) -> ChangelogStore:
+        """A new store, its queries are memoized so share it for one command."""
+        return ChangelogStore(self.changelog_dir, self.active_cache_dir, self.parse_workers)
+
     @property
     def changelog_md(self) -> Path:
         return self._with_dev_suffix(self.state_dir / self.CHANGELOG_FILENAME)
@@ -175,6 +203,9 @@ def pkg_settings(
     after_file_write_hooks: tuple[str, ...] | None = None,
     keep_prerelease: bool | None = None,
     ignored_symbols: frozenset[str] | None = None,
+    use_cache: bool = True,
+    incremental: bool = False,
+    verify_checkpoint: bool = False,
 ) -> PkgSettings:
     # Resolve global settings with proper precedence: CLI arg → Env var → Config file(user or project) → Default
     user_config = load_user_config()
@@ -201,4 +232,8 @@ def pkg_settings(
         max_bump_type=project_config.get_max_bump(),
         default_branch=project_config.default_branch,
         repo_url=_read_repo_url_safe(repo_root),
+        use_cache=use_cache,
+        incremental=incremental,
+        verify_checkpoint=verify_checkpoint,
+        parse_workers=project_config.parse_workers,
     )
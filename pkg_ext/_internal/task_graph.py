@@ -0,0 +1,64 @@
+"""Run a few dependent, mostly I/O bound phases on threads, each starting as soon as its dependencies finished."""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Task:
+    """`fn` is called with the results of `deps`, in order."""
+
+    name: str
+    fn: Callable[..., Any]
+    deps: tuple[str, ...] = ()
+
+
+def run_task_graph(graph_name: str, tasks: list[Task]) -> dict[str, Any]:
+    """Results by task name. Tasks must be listed after their dependencies.
+
+    The first failing task (in list order) raises, dependents of a failed task fail with the same error.
+    Every task gets its own thread, so waiting on dependencies never starves the pool.
+    """
+    known: set[str] = set()
+    for task in tasks:
+        if missing := [dep for dep in task.deps if dep not in known]:
+            raise ValueError(f"{graph_name}: task {task.name} depends on {missing}, list dependencies first")
+        known.add(task.name)
+    started = time.perf_counter()
+    futures: dict[str, Future[Any]] = {}
+    with ThreadPoolExecutor(max_workers=max(len(tasks), 1), thread_name_prefix=f"pkg-ext-{graph_name}") as pool:
+        for task in tasks:
+            dep_futures = [futures[dep] for dep in task.deps]
+            context = contextvars.copy_context()
+            futures[task.name] = pool.submit(context.run, _run_task, graph_name, task, dep_futures)
+        results = {name: future.result() for name, future in futures.items()}
+    logger.debug(f"{graph_name}: done in {time.perf_counter() - started:.3f}s")
+    return results
+
+
+def _run_task(graph_name: str, task: Task, dep_futures: list[Future[Any]]) -> Any:
+    dep_results = [future.result() for future in dep_futures]
+    started = time.perf_counter()
+    try:
+        return task.fn(*dep_results)
+    finally:
+        logger.debug(f"{graph_name}: {task.name} took {time.perf_counter() - started:.3f}s")
+
+
+def process_pool_context() -> BaseContext | None:
+    """`forkserver` while other threads run, forking a multi threaded process can deadlock the child."""
+    if threading.active_count() > 1 and "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return None
@@ -0,0 +1,37 @@
+import logging
+import threading
+
+import pytest
+
+from pkg_ext._internal.task_graph import Task, run_task_graph
+
+
+def test_independent_tasks_overlap_and_dependents_get_results(caplog):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def independent(value: int) -> int:
+        barrier.wait()  # only returns when both tasks run at the same time
+        return value
+
+    tasks = [
+        Task("a", lambda: independent(1)),
+        Task("b", lambda: independent(2)),
+        Task("sum", lambda a, b: a + b, deps=("a", "b")),
+    ]
+    with caplog.at_level(logging.DEBUG, logger="pkg_ext._internal.task_graph"):
+        results = run_task_graph("test", tasks)
+    assert results == {"a": 1, "b": 2, "sum": 3}
+    assert "test: sum took" in caplog.text
+
+
+def test_failed_dependency_propagates():
+    def fail() -> int:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        run_task_graph("test", [Task("fail", fail), Task("after", lambda x: x, deps=("fail",))])
+
+
+def test_dependencies_must_be_listed_first():
+    with pytest.raises(ValueError, match="list dependencies first"):
+        run_task_graph("test", [Task("after", lambda x: x, deps=("before",)), Task("before", lambda: 1)])
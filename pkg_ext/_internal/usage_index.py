@@ -0,0 +1,121 @@
+"""Persistent reverse usage index: symbol -> importing files and file -> imported symbols.
+
+Stored next to the parse cache and updated only for files whose imports changed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Self
+
+from pkg_ext._internal.disk_cache import ensure_cache_dir, read_json_cache, write_json_cache
+from pkg_ext._internal.file_parser import ParsedFile
+from pkg_ext._internal.models import PkgTestFile, ref_id_name
+
+USAGE_INDEX_FILENAME = "usage_index.json"
+
+
+@dataclass
+class SymbolUsages:
+    symbol: str
+    src_usages: list[str] = field(default_factory=list)
+    test_usages: list[str] = field(default_factory=list)
+
+
+@dataclass
+class UsageIndex:
+    path: Path
+    fingerprint: str
+    file_imports: dict[str, list[str]] = field(default_factory=dict)
+    test_files: set[str] = field(default_factory=set)
+    symbol_files: dict[str, set[str]] = field(default_factory=dict)
+    _changed: bool = False
+
+    @classmethod
+    def load(cls, cache_dir: Path, fingerprint: str) -> Self:
+        path = cache_dir / USAGE_INDEX_FILENAME
+        raw = read_json_cache(path)
+        if not isinstance(raw, dict) or raw.get("fingerprint") != fingerprint:
+            return cls(path=path, fingerprint=fingerprint)
+        return cls(
+            path=path,
+            fingerprint=fingerprint,
+            file_imports=raw["files"],
+            test_files=set(raw["test_files"]),
+            symbol_files={symbol: set(rel_paths) for symbol, rel_paths in raw["symbols"].items()},
+        )
+
+    def _remove_file(self, rel_path: str) -> None:
+        for symbol in self.file_imports.pop(rel_path, []):
+            rel_paths = self.symbol_files.get(symbol)
+            if rel_paths is None:
+                continue
+            rel_paths.discard(rel_path)
+            if not rel_paths:
+                del self.symbol_files[symbol]
+        self.test_files.discard(rel_path)
+
+    def _add_file(self, rel_path: str, imports: list[str], is_test: bool) -> None:
+        self.file_imports[rel_path] = imports
+        if is_test:
+            self.test_files.add(rel_path)
+        for symbol in imports:
+            self.symbol_files.setdefault(symbol, set()).add(rel_path)
+
+    def update(self, parsed_files: Iterable[tuple[str, ParsedFile | None]]) -> int:
+        """Sync with the current parse results, files not included are removed. Returns the number of files updated."""
+        updated = 0
+        seen: set[str] = set()
+        for rel_path, parsed in parsed_files:
+            if parsed is None:
+                continue
+            seen.add(rel_path)
+            imports = sorted(parsed.local_imports)
+            is_test = isinstance(parsed, PkgTestFile)
+            if self.file_imports.get(rel_path) == imports and (rel_path in self.test_files) == is_test:
+                continue
+            self._remove_file(rel_path)
+            self._add_file(rel_path, imports, is_test)
+            updated += 1
+        for rel_path in self.file_imports.keys() - seen:
+            self._remove_file(rel_path)
+            updated += 1
+        if updated:
+            self._changed = True
+        return updated
+
+    def save(self) -> None:
+        if not self._changed:
+            return
+        ensure_cache_dir(self.path.parent)
+        write_json_cache(
+            self.path,
+            {
+                "fingerprint": self.fingerprint,
+                "files": self.file_imports,
+                "test_files": sorted(self.test_files),
+                "symbols": {symbol: sorted(rel_paths) for symbol, rel_paths in self.symbol_files.items()},
+            },
+        )
+        self._changed = False
+
+    def matching_symbols(self, query: str, pkg_import_name: str) -> list[str]:
+        """`query` can be a full id (`my_pkg.mod.func`), a local id (`mod.func`) or a short name (`func`)."""
+        for symbol in (query, f"{pkg_import_name}.{query}"):
+            if symbol in self.symbol_files:
+                return [symbol]
+        return sorted(symbol for symbol in self.symbol_files if ref_id_name(symbol) == query)
+
+    def usages(self, query: str, pkg_import_name: str) -> list[SymbolUsages]:
+        results = []
+        for symbol in self.matching_symbols(query, pkg_import_name):
+            rel_paths = sorted(self.symbol_files[symbol])
+            results.append(
+                SymbolUsages(
+                    symbol=symbol,
+                    src_usages=[rel_path for rel_path in rel_paths if rel_path not in self.test_files],
+                    test_usages=[rel_path for rel_path in rel_paths if rel_path in self.test_files],
+                )
+            )
+        return results
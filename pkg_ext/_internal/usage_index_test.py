@@ -0,0 +1,43 @@
+from pkg_ext._internal.cli.workflows import find_symbol_usages
+from pkg_ext._internal.disk_cache import read_json_cache
+from pkg_ext._internal.settings import PkgSettings
+from pkg_ext._internal.usage_index import USAGE_INDEX_FILENAME, SymbolUsages
+
+
+def _write(settings: PkgSettings, rel_path: str, content: str) -> None:
+    path = settings.pkg_directory / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def test_find_symbol_usages(settings: PkgSettings):
+    _write(settings, "core.py", "def helper(): ...\n")
+    _write(settings, "api.py", "from my_pkg.core import helper\n\ndef public(): ...\n")
+    _write(settings, "api_test.py", "from my_pkg.core import helper\nfrom my_pkg.api import public\n")
+    expected = [SymbolUsages(symbol="my_pkg.core.helper", src_usages=["api.py"], test_usages=["api_test.py"])]
+    assert find_symbol_usages(settings, "helper") == expected
+    assert find_symbol_usages(settings, "core.helper") == expected
+    assert find_symbol_usages(settings, "my_pkg.core.helper") == expected
+    assert find_symbol_usages(settings, "unknown") == []
+
+
+def test_usage_index_updates_changed_and_removed_files(settings: PkgSettings):
+    _write(settings, "core.py", "def helper(): ...\ndef other(): ...\n")
+    _write(settings, "api.py", "from my_pkg.core import helper\n")
+    _write(settings, "cli.py", "from my_pkg.core import helper\n")
+    assert find_symbol_usages(settings, "helper")[0].src_usages == ["api.py", "cli.py"]
+
+    _write(settings, "api.py", "from my_pkg.core import other\n")
+    (settings.pkg_directory / "cli.py").unlink()
+    assert find_symbol_usages(settings, "helper") == []
+    assert find_symbol_usages(settings, "other")[0].src_usages == ["api.py"]
+    stored = read_json_cache(settings.cache_dir / USAGE_INDEX_FILENAME)
+    assert stored["symbols"] == {"my_pkg.core.other": ["api.py"]}
+    assert set(stored["files"]) == {"core.py", "api.py"}
+
+
+def test_short_name_can_match_multiple_symbols(settings: PkgSettings):
+    _write(settings, "a.py", "def run(): ...\n")
+    _write(settings, "b.py", "def run(): ...\n")
+    _write(settings, "c.py", "from my_pkg.a import run\nfrom my_pkg.b import run as run_b\n")
+    assert [usage.symbol for usage in find_symbol_usages(settings, "run")] == ["my_pkg.a.run", "my_pkg.b.run"]
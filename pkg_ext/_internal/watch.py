@@ -0,0 +1,244 @@
+"""Watch mode: keep the package state warm and re-derive generated files on save.
+
+Uses `watchfiles` (inotify/FSEvents) when it is installed and falls back to polling mtimes.
+The state is built once, a cycle re-parses only the saved source files and replays the changelog only when a
+changelog or groups file changed. It then rewrites the modules and docs of the groups owning the changed modules or
+importing them (directly or through other modules).
+
+Watching pkg-ext itself: its modules can't be re-imported while it runs, so the api dump behind the docs keeps the
+code from the start of the session. The generated modules come from the parsed source and stay current.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from pkg_ext._internal.changelog.parser import parse_changelog
+from pkg_ext._internal.cli.workflows import create_stability_ctx, reparse_pkg_code_state, write_generated_modules
+from pkg_ext._internal.context import pkg_ctx
+from pkg_ext._internal.models import PublicGroups, as_module_path
+from pkg_ext._internal.settings import PkgSettings
+from pkg_ext._internal.version_bump import read_current_version
+
+logger = logging.getLogger(__name__)
+DEFAULT_DEBOUNCE_SECONDS = 0.3
+DEFAULT_POLL_INTERVAL_SECONDS = 0.5
+_WATCHED_SUFFIXES = (".py", ".yaml")
+_SELF_PKG = __name__.split(".")[0]
+
+
+def _is_watched_file(path: Path) -> bool:
+    return path.suffix in _WATCHED_SUFFIXES and "__pycache__" not in path.parts
+
+
+def _scan_mtimes(roots: Iterable[Path]) -> dict[Path, int]:
+    mtimes: dict[Path, int] = {}
+    for root in roots:
+        if root.is_file():
+            mtimes[root] = root.stat().st_mtime_ns
+            continue
+        if not root.is_dir():
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [name for name in dirnames if name != "__pycache__" and not name.startswith(".")]
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                if _is_watched_file(path):
+                    try:
+                        mtimes[path] = path.stat().st_mtime_ns
+                    except FileNotFoundError:
+                        continue
+    return mtimes
+
+
+def _mtime_changes(old: dict[Path, int], new: dict[Path, int]) -> set[Path]:
+    return {path for path in old.keys() | new.keys() if old.get(path) != new.get(path)}
+
+
+def poll_changes(
+    roots: list[Path],
+    debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+    poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Iterator[set[Path]]:
+    """Yields batches of changed paths, a batch is only yielded after `debounce_seconds` without new changes."""
+    current = _scan_mtimes(roots)
+    while True:
+        sleep(poll_interval_seconds)
+        latest = _scan_mtimes(roots)
+        changed = _mtime_changes(current, latest)
+        if not changed:
+            continue
+        while True:
+            sleep(debounce_seconds)
+            settled = _scan_mtimes(roots)
+            if not (more := _mtime_changes(latest, settled)):
+                break
+            changed |= more
+            latest = settled
+        current = latest
+        yield changed
+
+
+def watch_changes(
+    roots: list[Path],
+    debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+    force_polling: bool = False,
+) -> Iterator[set[Path]]:
+    if not force_polling:
+        try:
+            import watchfiles
+        except ImportError:
+            logger.info("watchfiles not installed, falling back to polling")
+        else:
+            logger.info("watching with native file events")
+            existing = [str(root) for root in roots if root.exists()]
+            for changes in watchfiles.watch(*existing, debounce=int(debounce_seconds * 1000)):
+                if batch := {Path(path) for _, path in changes if _is_watched_file(Path(path))}:
+                    yield batch
+            return
+    yield from poll_changes(roots, debounce_seconds)
+
+
+def _content_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else ""
+
+
+@dataclass
+class WatchSession:
+    settings: PkgSettings
+    skip_docs: bool = False
+    _written_hashes: dict[Path, str] = field(default_factory=dict, init=False)
+    _ctx: pkg_ctx | None = field(default=None, init=False, repr=False)
+
+    @property
+    def roots(self) -> list[Path]:
+        settings = self.settings
+        return [settings.pkg_directory, settings.changelog_dir, self.groups_yaml_path]
+
+    @property
+    def groups_yaml_path(self) -> Path:
+        return self.settings.state_dir / PkgSettings.PUBLIC_GROUPS_STORAGE_FILENAME
+
+    def generated_paths(self, groups: PublicGroups) -> set[Path]:
+        settings = self.settings
+        paths = {settings.init_path, settings.warnings_file_path, self.groups_yaml_path, settings.public_groups_path}
+        paths.update(settings.group_module_path(group.name) for group in groups.groups_no_root)
+        return paths
+
+    def relevant_changes(self, changed: set[Path]) -> set[Path]:
+        """Drops our own writes, a generated file only counts if its content differs from what we wrote."""
+        return {path for path in changed if self._written_hashes.get(path) != _content_hash(path)}
+
+    def update_ctx(self, changed: set[Path] | None = None) -> pkg_ctx:
+        """Full build on the first cycle, afterwards only the changed files and changelog are applied."""
+        settings = self.settings
+        if changed is None or self._ctx is None:
+            self._ctx = create_stability_ctx(settings)
+            return self._ctx
+        ctx = self._ctx
+        pkg_dir = settings.pkg_directory
+        if code_changes := {path for path in changed if path.suffix == ".py" and path.is_relative_to(pkg_dir)}:
+            ctx.code_state = reparse_pkg_code_state(settings, ctx.code_state, code_changes)
+        if changed - code_changes:  # an edited file can change any earlier action, the action cache keeps it cheap
+            ctx.changelog_store = settings.changelog_store()
+            ctx.tool_state, _ = parse_changelog(settings, ctx.code_state, ctx.changelog_store)
+        ctx.tool_state.reconcile_with_code(ctx.code_state.import_id_refs)
+        return ctx
+
+    def dirty_groups(self, ctx: pkg_ctx, changed: set[Path]) -> set[str] | None:
+        """Groups owning a changed module or a module importing it, None when all groups must be regenerated.
+
+        An edited helper or base class changes the dumped signatures and fields of the public symbols using it.
+        """
+        pkg_dir = self.settings.pkg_directory
+        files = {file.relative_path: file for file in ctx.code_state.files}
+        affected: set[str] = set()
+        for path in changed:
+            if not path.is_relative_to(pkg_dir):
+                return None  # changelog or .groups.yaml change can affect any group
+            if (rel_path := str(path.relative_to(pkg_dir))) not in files:
+                return None  # deleted module, added ones are already in the reparsed code state
+            affected.add(rel_path)
+        dependents: dict[str, set[str]] = {}
+        for file in files.values():
+            for dependency in file.dependencies:
+                dependents.setdefault(dependency.relative_path, set()).add(file.relative_path)
+        todo = list(affected)
+        while todo:
+            for dependent in dependents.get(todo.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    todo.append(dependent)
+        modules = {as_module_path(rel_path) for rel_path in affected}
+        return {group.name for group in ctx.tool_state.groups.groups if group.owned_modules & modules}
+
+    def run_cycle(self, changed: set[Path] | None = None) -> set[str] | None:
+        """Returns the names of the regenerated groups (None means all)."""
+        from pkg_ext._internal.cli.workflow_cmds import generate_docs_for_pkg  # avoid circular import
+
+        settings = self.settings
+        start = time.perf_counter()
+        _drop_pkg_modules(settings.pkg_import_name)
+        ctx = self.update_ctx(changed)
+        state_done = time.perf_counter()
+        dirty = None if changed is None else self.dirty_groups(ctx, changed)
+        if dirty is not None and not dirty:
+            logger.info(f"watch cycle: no public groups affected ({_ms(start)} ms)")
+            return dirty
+        version = str(read_current_version(ctx))
+        write_generated_modules(ctx, version, dirty)
+        modules_done = time.perf_counter()
+        docs_count = 0
+        if not self.skip_docs:
+            docs_count = generate_docs_for_pkg(settings, filter_groups=dirty, stability_ctx=ctx)
+        self._written_hashes = {path: _content_hash(path) for path in self.generated_paths(ctx.tool_state.groups)}
+        scope = "all groups" if dirty is None else ", ".join(sorted(dirty))
+        logger.info(
+            f"watch cycle ({scope}): state {_ms(start, state_done)} ms, modules {_ms(state_done, modules_done)} ms, "
+            f"docs {_ms(modules_done)} ms ({docs_count} files), total {_ms(start)} ms"
+        )
+        return dirty
+
+    def run(
+        self,
+        changes: Iterable[set[Path]],
+        max_cycles: int | None = None,
+    ) -> int:
+        if self.settings.pkg_import_name == _SELF_PKG:
+            logger.warning(f"watching {_SELF_PKG} itself, restart watch to see source edits in the docs")
+        self.run_cycle()
+        cycles = 0
+        for changed in changes:
+            if not (relevant := self.relevant_changes(changed)):
+                continue
+            names = ", ".join(sorted(str(path.relative_to(self.settings.state_dir)) for path in relevant))
+            logger.info(f"changed: {names}")
+            try:
+                self.run_cycle(relevant)
+            except Exception:  # keep watching, the next save usually fixes it
+                logger.exception("watch cycle failed")
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+        return cycles
+
+
+def _drop_pkg_modules(pkg_import_name: str) -> None:
+    """Forget imported package modules so the api dump sees the saved code."""
+    if pkg_import_name == _SELF_PKG:
+        return  # never drop our own modules while running
+    prefix = f"{pkg_import_name}."
+    for name in [name for name in sys.modules if name == pkg_import_name or name.startswith(prefix)]:
+        del sys.modules[name]
+
+
+def _ms(start: float, end: float | None = None) -> int:
+    return int(((end or time.perf_counter()) - start) * 1000)
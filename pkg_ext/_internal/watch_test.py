@@ -0,0 +1,108 @@
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+from pkg_ext._internal.cli.workflows import parse_pkg_code_state, reparse_pkg_code_state
+from pkg_ext._internal.models import PublicGroup, PublicGroups
+from pkg_ext._internal.settings import PkgSettings
+from pkg_ext._internal.watch import WatchSession, _content_hash, poll_changes
+
+
+def _touch(path: Path, content: str, mtime_ns: int) -> None:
+    path.write_text(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_poll_changes_debounces_rapid_saves(tmp_path: Path):
+    a, b = tmp_path / "a.py", tmp_path / "b.py"
+    _touch(a, "a = 1", 1_000)
+    _touch(b, "b = 1", 1_000)
+    saves = iter(
+        [
+            lambda: _touch(a, "a = 2", 2_000),  # first poll sees a change
+            lambda: _touch(b, "b = 2", 2_000),  # saved within the debounce window
+            lambda: None,  # quiet, the batch is yielded
+        ]
+    )
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        next(saves)()
+
+    changes = poll_changes([tmp_path], debounce_seconds=0.1, poll_interval_seconds=1, sleep=fake_sleep)
+    assert next(changes) == {a, b}
+    assert sleeps == [1, 0.1, 0.1]
+
+
+def test_relevant_changes_ignores_own_writes(settings: PkgSettings):
+    session = WatchSession(settings)
+    generated = settings.init_path
+    generated.parent.mkdir(parents=True, exist_ok=True)
+    generated.write_text("# generated")
+    session._written_hashes = {generated: _content_hash(generated)}
+    src = settings.pkg_directory / "core.py"
+    src.write_text("def f(): ...")
+    assert session.relevant_changes({generated, src}) == {src}
+    generated.write_text("# edited by hand")
+    assert session.relevant_changes({generated}) == {generated}
+
+
+def _write_modules(settings: PkgSettings) -> None:
+    pkg_dir = settings.pkg_directory
+    (pkg_dir / "sub").mkdir()
+    (pkg_dir / "_base.py").write_text("class Base: ...\n")
+    (pkg_dir / "core.py").write_text("from my_pkg._base import Base\n\nclass Core(Base): ...\n")
+    (pkg_dir / "sub/extra.py").write_text("def extra(): ...\n")
+    (pkg_dir / "other.py").write_text("def other(): ...\n")
+
+
+def test_dirty_groups_follow_imports(settings: PkgSettings):
+    _write_modules(settings)
+    groups = PublicGroups(
+        groups=[
+            PublicGroup(name=PublicGroup.ROOT_GROUP_NAME),
+            PublicGroup(name="core", owned_modules={"core"}),
+            PublicGroup(name="extra", owned_modules={"sub.extra"}),
+        ]
+    )
+    ctx = SimpleNamespace(tool_state=SimpleNamespace(groups=groups), code_state=parse_pkg_code_state(settings))
+    session = WatchSession(settings)
+    pkg_dir = settings.pkg_directory
+    assert session.dirty_groups(ctx, {pkg_dir / "core.py"}) == {"core"}  # type: ignore[arg-type]
+    assert session.dirty_groups(ctx, {pkg_dir / "sub/extra.py", pkg_dir / "other.py"}) == {"extra"}  # type: ignore[arg-type]
+    assert session.dirty_groups(ctx, {pkg_dir / "_base.py"}) == {"core"}  # type: ignore[arg-type]
+    assert session.dirty_groups(ctx, {pkg_dir / "other.py"}) == set()  # type: ignore[arg-type]
+    assert session.dirty_groups(ctx, {pkg_dir / "new.py"}) is None  # type: ignore[arg-type]
+    assert session.dirty_groups(ctx, {settings.changelog_dir / "1.yaml"}) is None  # type: ignore[arg-type]
+
+
+def test_reparse_pkg_code_state_matches_full_parse(settings: PkgSettings):
+    _write_modules(settings)
+    pkg_dir = settings.pkg_directory
+    code_state = parse_pkg_code_state(settings)
+    (pkg_dir / "_base.py").write_text("class Base: ...\n\ndef helper(): ...\n")
+    (pkg_dir / "other.py").write_text("from my_pkg._base import helper\n")
+    (pkg_dir / "sub/extra.py").unlink()
+    (pkg_dir / "added.py").write_text("def added(): ...\n")
+    changed = {pkg_dir / name for name in ["_base.py", "other.py", "sub/extra.py", "added.py"]}
+    updated = reparse_pkg_code_state(settings, code_state, changed)
+    full = parse_pkg_code_state(settings)
+    assert updated.import_id_refs == full.import_id_refs
+    assert updated.import_id_refs["my_pkg._base.helper"].src_usages == ["other.py"]
+    assert [file.relative_path for file in updated.files] == [file.relative_path for file in full.files]
+
+
+def test_dirty_groups_added_module(settings: PkgSettings):
+    _write_modules(settings)
+    pkg_dir = settings.pkg_directory
+    groups = PublicGroups(groups=[PublicGroup(name="core", owned_modules={"core", "added"})])
+    code_state = parse_pkg_code_state(settings)
+    (pkg_dir / "added.py").write_text("def added(): ...\n")
+    code_state = reparse_pkg_code_state(settings, code_state, {pkg_dir / "added.py"})
+    ctx = SimpleNamespace(tool_state=SimpleNamespace(groups=groups), code_state=code_state)
+    session = WatchSession(settings)
+    assert session.dirty_groups(ctx, {pkg_dir / "added.py"}) == {"core"}  # type: ignore[arg-type]
+    (pkg_dir / "unowned.py").write_text("def unowned(): ...\n")
+    ctx.code_state = reparse_pkg_code_state(settings, code_state, {pkg_dir / "unowned.py"})
+    assert session.dirty_groups(ctx, {pkg_dir / "unowned.py"}) == set()  # type: ignore[arg-type]